@@ -18,10 +18,16 @@ Features:
 __version__ = "1.0.0"
 __author__ = "PLCForge Team"
 
-from plcforge.pal.unified_api import DeviceFactory, UnifiedPLC, connect
-
 __all__ = [
     'connect',
     'DeviceFactory',
     'UnifiedPLC',
 ]
+
+
+def __getattr__(name: str):
+    """Load PAL exports on first access so importing a subpackage stays cheap"""
+    if name in __all__:
+        from plcforge.pal import unified_api
+        return getattr(unified_api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
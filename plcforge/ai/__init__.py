@@ -5,5 +5,6 @@ AI-powered code generation using LLMs.
 """
 
 from plcforge.ai.code_generator import AICodeGenerator, CodeTarget, GeneratedCode
+from plcforge.ai.response_cache import ResponseCache, get_response_cache
 
-__all__ = ['AICodeGenerator', 'CodeTarget', 'GeneratedCode']
+__all__ = ['AICodeGenerator', 'CodeTarget', 'GeneratedCode', 'ResponseCache', 'get_response_cache']
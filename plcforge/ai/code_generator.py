@@ -5,12 +5,89 @@ Uses LLMs to generate PLC code from natural language descriptions.
 Supports multiple output languages and vendors.
 """
 
+import asyncio
+import functools
+import json
+import re
+import string
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Literal
 
+from plcforge.ai.response_cache import CachedResponse, ResponseCache, get_response_cache
 from plcforge.drivers.base import CodeLanguage
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# HTTP/2 multiplexing needs the optional h2 package; plain keep-alive otherwise
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Connection pool settings for LLM provider clients
+_HTTP_LIMITS_KWARGS = {'max_keepalive_connections': 32, 'keepalive_expiry': 300.0}
+_HTTP_TIMEOUT = 600.0  # Long generations can take minutes
+_HTTP_CONNECT_TIMEOUT = 5.0
+
+# Schema for structured (JSON) code generation output
+_CODE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "explanation": {"type": "string"},
+        "code": {"type": "string"},
+        "notes": {"type": "string"},
+    },
+    "required": ["explanation", "code", "notes"],
+    "additionalProperties": False,
+}
+
+_OPENAI_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "plc_code", "schema": _CODE_SCHEMA, "strict": True},
+}
+
+_ANTHROPIC_CODE_TOOL = {
+    "name": "emit_code",
+    "description": "Return the generated PLC code with its explanation and safety notes",
+    "input_schema": _CODE_SCHEMA,
+}
+
+# Estimated prompt size (tokens) below which the small model is used
+_SMALL_MODEL_TOKEN_LIMIT = 400
+
+# Completion budget reserved for every request
+_MAX_OUTPUT_TOKENS = 4096
+
+# Rough characters per token when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+# Response parsing / safety analysis patterns
+_FENCED_CODE_RE = re.compile(r'```(?:\w+)?\n(.*?)```', re.DOTALL)
+_FENCE_RE = re.compile(r'```')
+_INDENTED_BLOCK_RE = re.compile(
+    r'^(?:[ ]{4}|\t)[^\n]*(?:\n(?:[ ]{4}|\t|[ \t\r]*$)[^\n]*)*',
+    re.MULTILINE
+)
+_ESTOP_KEYWORDS = ('estop', 'e_stop', 'emergency', 'emergencystop', 'nothalt')
+
+# All safety keywords and timer literals, matched in a single pass over the code
+_SAFETY_SCAN_RE = re.compile(
+    r'(?P<estop>' + '|'.join(_ESTOP_KEYWORDS) + r')'
+    r'|(?P<loop>while true)'
+    r'|(?P<exit>exit)'
+    r'|(?P<var>var)'
+    r'|(?P<assign>:=)'
+    r'|t#(?P<timer>\d+)(?P<unit>ms|s|m)'
+)
+
 
 class Vendor(Enum):
     """Supported vendors for code generation"""
@@ -50,6 +127,126 @@ class GeneratedCode:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+# Vendor-agnostic instructions shared by every request
+_STATIC_PREAMBLE = """You are an expert industrial PLC programmer. Write safe, efficient code that:
+- Complies with IEC 61131-3 where applicable
+- Follows industrial safety standards (IEC 62443, machinery safety)
+- Includes proper initialization and emergency stop handling where appropriate
+- Uses meaningful names and comments explaining the logic
+- Handles edge cases and error conditions
+
+Output: a brief explanation of your approach, then the complete code in one \
+fenced code block, then any safety considerations.
+"""
+
+# Full system prompt: static preamble followed by the target-specific part
+_SYSTEM_PROMPT_TEMPLATE = string.Template(_STATIC_PREAMBLE.replace('$', '$$') + """
+Target: $vendor_name $model, $language_name
+
+$vendor_name guidelines:
+$specific_guidelines
+
+$language_name notes:
+$syntax_notes
+""")
+
+# Vendor-specific prompt information
+_VENDOR_INFO: Mapping[Vendor, Mapping[str, str]] = MappingProxyType({
+    Vendor.SIEMENS: MappingProxyType({
+        'name': 'Siemens',
+        'specific_guidelines': """\
+- DB for structured data, FB for logic with instance data, FC for stateless operations
+- TIA Portal naming (e.g. "Motor_1", "Conveyor_Start"), symbolic addressing
+- OB1 for main cycle, OB100 for startup""",
+    }),
+    Vendor.ALLEN_BRADLEY: MappingProxyType({
+        'name': 'Allen-Bradley',
+        'specific_guidelines': """\
+- AOIs for reusable logic, UDTs for structured data
+- Studio 5000 naming (CamelCase), proper task organization
+- Program- vs controller-scoped tags as appropriate""",
+    }),
+    Vendor.DELTA: MappingProxyType({
+        'name': 'Delta',
+        'specific_guidelines': """\
+- D registers for data (D0-D9999), M relays for flags (M0-M4095)
+- ISPSoft conventions, DVP timer/counter ranges
+- X inputs and Y outputs use octal addressing""",
+    }),
+    Vendor.OMRON: MappingProxyType({
+        'name': 'Omron',
+        'specific_guidelines': """\
+- DM for data, W area for internal flags (CIO, W, H, D designations)
+- CX-Programmer or Sysmac conventions
+- Function blocks for reusable code""",
+    }),
+    Vendor.GENERIC: MappingProxyType({
+        'name': 'Generic IEC 61131-3',
+        'specific_guidelines': """\
+- Standard data types (BOOL, INT, DINT, REAL, etc.)
+- Proper POU usage and variable scoping
+- Standard function block conventions""",
+    }),
+})
+
+# Language-specific prompt information
+_LANGUAGE_INFO: Mapping[CodeLanguage, Mapping[str, str]] = MappingProxyType({
+    CodeLanguage.STRUCTURED_TEXT: MappingProxyType({
+        'name': 'Structured Text (ST)',
+        'syntax_notes': """\
+- := for assignment; END_IF/END_FOR/END_WHILE terminators
+- (* *) or // comments; operators AND, OR, NOT, XOR""",
+    }),
+    CodeLanguage.LADDER: MappingProxyType({
+        'name': 'Ladder Diagram (LAD)',
+        'syntax_notes': """\
+- Pseudo-ladder or XML representation with rung comments
+- Standard contact/coil notation; clear parallel and series connections""",
+    }),
+    CodeLanguage.FUNCTION_BLOCK: MappingProxyType({
+        'name': 'Function Block Diagram (FBD)',
+        'syntax_notes': """\
+- Describe block connections and input/output mappings
+- Standard function block types""",
+    }),
+    CodeLanguage.INSTRUCTION_LIST: MappingProxyType({
+        'name': 'Instruction List (IL)',
+        'syntax_notes': """\
+- Standard mnemonics (LD, ST, AND, OR, etc.), one instruction per line
+- Labels end with colon; CAL for function calls""",
+    }),
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Get (and cache) the tiktoken encoding for a model"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Non-OpenAI models: cl100k_base is a close enough approximation
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class _FenceWatcher:
+    """Detects the end of the first fenced code block in a token stream"""
+
+    def __init__(self):
+        self._fences = 0
+        self._tail = ''  # Partial fence carried over from the previous delta
+
+    def feed(self, delta: str) -> bool:
+        """Feed streamed text; returns True once the closing fence was seen"""
+        window = self._tail + delta
+        self._fences += window.count('```')
+
+        last = window.rfind('```')
+        rest = window[last + 3:] if last >= 0 else window
+        self._tail = rest[-2:]
+
+        return self._fences >= 2
+
+
 class AICodeGenerator:
     """
     AI-powered PLC code generator.
@@ -58,16 +255,41 @@ class AICodeGenerator:
     vendor-specific PLC code from natural language descriptions.
     """
 
+    # HTTP connection pool shared by all instances (see _shared_http_client)
+    _http_client = None
+
     def __init__(
         self,
         provider: Literal["openai", "anthropic"] = "openai",
         api_key: str | None = None,
-        model: str | None = None
+        model: str | None = None,
+        cache: ResponseCache | None = None,
+        use_cache: bool = True,
+        small_model: str | None = None,
+        structured_output: bool = False,
+        max_context_tokens: int = 128000
     ):
         self.provider = provider
         self.api_key = api_key
         self.model = model or self._default_model()
+        # Short prompts are routed to the small model; an explicitly chosen
+        # model disables routing unless a small model is given as well
+        self.small_model = small_model or (None if model else self._default_small_model())
+        # JSON schema output (OpenAI) / forced tool call (Anthropic); needs a
+        # model with structured output support, e.g. gpt-4o or Claude 3
+        self.structured_output = structured_output
+        # Input + output token limit; oversized context is trimmed locally
+        self.max_context_tokens = max_context_tokens
         self._client = None
+        self._async_client = None
+
+        # Responses are shared across generator instances unless a cache is given
+        if cache is not None:
+            self._cache: ResponseCache | None = cache
+        elif use_cache:
+            self._cache = get_response_cache()
+        else:
+            self._cache = None
 
     def _default_model(self) -> str:
         """Get default model for provider"""
@@ -77,6 +299,48 @@ class AICodeGenerator:
             return "claude-3-opus-20240229"
         return "gpt-4"
 
+    def _default_small_model(self) -> str | None:
+        """Get default small (fast, cheap) model for provider"""
+        if self.provider == "openai":
+            return "gpt-4o-mini"
+        elif self.provider == "anthropic":
+            return "claude-3-haiku-20240307"
+        return None
+
+    @classmethod
+    def _shared_http_client(cls):
+        """
+        Get HTTP client shared by all generator instances.
+
+        Keeps TLS connections to the provider alive between requests so
+        follow-up generations skip the handshake. Returns None (SDK default
+        client) if httpx is unavailable.
+        """
+        if cls._http_client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            cls._http_client = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(**_HTTP_LIMITS_KWARGS),
+                timeout=httpx.Timeout(_HTTP_TIMEOUT, connect=_HTTP_CONNECT_TIMEOUT),
+            )
+        return cls._http_client
+
+    @staticmethod
+    def _new_async_http_client():
+        """Create async HTTP client (bound to the running event loop)"""
+        try:
+            import httpx
+        except ImportError:
+            return None
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(**_HTTP_LIMITS_KWARGS),
+            timeout=httpx.Timeout(_HTTP_TIMEOUT, connect=_HTTP_CONNECT_TIMEOUT),
+        )
+
     def _get_client(self):
         """Get or create API client"""
         if self._client:
@@ -85,25 +349,55 @@ class AICodeGenerator:
         if self.provider == "openai":
             try:
                 from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
+                self._client = OpenAI(
+                    api_key=self.api_key, http_client=self._shared_http_client()
+                )
             except ImportError:
                 raise ImportError("openai package not installed")
 
         elif self.provider == "anthropic":
             try:
                 from anthropic import Anthropic
-                self._client = Anthropic(api_key=self.api_key)
+                self._client = Anthropic(
+                    api_key=self.api_key, http_client=self._shared_http_client()
+                )
             except ImportError:
                 raise ImportError("anthropic package not installed")
 
         return self._client
 
+    def _get_async_client(self):
+        """Get or create async API client (used for concurrent requests)"""
+        if self._async_client:
+            return self._async_client
+
+        if self.provider == "openai":
+            try:
+                from openai import AsyncOpenAI
+                self._async_client = AsyncOpenAI(
+                    api_key=self.api_key, http_client=self._new_async_http_client()
+                )
+            except ImportError:
+                raise ImportError("openai package not installed")
+
+        elif self.provider == "anthropic":
+            try:
+                from anthropic import AsyncAnthropic
+                self._async_client = AsyncAnthropic(
+                    api_key=self.api_key, http_client=self._new_async_http_client()
+                )
+            except ImportError:
+                raise ImportError("anthropic package not installed")
+
+        return self._async_client
+
     def generate(
         self,
         prompt: str,
         target: CodeTarget,
         context: str | None = None,
-        safety_check: bool = True
+        safety_check: bool = True,
+        on_token: Callable[[str], None] | None = None
     ) -> GeneratedCode:
         """
         Generate PLC code from natural language description.
@@ -113,29 +407,288 @@ class AICodeGenerator:
             target: Target vendor/model/language configuration
             context: Additional context (existing code, requirements)
             safety_check: Whether to run safety analysis
+            on_token: Optional callback receiving streamed response text
 
         Returns:
             GeneratedCode with generated code and metadata
         """
-        # Build system prompt
+        # Build prompts, trimming context to fit the token budget
+        system_prompt, user_prompt, input_tokens = self._prepare_prompts(prompt, target, context)
+
+        # Check response cache before calling the LLM
+        model = self._select_model(prompt, target, context)
+        cached_model, cached = self._cache_lookup(system_prompt, user_prompt, model)
+        if cached is not None:
+            return self._build_result(
+                prompt, target, cached.code, cached.explanation, safety_check,
+                cached_model, input_tokens, cached=True
+            )
+
+        # Call LLM, escalating to the large model if the small one falls short.
+        # Small-model tokens are held back until its response is accepted, so
+        # a rejected attempt never reaches the stream.
+        small_tokens: list[str] = []
+        stream = small_tokens.append if on_token and model != self.model else on_token
+        response = self._call_llm(system_prompt, user_prompt, model, stream)
+        if model != self.model and self._needs_escalation(response, target):
+            model = self.model
+            response = self._call_llm(system_prompt, user_prompt, model, on_token)
+        else:
+            for token in small_tokens:
+                on_token(token)
+
+        code, explanation = self._parse_response(
+            response, self._cache_key(model, system_prompt, user_prompt)
+        )
+        return self._build_result(
+            prompt, target, code, explanation, safety_check, model, input_tokens
+        )
+
+    def generate_many(
+        self,
+        requests: list[tuple[str, CodeTarget]],
+        context: str | None = None,
+        safety_check: bool = True,
+        max_concurrency: int = 16
+    ) -> list[GeneratedCode | Exception]:
+        """
+        Generate code for several prompts concurrently.
+
+        Synchronous wrapper around agenerate_many(); must not be called
+        from inside a running event loop.
+
+        Args:
+            requests: List of (prompt, target) pairs
+            context: Additional context shared by all prompts
+            safety_check: Whether to run safety analysis
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            Results in request order; failed requests yield the raised exception
+        """
+        async def run_batch() -> list[GeneratedCode | Exception]:
+            try:
+                return await self.agenerate_many(
+                    requests, context, safety_check, max_concurrency
+                )
+            finally:
+                # Async connections are bound to this event loop; close them with it
+                if self._async_client is not None:
+                    await self._async_client.close()
+                    self._async_client = None
+
+        return asyncio.run(run_batch())
+
+    async def agenerate_many(
+        self,
+        requests: list[tuple[str, CodeTarget]],
+        context: str | None = None,
+        safety_check: bool = True,
+        max_concurrency: int = 16
+    ) -> list[GeneratedCode | Exception]:
+        """
+        Async variant of generate_many().
+
+        Requests are issued concurrently through the provider's async SDK,
+        so total wall time tracks the slowest request instead of the sum.
+        """
+        if self.provider not in ("openai", "anthropic"):
+            raise ValueError(f"Unknown provider: {self.provider}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(prompt: str, target: CodeTarget) -> GeneratedCode:
+            system_prompt, user_prompt, input_tokens = self._prepare_prompts(
+                prompt, target, context
+            )
+
+            model = self._select_model(prompt, target, context)
+            cached_model, cached = self._cache_lookup(system_prompt, user_prompt, model)
+            if cached is not None:
+                return self._build_result(
+                    prompt, target, cached.code, cached.explanation, safety_check,
+                    cached_model, input_tokens, cached=True
+                )
+
+            async with semaphore:
+                response = await self._acall_llm(system_prompt, user_prompt, model)
+                if model != self.model and self._needs_escalation(response, target):
+                    model = self.model
+                    response = await self._acall_llm(system_prompt, user_prompt, model)
+
+            code, explanation = self._parse_response(
+                response, self._cache_key(model, system_prompt, user_prompt)
+            )
+            return self._build_result(
+                prompt, target, code, explanation, safety_check, model, input_tokens
+            )
+
+        return await asyncio.gather(
+            *(run(prompt, target) for prompt, target in requests),
+            return_exceptions=True
+        )
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with tiktoken, or estimate from length without it"""
+        if TIKTOKEN_AVAILABLE:
+            return len(_get_encoding(self.model).encode(text))
+        return len(text) // _CHARS_PER_TOKEN
+
+    def _drop_head_tokens(self, text: str, count: int) -> str:
+        """Remove roughly count tokens from the start of text"""
+        if TIKTOKEN_AVAILABLE:
+            encoding = _get_encoding(self.model)
+            return encoding.decode(encoding.encode(text)[count:])
+        return text[count * _CHARS_PER_TOKEN:]
+
+    def _prepare_prompts(
+        self,
+        prompt: str,
+        target: CodeTarget,
+        context: str | None
+    ) -> tuple[str, str, int]:
+        """
+        Build system and user prompts that fit max_context_tokens.
+
+        Oldest context (from the head) is dropped until the prompts plus the
+        completion budget fit. Raises ValueError if the prompt does not fit
+        even without context, before any API call is made.
+
+        Returns:
+            (system_prompt, user_prompt, input_tokens)
+        """
         system_prompt = self._build_system_prompt(target)
+        budget = self.max_context_tokens - _MAX_OUTPUT_TOKENS
+
+        while True:
+            user_prompt = self._build_user_prompt(prompt, target, context)
+            input_tokens = self._count_tokens(system_prompt) + self._count_tokens(user_prompt)
+            excess = input_tokens - budget
+            if excess <= 0:
+                return system_prompt, user_prompt, input_tokens
+
+            if not context:
+                raise ValueError(
+                    f"Prompt needs {input_tokens} tokens, limit is {budget} "
+                    f"({self.max_context_tokens} minus {_MAX_OUTPUT_TOKENS} for the response)"
+                )
+
+            # Drop the excess plus 10% of the context so the loop converges quickly
+            context = self._drop_head_tokens(
+                context, excess + self._count_tokens(context) // 10
+            ) or None
+
+    def _select_model(self, prompt: str, target: CodeTarget, context: str | None) -> str:
+        """Pick the small model for short, self-contained prompts"""
+        if not self.small_model or context:
+            return self.model
+
+        # Ladder output needs a textual rung representation; keep it on the large model
+        if target.language == CodeLanguage.LADDER:
+            return self.model
+
+        if self._count_tokens(prompt) >= _SMALL_MODEL_TOKEN_LIMIT:
+            return self.model
+
+        return self.small_model
+
+    def _needs_escalation(self, response: str, target: CodeTarget) -> bool:
+        """Check whether a small-model response should be retried on the large model"""
+        if self.structured_output:
+            parsed = self._parse_structured(response)
+            if parsed is None or not parsed[0]:
+                return True
+            code = parsed[0]
+        elif _FENCED_CODE_RE.search(response):
+            code = self._extract_code(response)
+        else:
+            return True
 
-        # Build user prompt
-        user_prompt = self._build_user_prompt(prompt, target, context)
+        return any(issue.severity == "critical" for issue in self._analyze_safety(code, target))
 
-        # Call LLM
+    def _call_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str,
+        on_token: Callable[[str], None] | None = None
+    ) -> str:
+        """Call the configured provider, stopping once the code block is complete"""
         if self.provider == "openai":
-            response = self._call_openai(system_prompt, user_prompt)
+            return self._call_openai(
+                system_prompt, user_prompt, stop_after_code=True, on_token=on_token,
+                model=model, structured=self.structured_output
+            )
         elif self.provider == "anthropic":
-            response = self._call_anthropic(system_prompt, user_prompt)
+            return self._call_anthropic(
+                system_prompt, user_prompt, stop_after_code=True, on_token=on_token,
+                model=model, structured=self.structured_output
+            )
+        raise ValueError(f"Unknown provider: {self.provider}")
+
+    async def _acall_llm(self, system_prompt: str, user_prompt: str, model: str) -> str:
+        """Async variant of _call_llm()"""
+        if self.provider == "openai":
+            return await self._acall_openai(
+                system_prompt, user_prompt, model=model, structured=self.structured_output
+            )
+        return await self._acall_anthropic(
+            system_prompt, user_prompt, model=model, structured=self.structured_output
+        )
+
+    def _cache_key(self, model: str, system_prompt: str, user_prompt: str) -> str | None:
+        """Get the cache key for a response from model to rendered prompts"""
+        if self._cache is None:
+            return None
+        return ResponseCache.make_key(self.provider, model, system_prompt, user_prompt)
+
+    def _cache_lookup(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str
+    ) -> tuple[str, CachedResponse | None]:
+        """
+        Get a cached response (if any) for rendered prompts and the model that produced it.
+
+        A small-model request may have been escalated last time, so the
+        large model's entry is checked as well.
+        """
+        if self._cache is None:
+            return model, None
+
+        for candidate in dict.fromkeys((model, self.model)):
+            cached = self._cache.get(self._cache_key(candidate, system_prompt, user_prompt))
+            if cached is not None:
+                return candidate, cached
+        return model, None
+
+    def _parse_response(self, response: str, cache_key: str | None) -> tuple[str, str]:
+        """Extract code and explanation from an LLM response and cache them"""
+        parsed = self._parse_structured(response) if self.structured_output else None
+        if parsed is not None:
+            code, explanation = parsed
         else:
-            raise ValueError(f"Unknown provider: {self.provider}")
+            code = self._extract_code(response)
+            explanation = self._extract_explanation(response)
 
-        # Parse response
-        code = self._extract_code(response)
-        explanation = self._extract_explanation(response)
+        if cache_key is not None:
+            self._cache.put(cache_key, code, explanation)
+
+        return code, explanation
 
-        # Safety analysis
+    def _build_result(
+        self,
+        prompt: str,
+        target: CodeTarget,
+        code: str,
+        explanation: str,
+        safety_check: bool,
+        model: str,
+        input_tokens: int | None = None,
+        cached: bool = False
+    ) -> GeneratedCode:
+        """Run safety analysis and assemble GeneratedCode"""
         safety_issues = []
         if safety_check:
             safety_issues = self._analyze_safety(code, target)
@@ -148,45 +701,25 @@ class AICodeGenerator:
             safety_issues=safety_issues,
             metadata={
                 'prompt': prompt,
-                'model': self.model,
+                'model': model,
                 'provider': self.provider,
+                'cached': cached,
+                'input_tokens': input_tokens,
             }
         )
 
     def _build_system_prompt(self, target: CodeTarget) -> str:
-        """Build system prompt for LLM"""
+        """Build system prompt for LLM (static preamble + target-specific part)"""
         vendor_info = self._get_vendor_info(target.vendor)
         language_info = self._get_language_info(target.language)
 
-        return f"""You are an expert industrial PLC programmer specializing in {vendor_info['name']} PLCs.
-
-You generate high-quality, safe, and efficient PLC code following these standards:
-- IEC 61131-3 compliance where applicable
-- {vendor_info['name']}-specific best practices
-- Industrial safety standards (IEC 62443, machinery safety)
-
-Target Platform:
-- Vendor: {vendor_info['name']}
-- Model: {target.model}
-- Programming Language: {language_info['name']}
-
-Code Requirements:
-1. Always include proper initialization
-2. Include emergency stop handling where appropriate
-3. Use meaningful variable names
-4. Add comments explaining logic
-5. Handle edge cases and error conditions
-6. Follow {vendor_info['name']} naming conventions
-
-{vendor_info['specific_guidelines']}
-
-{language_info['syntax_notes']}
-
-Output Format:
-1. First, provide a brief explanation of your approach
-2. Then provide the complete code in a code block
-3. Finally, note any safety considerations or recommendations
-"""
+        return _SYSTEM_PROMPT_TEMPLATE.substitute(
+            vendor_name=vendor_info['name'],
+            model=target.model,
+            language_name=language_info['name'],
+            specific_guidelines=vendor_info['specific_guidelines'],
+            syntax_notes=language_info['syntax_notes'],
+        )
 
     def _build_user_prompt(
         self,
@@ -202,171 +735,212 @@ Output Format:
 
         return user_prompt
 
-    def _get_vendor_info(self, vendor: Vendor) -> dict[str, str]:
+    def _get_vendor_info(self, vendor: Vendor) -> Mapping[str, str]:
         """Get vendor-specific information"""
-        vendor_info = {
-            Vendor.SIEMENS: {
-                'name': 'Siemens',
-                'specific_guidelines': """
-Siemens-Specific Guidelines:
-- Use DB (Data Blocks) for structured data storage
-- Use FB (Function Blocks) for reusable logic with instance data
-- Use FC (Functions) for stateless operations
-- Follow TIA Portal naming conventions (e.g., "Motor_1", "Conveyor_Start")
-- Use symbolic addressing when possible
-- Implement proper OB organization (OB1 for main, OB100 for startup)
-"""
-            },
-            Vendor.ALLEN_BRADLEY: {
-                'name': 'Allen-Bradley',
-                'specific_guidelines': """
-Allen-Bradley-Specific Guidelines:
-- Use Add-On Instructions (AOI) for reusable logic
-- Follow Studio 5000 naming conventions (CamelCase)
-- Use UDTs (User-Defined Types) for structured data
-- Implement proper task organization
-- Use program-scoped vs controller-scoped tags appropriately
-- Follow Rockwell Automation best practices
-"""
-            },
-            Vendor.DELTA: {
-                'name': 'Delta',
-                'specific_guidelines': """
-Delta DVP-Specific Guidelines:
-- Use D registers for data storage (D0-D9999)
-- Use M relays for internal flags (M0-M4095)
-- Follow ISPSoft conventions
-- Use proper timer/counter ranges for DVP series
-- X inputs and Y outputs use octal addressing
-"""
-            },
-            Vendor.OMRON: {
-                'name': 'Omron',
-                'specific_guidelines': """
-Omron-Specific Guidelines:
-- Use DM (Data Memory) for data storage
-- Use W (Work) area for internal flags
-- Follow CX-Programmer or Sysmac conventions
-- Use proper memory area designations (CIO, W, H, D)
-- Implement function blocks for reusable code
-"""
-            },
-            Vendor.GENERIC: {
-                'name': 'Generic IEC 61131-3',
-                'specific_guidelines': """
-Generic IEC 61131-3 Guidelines:
-- Follow standard data types (BOOL, INT, DINT, REAL, etc.)
-- Use POUs (Program Organization Units) properly
-- Implement proper variable scoping
-- Follow standard function block conventions
-"""
-            },
-        }
-        return vendor_info.get(vendor, vendor_info[Vendor.GENERIC])
+        return _VENDOR_INFO.get(vendor, _VENDOR_INFO[Vendor.GENERIC])
 
-    def _get_language_info(self, language: CodeLanguage) -> dict[str, str]:
+    def _get_language_info(self, language: CodeLanguage) -> Mapping[str, str]:
         """Get language-specific information"""
-        language_info = {
-            CodeLanguage.STRUCTURED_TEXT: {
-                'name': 'Structured Text (ST)',
-                'syntax_notes': """
-Structured Text Syntax:
-- Use := for assignment
-- END_IF, END_FOR, END_WHILE for block terminators
-- Use (* comments *) or // for line comments
-- Case-insensitive keywords
-- Standard operators: AND, OR, NOT, XOR
-"""
-            },
-            CodeLanguage.LADDER: {
-                'name': 'Ladder Diagram (LAD)',
-                'syntax_notes': """
-Ladder Diagram Notes:
-- Provide code as pseudo-ladder or XML representation
-- Include rung comments
-- Use standard contact/coil notation
-- Specify parallel and series connections clearly
-"""
-            },
-            CodeLanguage.FUNCTION_BLOCK: {
-                'name': 'Function Block Diagram (FBD)',
-                'syntax_notes': """
-Function Block Diagram Notes:
-- Describe connections between blocks
-- Specify input/output mappings
-- Use standard function block types
-"""
-            },
-            CodeLanguage.INSTRUCTION_LIST: {
-                'name': 'Instruction List (IL)',
-                'syntax_notes': """
-Instruction List Syntax:
-- Use standard IL mnemonics (LD, ST, AND, OR, etc.)
-- One instruction per line
-- Labels end with colon
-- Use CAL for function calls
-"""
-            },
-        }
-        return language_info.get(language, language_info[CodeLanguage.STRUCTURED_TEXT])
+        return _LANGUAGE_INFO.get(language, _LANGUAGE_INFO[CodeLanguage.STRUCTURED_TEXT])
+
+    def _call_openai(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stop_after_code: bool = False,
+        on_token: Callable[[str], None] | None = None,
+        model: str | None = None,
+        structured: bool = False
+    ) -> str:
+        """
+        Call OpenAI API.
 
-    def _call_openai(self, system_prompt: str, user_prompt: str) -> str:
-        """Call OpenAI API"""
+        The response is streamed; with stop_after_code the stream is closed
+        as soon as the first fenced code block is complete, since trailing
+        commentary is never used. With structured the model returns JSON
+        matching _CODE_SCHEMA.
+        """
         client = self._get_client()
 
-        response = client.chat.completions.create(
-            model=self.model,
+        extra: dict[str, Any] = {}
+        if structured:
+            extra['response_format'] = _OPENAI_RESPONSE_FORMAT
+            stop_after_code = False
+
+        stream = client.chat.completions.create(
+            model=model or self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=4096,
+            max_tokens=_MAX_OUTPUT_TOKENS,
             temperature=0.3,  # Lower temperature for more deterministic code
+            stream=True,
+            **extra,
         )
 
-        return response.choices[0].message.content
-
-    def _call_anthropic(self, system_prompt: str, user_prompt: str) -> str:
-        """Call Anthropic API"""
+        parts: list[str] = []
+        watcher = _FenceWatcher()
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if on_token:
+                    on_token(delta)
+                if stop_after_code and watcher.feed(delta):
+                    break
+        finally:
+            stream.close()
+
+        return ''.join(parts)
+
+    def _call_anthropic(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stop_after_code: bool = False,
+        on_token: Callable[[str], None] | None = None,
+        model: str | None = None,
+        structured: bool = False
+    ) -> str:
+        """Call Anthropic API (streamed, see _call_openai)"""
         client = self._get_client()
 
-        response = client.messages.create(
-            model=self.model,
-            max_tokens=4096,
+        if structured:
+            # Forced tool call; the tool input is the JSON result
+            response = client.messages.create(
+                model=model or self.model,
+                max_tokens=_MAX_OUTPUT_TOKENS,
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ],
+                tools=[_ANTHROPIC_CODE_TOOL],
+                tool_choice={"type": "tool", "name": _ANTHROPIC_CODE_TOOL['name']},
+            )
+            result = self._tool_result(response)
+            if on_token:
+                on_token(result)
+            return result
+
+        parts: list[str] = []
+        watcher = _FenceWatcher()
+        with client.messages.stream(
+            model=model or self.model,
+            max_tokens=_MAX_OUTPUT_TOKENS,
             system=system_prompt,
             messages=[
                 {"role": "user", "content": user_prompt}
             ]
+        ) as stream:
+            for delta in stream.text_stream:
+                parts.append(delta)
+                if on_token:
+                    on_token(delta)
+                if stop_after_code and watcher.feed(delta):
+                    break
+
+        return ''.join(parts)
+
+    async def _acall_openai(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str | None = None,
+        structured: bool = False
+    ) -> str:
+        """Call OpenAI API asynchronously"""
+        client = self._get_async_client()
+
+        extra: dict[str, Any] = {}
+        if structured:
+            extra['response_format'] = _OPENAI_RESPONSE_FORMAT
+
+        response = await client.chat.completions.create(
+            model=model or self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=_MAX_OUTPUT_TOKENS,
+            temperature=0.3,
+            **extra,
+        )
+
+        return response.choices[0].message.content
+
+    async def _acall_anthropic(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str | None = None,
+        structured: bool = False
+    ) -> str:
+        """Call Anthropic API asynchronously"""
+        client = self._get_async_client()
+
+        extra: dict[str, Any] = {}
+        if structured:
+            extra['tools'] = [_ANTHROPIC_CODE_TOOL]
+            extra['tool_choice'] = {"type": "tool", "name": _ANTHROPIC_CODE_TOOL['name']}
+
+        response = await client.messages.create(
+            model=model or self.model,
+            max_tokens=_MAX_OUTPUT_TOKENS,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ],
+            **extra,
         )
 
+        if structured:
+            return self._tool_result(response)
         return response.content[0].text
 
+    @staticmethod
+    def _tool_result(response: Any) -> str:
+        """Get the forced emit_code tool input as a JSON string"""
+        for block in response.content:
+            if block.type == "tool_use":
+                return json.dumps(block.input)
+        return ""
+
+    def _parse_structured(self, response: str) -> tuple[str, str] | None:
+        """Parse a structured (JSON) response into code and explanation"""
+        try:
+            data = json.loads(response)
+            code = data['code']
+            explanation = data.get('explanation') or ''
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        # Anything but text falls back to extracting code from the raw response
+        if not isinstance(code, str) or not isinstance(explanation, str):
+            return None
+
+        # Some models still wrap the code field in a fence
+        if code.lstrip().startswith('```'):
+            code = self._extract_code(code)
+
+        return code.strip(), explanation.strip()
+
     def _extract_code(self, response: str) -> str:
         """Extract code block from response"""
-        # Look for code blocks
-        import re
-
         # Try to find fenced code block
-        code_match = re.search(r'```(?:\w+)?\n(.*?)```', response, re.DOTALL)
+        code_match = _FENCED_CODE_RE.search(response)
         if code_match:
             return code_match.group(1).strip()
 
-        # Look for indented code block
-        lines = response.split('\n')
-        code_lines = []
-        in_code = False
-
-        for line in lines:
-            if line.startswith('    ') or line.startswith('\t'):
-                code_lines.append(line)
-                in_code = True
-            elif in_code and line.strip() == '':
-                code_lines.append(line)
-            elif in_code:
-                break
-
-        if code_lines:
-            return '\n'.join(code_lines).strip()
+        # Look for indented code block (blank lines inside the block are kept)
+        if '    ' in response or '\t' in response:
+            indented_match = _INDENTED_BLOCK_RE.search(response)
+            if indented_match:
+                return indented_match.group(0).strip()
 
         # Return full response if no code block found
         return response
@@ -374,9 +948,7 @@ Instruction List Syntax:
     def _extract_explanation(self, response: str) -> str:
         """Extract explanation from response"""
         # Get text before code block
-        import re
-
-        code_start = re.search(r'```', response)
+        code_start = _FENCE_RE.search(response)
         if code_start:
             explanation = response[:code_start.start()].strip()
             return explanation
@@ -389,11 +961,18 @@ Instruction List Syntax:
 
         code_lower = code.lower()
 
-        # Check for emergency stop handling
-        estop_keywords = ['estop', 'e_stop', 'emergency', 'emergencystop', 'nothalt']
-        has_estop = any(kw in code_lower for kw in estop_keywords)
+        # Collect keyword hits and timer literals in one scan
+        found: set[str] = set()
+        timers: list[tuple[str, str]] = []
+        for match in _SAFETY_SCAN_RE.finditer(code_lower):
+            kind = match.lastgroup
+            if kind == 'unit':
+                timers.append((match['timer'], match['unit']))
+            else:
+                found.add(kind)
 
-        if not has_estop:
+        # Check for emergency stop handling
+        if 'estop' not in found:
             issues.append(SafetyIssue(
                 severity="warning",
                 message="No emergency stop handling detected",
@@ -401,7 +980,7 @@ Instruction List Syntax:
             ))
 
         # Check for infinite loops
-        if 'while true' in code_lower and 'exit' not in code_lower:
+        if 'loop' in found and 'exit' not in found:
             issues.append(SafetyIssue(
                 severity="warning",
                 message="Potential infinite loop detected",
@@ -409,9 +988,6 @@ Instruction List Syntax:
             ))
 
         # Check for hardcoded timers without safety margins
-        import re
-        timer_pattern = r't#(\d+)(ms|s|m)'
-        timers = re.findall(timer_pattern, code_lower)
         for value, unit in timers:
             if unit == 's' and int(value) > 60:
                 issues.append(SafetyIssue(
@@ -422,7 +998,7 @@ Instruction List Syntax:
 
         # Check for missing initialization
         if target.language == CodeLanguage.STRUCTURED_TEXT:
-            if 'var' in code_lower and ':=' not in code_lower:
+            if 'var' in found and 'assign' not in found:
                 issues.append(SafetyIssue(
                     severity="info",
                     message="Variables declared without initialization",
@@ -441,10 +1017,12 @@ Analyze the following {target.vendor.value} PLC code and provide:
 """
         user_prompt = f"Explain this code:\n\n```\n{code}\n```"
 
+        # Explanations are forgiving; use the small model when available
+        model = self.small_model or self.model
         if self.provider == "openai":
-            return self._call_openai(system_prompt, user_prompt)
+            return self._call_openai(system_prompt, user_prompt, model=model)
         else:
-            return self._call_anthropic(system_prompt, user_prompt)
+            return self._call_anthropic(system_prompt, user_prompt, model=model)
 
     def optimize_code(self, code: str, target: CodeTarget) -> GeneratedCode:
         """Optimize existing PLC code"""
@@ -464,9 +1042,9 @@ Original code:
 Provide the optimized code with explanations of changes made."""
 
         if self.provider == "openai":
-            response = self._call_openai(system_prompt, user_prompt)
+            response = self._call_openai(system_prompt, user_prompt, stop_after_code=True)
         else:
-            response = self._call_anthropic(system_prompt, user_prompt)
+            response = self._call_anthropic(system_prompt, user_prompt, stop_after_code=True)
 
         optimized_code = self._extract_code(response)
         explanation = self._extract_explanation(response)
@@ -0,0 +1,149 @@
+"""
+LLM Response Cache
+
+Caches parsed code generation responses so repeated prompts for the
+same target do not trigger another LLM round-trip. Entries are kept in
+an in-memory LRU and can optionally be persisted to SQLite so hits
+survive application restarts.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@dataclass
+class CachedResponse:
+    """Parsed LLM response stored in the cache"""
+    code: str
+    explanation: str
+    timestamp: float
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache for LLM responses.
+
+    Keys are BLAKE2b digests of the provider, model and the fully built
+    system/user prompts. The user prompt is whitespace-normalized so
+    templated prompts that differ only in formatting share an entry.
+
+    Usage:
+        cache = ResponseCache(db_path="~/.plcforge/cache/llm_cache.db")
+        generator = AICodeGenerator(provider="openai", cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 256, db_path: str | Path | None = None):
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._db_connection: sqlite3.Connection | None = None
+
+        if db_path:
+            self._init_sqlite(Path(db_path).expanduser())
+
+    def _init_sqlite(self, db_path: Path) -> None:
+        """Initialize SQLite persistence"""
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db_connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                code TEXT NOT NULL,
+                explanation TEXT NOT NULL,
+                timestamp REAL NOT NULL
+            )
+        """)
+        self._db_connection.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, user_prompt: str) -> str:
+        """Build cache key for a fully rendered prompt"""
+        normalized = _WHITESPACE_RE.sub(' ', user_prompt).strip()
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (provider, model, system_prompt, normalized):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up a cached response, promoting it to most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+            if self._db_connection is None:
+                return None
+
+            row = self._db_connection.execute(
+                "SELECT code, explanation, timestamp FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            entry = CachedResponse(code=row[0], explanation=row[1], timestamp=row[2])
+            self._store(key, entry)
+            return entry
+
+    def put(self, key: str, code: str, explanation: str) -> None:
+        """Store a parsed response"""
+        entry = CachedResponse(code=code, explanation=explanation, timestamp=time.time())
+
+        with self._lock:
+            self._store(key, entry)
+
+            if self._db_connection is not None:
+                self._db_connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, code, explanation, timestamp) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, entry.code, entry.explanation, entry.timestamp)
+                )
+                self._db_connection.commit()
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            if self._db_connection is not None:
+                self._db_connection.execute("DELETE FROM responses")
+                self._db_connection.commit()
+
+    def close(self) -> None:
+        """Close SQLite persistence"""
+        with self._lock:
+            if self._db_connection is not None:
+                self._db_connection.close()
+                self._db_connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Global cache instance shared by generators created without an explicit cache
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get global in-memory response cache"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
@@ -5,15 +5,11 @@ Supports CompactLogix and ControlLogix PLCs using
 the pycomm3 library for CIP protocol communication.
 """
 
-from datetime import datetime
-from typing import Any
-
-try:
-    from pycomm3 import CIPDriver, LogixDriver
-    from pycomm3.exceptions import CommError, RequestError
-    PYCOMM3_AVAILABLE = True
-except ImportError:
-    PYCOMM3_AVAILABLE = False
+import importlib.util
+import re
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from plcforge.drivers.base import (
     AccessLevel,
@@ -27,9 +23,49 @@ from plcforge.drivers.base import (
     PLCMode,
     PLCProgram,
     ProtectionStatus,
+    TagBatch,
     TagValue,
 )
 
+# pycomm3 pulls in a large dependency tree, so only its presence is checked
+# here; the import itself happens on first connect()
+PYCOMM3_AVAILABLE = importlib.util.find_spec("pycomm3") is not None
+
+if TYPE_CHECKING:
+    from pycomm3 import LogixDriver
+
+# Mode keywords in the controller status string ('PROG' also covers 'PROGRAM')
+_MODE_RE = re.compile(r'RUN|PROG|FAULT', re.IGNORECASE)
+
+# Payload budget (bytes) for one CIP multi-service request; stays below the
+# 504-byte standard connection size with room for the packet header
+CIP_REQUEST_BUDGET = 480
+
+
+def _estimate_cip_size(tag_name: str) -> int:
+    """Estimate request bytes for one tag (service, symbolic path, status)"""
+    return 2 + len(tag_name) + 4
+
+
+def _chunk_by_size(names: list[str], extra: int = 0) -> list[list[str]]:
+    """Greedily pack tag names into chunks that fit CIP_REQUEST_BUDGET"""
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+
+    for name in names:
+        item_size = _estimate_cip_size(name) + extra
+        if current and size + item_size > CIP_REQUEST_BUDGET:
+            chunks.append(current)
+            current = []
+            size = 0
+        current.append(name)
+        size += item_size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class AllenBradleyDriver(PLCDevice):
     """
@@ -45,6 +81,9 @@ class AllenBradleyDriver(PLCDevice):
     - ControlLogix 5580 series
     """
 
+    # pycomm3 module, imported lazily by _lazy_pycomm3()
+    _pycomm3 = None
+
     def __init__(self):
         super().__init__()
         if not PYCOMM3_AVAILABLE:
@@ -56,6 +95,19 @@ class AllenBradleyDriver(PLCDevice):
         self._ip: str | None = None
         self._slot: int = 0
 
+        # Tag list download is slow on large projects; cache it briefly
+        self._tag_list_cache: list[dict[str, Any]] | None = None
+        self._tag_list_ts: float = 0.0
+        self._tag_list_ttl: float = 30.0
+
+    @classmethod
+    def _lazy_pycomm3(cls):
+        """Import pycomm3 on first use"""
+        if cls._pycomm3 is None:
+            import pycomm3
+            cls._pycomm3 = pycomm3
+        return cls._pycomm3
+
     def connect(self, ip: str, **kwargs) -> bool:
         """
         Connect to Allen-Bradley PLC.
@@ -77,7 +129,7 @@ class AllenBradleyDriver(PLCDevice):
             path = ip
 
         try:
-            self._plc = LogixDriver(path)
+            self._plc = self._lazy_pycomm3().LogixDriver(path)
             self._plc.open()
             self._connected = True
 
@@ -99,6 +151,7 @@ class AllenBradleyDriver(PLCDevice):
                 pass
             self._plc = None
         self._connected = False
+        self.invalidate_tag_cache()
 
     def _read_device_info(self) -> DeviceInfo:
         """Read device information"""
@@ -168,9 +221,8 @@ class AllenBradleyDriver(PLCDevice):
             result = self._plc.read(tag)
             if result.error:
                 raise Exception(result.error)
-            # Convert to bytes
-            import struct
-            return struct.pack('>i', result.value)
+            # Convert to bytes (big-endian DINT)
+            return result.value.to_bytes(4, 'big', signed=True)
         except Exception as e:
             self._last_error = str(e)
             raise
@@ -202,7 +254,7 @@ class AllenBradleyDriver(PLCDevice):
                 value=result.value,
                 data_type=result.type or "Unknown",
                 address=tag_name,
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
             )
         except Exception as e:
             self._last_error = str(e)
@@ -222,52 +274,107 @@ class AllenBradleyDriver(PLCDevice):
             self._last_error = str(e)
             return False
 
-    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
-        """Read multiple tags in one request (optimized)"""
-        try:
-            results = self._plc.read(*tag_names)
-
-            tag_values = []
-            # Handle single vs multiple results
-            if not isinstance(results, list):
-                results = [results]
-
-            for i, result in enumerate(results):
-                tag_values.append(TagValue(
-                    name=tag_names[i] if i < len(tag_names) else f"Tag{i}",
-                    value=result.value if not result.error else None,
-                    data_type=result.type or "Unknown",
-                    timestamp=datetime.now(),
-                    quality="good" if not result.error else "bad",
-                ))
+    def _iter_read_results(self, tag_names: list[str]) -> Iterator[tuple[str, Any]]:
+        """
+        Read tags using CIP multi-service requests, yielding (name, result).
 
-            return tag_values
-        except Exception as e:
-            self._last_error = str(e)
-            return [TagValue(name=n, value=None, data_type="Unknown", quality="bad")
-                    for n in tag_names]
+        Tags are packed into requests that fit one CIP packet. The requests
+        share one connection, so they are sent one after another; a failing
+        request yields None results for its own tags only.
+        """
+        for chunk in _chunk_by_size(tag_names):
+            try:
+                results = self._plc.read(*chunk)
+
+                # Handle single vs multiple results
+                if not isinstance(results, list):
+                    results = [results]
+            except Exception as e:
+                self._last_error = str(e)
+                results = [None] * len(chunk)
+
+            yield from zip(chunk, results, strict=True)
+
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """Read multiple tags in batched requests (optimized)"""
+        timestamp_ns = time.time_ns()
+        tag_values = []
+
+        for name, result in self._iter_read_results(tag_names):
+            if result is None:
+                tag_values.append(
+                    TagValue(name=name, value=None, data_type="Unknown", quality="bad")
+                )
+                continue
+
+            tag_values.append(TagValue(
+                name=name,
+                value=result.value if not result.error else None,
+                data_type=result.type or "Unknown",
+                quality="good" if not result.error else "bad",
+                timestamp_ns=timestamp_ns,
+            ))
+
+        return tag_values
+
+    def read_tags_soa(self, tag_names: list[str]) -> TagBatch:
+        """Read multiple tags straight into a struct-of-arrays TagBatch"""
+        results = list(self._iter_read_results(tag_names))
+        timestamp_ns = time.time_ns()
+
+        quality = bytearray(1 if r is None or r.error else 0 for _, r in results)
+        values = [None if bad else r.value for (_, r), bad in zip(results, quality, strict=True)]
+
+        return TagBatch(
+            names=[name for name, _ in results],
+            values=TagBatch.pack_values(values, quality),
+            data_types=[(r.type if r is not None else None) or "Unknown" for _, r in results],
+            quality=quality,
+            timestamp_ns=timestamp_ns,
+        )
 
     def write_tags(self, tags: dict[str, Any]) -> bool:
-        """Write multiple tags in one request (optimized)"""
-        try:
-            # Build list of (tag, value) tuples
-            writes = list(tags.items())
-            results = self._plc.write(*writes)
+        """
+        Write multiple tags using CIP multi-service requests (optimized).
 
-            # Check all results
-            if not isinstance(results, list):
-                results = [results]
+        Stops at the first request that reports an error.
+        """
+        # Allow 8 bytes per tag for type code and value data
+        for chunk in _chunk_by_size(list(tags), extra=8):
+            try:
+                results = self._plc.write(*((name, tags[name]) for name in chunk))
+
+                # Check all results
+                if not isinstance(results, list):
+                    results = [results]
+
+                errors = [r.error for r in results if r.error]
+                if errors:
+                    self._last_error = str(errors[0])
+                    return False
+            except Exception as e:
+                self._last_error = str(e)
+                return False
 
-            return all(not r.error for r in results)
-        except Exception as e:
-            self._last_error = str(e)
-            return False
+        return True
+
+    def get_tag_list(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Get list of all tags in the PLC.
+
+        The list is cached for _tag_list_ttl seconds; pass refresh=True
+        to force a new download.
+        """
+        if (
+            not refresh
+            and self._tag_list_cache is not None
+            and time.monotonic() - self._tag_list_ts < self._tag_list_ttl
+        ):
+            return self._tag_list_cache
 
-    def get_tag_list(self) -> list[dict[str, Any]]:
-        """Get list of all tags in the PLC"""
         try:
             tags = self._plc.get_tag_list()
-            return [
+            self._tag_list_cache = [
                 {
                     'name': tag.get('tag_name'),
                     'type': tag.get('data_type'),
@@ -276,10 +383,23 @@ class AllenBradleyDriver(PLCDevice):
                 }
                 for tag in tags
             ]
+            self._tag_list_ts = time.monotonic()
+            return self._tag_list_cache
         except Exception as e:
             self._last_error = str(e)
             return []
 
+    def count_tags(self) -> int:
+        """Get number of tags, reusing the cached tag list even if expired"""
+        if self._tag_list_cache is not None:
+            return len(self._tag_list_cache)
+        return len(self.get_tag_list())
+
+    def invalidate_tag_cache(self) -> None:
+        """Discard the cached tag list"""
+        self._tag_list_cache = None
+        self._tag_list_ts = 0.0
+
     def upload_program(self) -> PLCProgram:
         """
         Upload program from PLC.
@@ -307,7 +427,7 @@ class AllenBradleyDriver(PLCDevice):
         # Get program names
         try:
             programs = self._plc.get_program_tag_list()
-            program.metadata['programs'] = list(programs.keys())
+            program.metadata['programs'] = tuple(programs)
         except Exception:
             pass
 
@@ -334,10 +454,10 @@ class AllenBradleyDriver(PLCDevice):
             # Get programs
             programs = self._plc.get_program_tag_list()
 
-            for prog_name in programs.keys():
+            for number, prog_name in enumerate(programs):
                 blocks.append(BlockInfo(
                     block_type=BlockType.PROGRAM,
-                    number=len(blocks),
+                    number=number,
                     name=prog_name,
                     language=CodeLanguage.LADDER,
                     size=0,
@@ -378,14 +498,15 @@ class AllenBradleyDriver(PLCDevice):
         """Get current PLC mode"""
         try:
             info = self._plc.get_plc_info()
-            # Mode is in the info but format varies
-            mode_str = str(info.get('status', '')).upper()
+            # Mode is in the info but format varies; collect all keywords in
+            # one scan, then apply priority RUN > PROGRAM > FAULT
+            found = {m.upper() for m in _MODE_RE.findall(str(info.get('status', '')))}
 
-            if 'RUN' in mode_str:
+            if 'RUN' in found:
                 return PLCMode.RUN
-            elif 'PROGRAM' in mode_str or 'PROG' in mode_str:
+            elif 'PROG' in found:
                 return PLCMode.PROGRAM
-            elif 'FAULT' in mode_str:
+            elif 'FAULT' in found:
                 return PLCMode.FAULT
             else:
                 return PLCMode.UNKNOWN
@@ -412,7 +533,7 @@ class AllenBradleyDriver(PLCDevice):
             return {
                 'plc_info': info,
                 'connected': self._connected,
-                'tag_count': len(self.get_tag_list()),
+                'tag_count': self.count_tags(),
             }
         except Exception as e:
             return {'error': str(e)}
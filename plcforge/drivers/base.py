@@ -5,22 +5,31 @@ Defines the abstract interface that all vendor-specific drivers must implement.
 This enables the Protocol Abstraction Layer (PAL) to work uniformly across vendors.
 """
 
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from itertools import chain
 from typing import Any
 
 
-class MemoryArea(Enum):
-    """Unified memory area types across all PLC vendors"""
-    INPUT = "input"           # Digital inputs (X, I, CIO)
-    OUTPUT = "output"         # Digital outputs (Y, Q, CIO)
-    MEMORY = "memory"         # Internal memory/flags (M, HR, W)
-    DATA = "data"             # Data registers (D, DB, DM)
-    TIMER = "timer"           # Timer values
-    COUNTER = "counter"       # Counter values
-    SPECIAL = "special"       # Special registers (vendor-specific)
+class MemoryArea(IntEnum):
+    """
+    Unified memory area types across all PLC vendors.
+
+    Values are small consecutive ints so drivers can index per-area
+    tuples directly; use name.lower() for a text form.
+    """
+    INPUT = 0                 # Digital inputs (X, I, CIO)
+    OUTPUT = 1                # Digital outputs (Y, Q, CIO)
+    MEMORY = 2                # Internal memory/flags (M, HR, W)
+    DATA = 3                  # Data registers (D, DB, DM)
+    TIMER = 4                 # Timer values
+    COUNTER = 5               # Counter values
+    SPECIAL = 6               # Special registers (vendor-specific)
 
 
 class PLCMode(Enum):
@@ -62,7 +71,7 @@ class CodeLanguage(Enum):
     GRAPH = "graph"               # Siemens GRAPH
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Information about a connected PLC device"""
     vendor: str
@@ -76,7 +85,7 @@ class DeviceInfo:
     additional_info: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtectionStatus:
     """Protection/security status of the PLC"""
     cpu_protected: bool = False
@@ -87,7 +96,7 @@ class ProtectionStatus:
     protection_details: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockInfo:
     """Information about a program block"""
     block_type: BlockType
@@ -101,15 +110,158 @@ class BlockInfo:
     comment: str | None = None
 
 
-@dataclass
-class TagValue:
-    """A tag/variable value from the PLC"""
+class _TimestampSlot:
+    """Slot for TagValue's lazily built datetime, kept out of its dataclass fields"""
+    __slots__ = ('_timestamp',)
+
+
+@dataclass(slots=True, frozen=True, init=False)
+class TagValue(_TimestampSlot):
+    """
+    A tag/variable value from the PLC.
+
+    Drivers may pass timestamp_ns instead of a datetime; the timestamp
+    property then builds the datetime on first access, so batch reads
+    only pay for a time_ns() call. A datetime passed as timestamp is kept
+    as is and also recorded in timestamp_ns; the cached datetime is not a
+    field, so comparison, hashing, asdict() and replace() only see
+    timestamp_ns.
+    """
     name: str
     value: Any
     data_type: str
     address: str | None = None
-    timestamp: datetime | None = None
     quality: str = "good"
+    timestamp_ns: int | None = None
+
+    def __init__(
+        self,
+        name: str,
+        value: Any,
+        data_type: str,
+        address: str | None = None,
+        timestamp: datetime | None = None,
+        quality: str = "good",
+        timestamp_ns: int | None = None,
+    ):
+        if timestamp is not None:
+            timestamp_ns = round(timestamp.timestamp() * 1e6) * 1000
+
+        # Frozen dataclass: assign through object.__setattr__
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'data_type', data_type)
+        object.__setattr__(self, 'address', address)
+        object.__setattr__(self, 'quality', quality)
+        object.__setattr__(self, 'timestamp_ns', timestamp_ns)
+        object.__setattr__(self, '_timestamp', timestamp)
+
+    @property
+    def timestamp(self) -> datetime | None:
+        """Read time, converted from timestamp_ns on first access"""
+        # The slot is not pickled or copied with the fields, so it may be unset
+        timestamp = getattr(self, '_timestamp', None)
+        if timestamp is None and self.timestamp_ns is not None:
+            timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9)
+            object.__setattr__(self, '_timestamp', timestamp)
+        return timestamp
+
+
+@dataclass
+class TagBatch:
+    """
+    Struct-of-arrays result of a multi-tag read.
+
+    Numeric batches keep their values in a contiguous float64 array
+    (bad-quality entries are NaN) that can be wrapped without copying,
+    e.g. numpy.frombuffer(batch.values); mixed batches fall back to a
+    list. Quality is 0 for good and 1 for bad.
+    """
+    names: list[str]
+    values: array | list[Any]
+    data_types: list[str]
+    quality: bytearray
+    timestamp_ns: int
+
+    @staticmethod
+    def pack_values(values: list[Any], quality: bytearray) -> array | list[Any]:
+        """Pack values into a float64 array if every good value is numeric"""
+        good = [v for v, q in zip(values, quality, strict=True) if not q]
+        if all(isinstance(v, (int, float)) for v in good):
+            nan = float('nan')
+            return array('d', (nan if q else v for v, q in zip(values, quality, strict=True)))
+        return values
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_tag_values(self) -> list[TagValue]:
+        """Expand into per-tag TagValue objects"""
+        return [
+            TagValue(
+                name=name,
+                value=None if bad else value,
+                data_type=data_type,
+                quality="bad" if bad else "good",
+                timestamp_ns=self.timestamp_ns,
+            )
+            for name, value, data_type, bad in zip(
+                self.names, self.values, self.data_types, self.quality, strict=True
+            )
+        ]
+
+
+def coalesce_ranges(
+    points: Iterable[tuple[int, Any]],
+    max_gap: int,
+    max_count: int,
+    widths: Mapping[Any, int] | None = None,
+) -> list[tuple[int, int, list[tuple[int, Any]]]]:
+    """
+    Merge point addresses into contiguous read ranges.
+
+    Points are (address, key) pairs. A point joins the current range if
+    it lies at most max_gap addresses past its end and the range stays
+    within max_count addresses, so small holes are read and discarded
+    instead of costing an extra request. widths optionally gives the
+    number of addresses a key spans (default 1), e.g. 2 for a 32-bit
+    value in 16-bit registers; a point is never split across ranges.
+
+    Returns:
+        List of (start, count, [(address, key), ...]) in address order
+    """
+    ranges: list[tuple[int, int, list[tuple[int, Any]]]] = []
+    members: list[tuple[int, Any]] = []
+    start = end = 0
+
+    for address, key in sorted(points, key=lambda point: point[0]):
+        width = widths.get(key, 1) if widths else 1
+        if members and (address > end + max_gap or address + width - start > max_count):
+            ranges.append((start, end - start, members))
+            members = []
+        if not members:
+            start = end = address
+        members.append((address, key))
+        end = max(end, address + width)
+
+    if members:
+        ranges.append((start, end - start, members))
+    return ranges
+
+
+# Coil states of every byte value, LSB first (Modbus coil order)
+_BYTE_BITS = tuple(tuple(bool(byte >> i & 1) for i in range(8)) for byte in range(256))
+
+
+def pack_bits(bits: list[bool], size: int) -> bytes:
+    """Pack coil states into size bytes, 8 coils per byte, LSB first"""
+    digits = ''.join(map('01'.__getitem__, map(bool, reversed(bits[:size * 8]))))
+    return int(digits or '0', 2).to_bytes(size, 'little')
+
+
+def unpack_bits(data: bytes) -> list[bool]:
+    """Expand packed bytes into coil states, LSB first"""
+    return list(chain.from_iterable(map(_BYTE_BITS.__getitem__, data)))
 
 
 @dataclass
@@ -133,7 +285,7 @@ class PLCProgram:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """A program block with code content"""
     info: BlockInfo
@@ -150,6 +302,9 @@ class PLCDevice(ABC):
     must implement this interface to enable unified access through the PAL.
     """
 
+    # Drivers that declare their own __slots__ carry no per-instance dict
+    __slots__ = ('_connected', '_device_info', '_last_error')
+
     def __init__(self):
         self._connected = False
         self._device_info: DeviceInfo | None = None
@@ -280,6 +435,33 @@ class PLCDevice(ABC):
         """
         return [self.read_tag(name) for name in tag_names]
 
+    def iter_read_tags(self, tag_names: Iterable[str]) -> Iterator[TagValue]:
+        """
+        Read tags lazily, yielding each value as it is read.
+
+        Large scans can filter or forward values without building the
+        whole result list. Override in driver to stream batch responses.
+        """
+        for name in tag_names:
+            yield self.read_tag(name)
+
+    def read_tags_soa(self, tag_names: list[str]) -> TagBatch:
+        """
+        Read multiple tags into a struct-of-arrays TagBatch.
+
+        Default: built from read_tags(). Override in driver to fill the
+        arrays directly from protocol responses.
+        """
+        tags = self.read_tags(tag_names)
+        quality = bytearray(0 if tag.quality == "good" else 1 for tag in tags)
+        return TagBatch(
+            names=[tag.name for tag in tags],
+            values=TagBatch.pack_values([tag.value for tag in tags], quality),
+            data_types=[tag.data_type for tag in tags],
+            quality=quality,
+            timestamp_ns=time.time_ns(),
+        )
+
     def write_tags(self, tags: dict[str, Any]) -> bool:
         """
         Write multiple tags at once (default: sequential writes).
@@ -4,6 +4,6 @@ Beckhoff TwinCAT ADS Driver
 Supports TwinCAT 2 and TwinCAT 3 PLCs via ADS protocol.
 """
 
-from plcforge.drivers.beckhoff.ads_driver import BeckhoffADSDriver
+from plcforge.drivers.beckhoff.ads_driver import ADSReadError, BeckhoffADSDriver
 
-__all__ = ['BeckhoffADSDriver']
+__all__ = ['BeckhoffADSDriver', 'ADSReadError']
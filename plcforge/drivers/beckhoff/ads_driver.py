@@ -5,16 +5,22 @@ Supports TwinCAT 2 and TwinCAT 3 PLCs.
 Uses pyads library for ADS communication.
 """
 
-from typing import Any
-
-try:
-    import pyads
-    from pyads import AdsSymbol, Connection
-    PYADS_AVAILABLE = True
-except ImportError:
-    PYADS_AVAILABLE = False
+import asyncio
+import ctypes
+import functools
+import importlib.util
+import itertools
+import queue
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from plcforge.drivers.base import (
+    AccessLevel,
     BlockInfo,
     BlockType,
     DeviceInfo,
@@ -26,6 +32,276 @@ from plcforge.drivers.base import (
     TagValue,
 )
 
+# pyads loads the ADS DLL/shared library on import, so only its presence
+# is checked here; the import itself happens on first connect()
+PYADS_AVAILABLE = importlib.util.find_spec("pyads") is not None
+
+if TYPE_CHECKING:
+    from pyads import AdsSymbol, Connection
+
+# Maximum number of resolved AdsSymbol objects kept per connection
+SYMBOL_CACHE_SIZE = 1024
+
+# Variables per sum command (pyads MAX_ADS_SUB_COMMANDS)
+ADS_SUM_CHUNK = 500
+
+# Sum commands kept in flight by read_tags_async()
+ADS_ASYNC_WORKERS = 16
+
+# Adjacent symbols (at most ADS_MERGE_GAP bytes apart) in one index group
+# are read as a single byte range once a range holds ADS_MERGE_MIN_TAGS
+ADS_MERGE_GAP = 8
+ADS_MERGE_MIN_TAGS = 16
+
+# Little-endian decoders by symbol plc_type (pyads PLCTYPE_* are ctypes types)
+_TYPE_STRUCTS = {
+    ctypes.c_bool: struct.Struct('<?'),
+    ctypes.c_int8: struct.Struct('<b'),
+    ctypes.c_uint8: struct.Struct('<B'),
+    ctypes.c_int16: struct.Struct('<h'),
+    ctypes.c_uint16: struct.Struct('<H'),
+    ctypes.c_int32: struct.Struct('<i'),
+    ctypes.c_uint32: struct.Struct('<I'),
+    ctypes.c_int64: struct.Struct('<q'),
+    ctypes.c_uint64: struct.Struct('<Q'),
+    ctypes.c_float: struct.Struct('<f'),
+    ctypes.c_double: struct.Struct('<d'),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _byte_array(length: int) -> type:
+    """
+    ctypes byte array type of the given length (pyads PLCTYPE_ARR_BYTE).
+
+    pyads allocates the receive buffer itself, so the array types are
+    cached for the lengths a monitor polls repeatedly instead of being
+    derived on every raw transfer.
+    """
+    return ctypes.c_ubyte * length
+
+
+def _is_string_type(plc_type: Any) -> bool:
+    """True for fixed-size char arrays (TwinCAT STRING(n))"""
+    return (
+        isinstance(plc_type, type)
+        and issubclass(plc_type, ctypes.Array)
+        and plc_type._type_ is ctypes.c_char
+    )
+
+# Routes already added by (AMS Net ID, IP), shared by all driver instances
+_ROUTE_CACHE: set[tuple[str, str]] = set()
+
+# Interval (seconds) of the optional keepalive state read
+KEEPALIVE_INTERVAL = 30.0
+
+# Longest time (seconds) the read coalescer holds a request open for company
+COALESCE_MAX_WAIT = 0.0005
+
+# Longest time (seconds) read_tag() waits for a coalesced read
+COALESCE_RESULT_TIMEOUT = 10.0
+
+# Result cache lifetimes (seconds)
+SYMBOL_LIST_TTL = 30.0
+DEVICE_INFO_TTL = 300.0
+
+# Process image index groups, indexed by MemoryArea value
+_INDEX_GROUPS = (
+    0x4021,  # INPUT   %I inputs
+    0x4022,  # OUTPUT  %Q outputs
+    0x4020,  # MEMORY  %M markers
+    None,    # DATA
+    None,    # TIMER
+    None,    # COUNTER
+    None,    # SPECIAL
+)
+
+# Symbol table upload (whole table in one transfer)
+ADSIGRP_SYM_UPLOAD = 0xF00B
+ADSIGRP_SYM_UPLOADINFO2 = 0xF00F
+
+# AdsSymbolEntry header: entryLength, iGroup, iOffs, size, dataType, flags,
+# nameLength, typeLength, commentLength
+_SYMBOL_ENTRY = struct.Struct('<6I3H')
+
+
+def _parse_symbol_table(blob: bytes) -> Iterator[dict[str, Any]]:
+    """Walk an ADSIGRP_SYM_UPLOAD blob, yielding one dict per symbol"""
+    view = memoryview(blob)
+    pos = 0
+    end = len(blob)
+
+    while pos + _SYMBOL_ENTRY.size <= end:
+        (entry_len, group, offset, size, _, _,
+         name_len, type_len, comment_len) = _SYMBOL_ENTRY.unpack_from(view, pos)
+        if entry_len == 0:
+            break
+
+        # Strings follow the header, each with a NUL terminator
+        text = pos + _SYMBOL_ENTRY.size
+        name = bytes(view[text:text + name_len]).decode('latin-1')
+        text += name_len + 1
+        type_name = bytes(view[text:text + type_len]).decode('latin-1')
+        text += type_len + 1
+        comment = bytes(view[text:text + comment_len]).decode('latin-1')
+
+        yield {
+            "name": name,
+            "plc_type": type_name,
+            "symbol_type": type_name,
+            "index_group": group,
+            "index_offset": offset,
+            "size": size,
+            "comment": comment,
+        }
+        pos += entry_len
+
+
+# PLCMode by ADS state number (ADSSTATE_* values from the ADS specification)
+_ADS_STATE_MODES = (
+    PLCMode.UNKNOWN,  # 0  INVALID
+    PLCMode.STOP,     # 1  IDLE
+    PLCMode.STOP,     # 2  RESET
+    PLCMode.STOP,     # 3  INIT
+    PLCMode.RUN,      # 4  START
+    PLCMode.RUN,      # 5  RUN
+    PLCMode.STOP,     # 6  STOP
+    PLCMode.UNKNOWN,  # 7  SAVECFG
+    PLCMode.UNKNOWN,  # 8  LOADCFG
+    PLCMode.UNKNOWN,  # 9  POWERFAILURE
+    PLCMode.UNKNOWN,  # 10 POWERGOOD
+    PLCMode.FAULT,    # 11 ERROR
+    PLCMode.UNKNOWN,  # 12 SHUTDOWN
+    PLCMode.UNKNOWN,  # 13 SUSPEND
+    PLCMode.UNKNOWN,  # 14 RESUME
+    PLCMode.PROGRAM,  # 15 CONFIG
+)
+
+
+def _raise_not_connected() -> None:
+    raise ConnectionError("Not connected")
+
+
+def _connected() -> None:
+    pass
+
+
+class ADSReadError(Exception):
+    """A coalesced variable read came back with bad quality"""
+
+
+class _ReadCoalescer:
+    """
+    Merges read_tag() calls from concurrent threads into sum commands.
+
+    A worker thread takes the first queued request, then waits up to an
+    adaptive window for more before issuing one batched read. The window
+    doubles (up to COALESCE_MAX_WAIT) while batches keep forming and
+    halves down to zero while requests arrive alone, so a single polling
+    thread is not slowed down.
+    """
+
+    _MIN_WAIT = 0.00005
+
+    def __init__(
+        self,
+        read_one: Callable[[str], TagValue],
+        read_many: Callable[[list[str]], list[TagValue]],
+        max_batch: int = ADS_SUM_CHUNK,
+        max_wait: float = COALESCE_MAX_WAIT,
+        last_error: Callable[[], str | None] = lambda: None,
+    ):
+        self._read_one = read_one
+        self._read_many = read_many
+        self._last_error = last_error
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._wait = max_wait
+        self._queue: queue.Queue[tuple[str, Future] | None] = queue.Queue()
+        # Guards _closed so no request is queued behind the stop sentinel
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ads-coalescer", daemon=True)
+        self._thread.start()
+
+    def submit(self, name: str) -> Future:
+        """Queue a read and return a future for its TagValue"""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("Not connected")
+            self._queue.put((name, future))
+        return future
+
+    def close(self) -> None:
+        """Stop the worker after the requests already queued"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _collect(self, first: tuple[str, Future]) -> tuple[list[tuple[str, Future]], bool]:
+        """Gather a batch starting with first; returns (batch, stop)"""
+        batch = [first]
+        deadline = time.monotonic() + self._wait
+
+        while len(batch) < self._max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+
+        if len(batch) > 1:
+            self._wait = min(max(self._wait * 2, self._MIN_WAIT), self._max_wait)
+        else:
+            self._wait = self._wait / 2 if self._wait > self._MIN_WAIT else 0.0
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stop = self._collect(first)
+
+            if len(batch) == 1:
+                name, future = batch[0]
+                try:
+                    future.set_result(self._read_one(name))
+                except Exception as e:
+                    future.set_exception(e)
+                continue
+
+            try:
+                tags = self._read_many([name for name, _ in batch])
+                results = list(zip(batch, tags, strict=True))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (name, future), tag in results:
+                if tag.quality == "good":
+                    future.set_result(tag)
+                else:
+                    future.set_exception(ADSReadError(f"Read error: {name}: {self._last_error()}"))
+
+        # Nothing should follow the sentinel, but never leave a caller waiting
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(ConnectionError("Not connected"))
+
 
 class BeckhoffADSDriver(PLCDevice):
     """
@@ -39,6 +315,16 @@ class BeckhoffADSDriver(PLCDevice):
     Uses symbolic variable access for reading/writing.
     """
 
+    __slots__ = (
+        '_plc', '_ams_net_id', '_ams_port', '_ip', '_symbol_cache',
+        '_handle_cache', '_executor', '_cache', '_coalescer',
+        '_notifications', '_last_values', '_require', '_keepalive',
+    )
+
+    # pyads module and its ADS error texts, loaded by _lazy_pyads()
+    _pyads = None
+    _ads_errors: frozenset[str] = frozenset()
+
     # TwinCAT ADS ports
     PORT_PLC_RUNTIME_1 = 851
     PORT_PLC_RUNTIME_2 = 852
@@ -56,6 +342,41 @@ class BeckhoffADSDriver(PLCDevice):
         self._ams_port: int = self.PORT_PLC_RUNTIME_1
         self._ip: str | None = None
 
+        # Resolved symbols and handles, so each name costs one lookup round trip
+        self._symbol_cache: OrderedDict[str, AdsSymbol] = OrderedDict()
+        self._handle_cache: dict[str, int] = {}
+
+        # pyads calls block, so async reads run on this pool (created on demand)
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Slow-changing query results: key -> (monotonic time, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+        # Set by connect(coalesce_reads=True)
+        self._coalescer: _ReadCoalescer | None = None
+
+        # Device notifications by tag: (notification handle, user handle),
+        # and the latest value each one delivered
+        self._notifications: dict[str, tuple[int, int]] = {}
+        self._last_values: dict[str, TagValue] = {}
+
+        # Connection guard called by every transfer method; connect() and
+        # disconnect() swap it so the connected path has no branch
+        self._require: Callable[[], None] = _raise_not_connected
+
+        # Set by connect(keepalive=True)
+        self._keepalive: threading.Timer | None = None
+
+    @classmethod
+    def _lazy_pyads(cls):
+        """Import pyads on first use"""
+        if cls._pyads is None:
+            import pyads
+            from pyads.errorcodes import ERROR_CODES
+            cls._ads_errors = frozenset(ERROR_CODES.values())
+            cls._pyads = pyads
+        return cls._pyads
+
     @property
     def vendor(self) -> str:
         return "Beckhoff"
@@ -64,7 +385,9 @@ class BeckhoffADSDriver(PLCDevice):
         self,
         ams_net_id: str,
         ip: str | None = None,
-        port: int = PORT_PLC_RUNTIME_1
+        port: int = PORT_PLC_RUNTIME_1,
+        coalesce_reads: bool = False,
+        keepalive: bool = False
     ) -> bool:
         """
         Connect to Beckhoff PLC via ADS.
@@ -73,22 +396,42 @@ class BeckhoffADSDriver(PLCDevice):
             ams_net_id: AMS Net ID (e.g., "192.168.1.10.1.1")
             ip: Optional IP address (uses route if not specified)
             port: ADS port (default 851 for PLC Runtime 1)
+            coalesce_reads: Merge read_tag() calls from concurrent threads
+                into sum commands (see _ReadCoalescer)
+            keepalive: Read the PLC state every KEEPALIVE_INTERVAL seconds
+                to hold the session and notice a lost connection early
         """
+        if self._plc is not None or self._coalescer is not None:
+            self.disconnect()
+
+        if ams_net_id != self._ams_net_id:
+            self._cache.clear()
         self._ams_net_id = ams_net_id
         self._ams_port = port
         self._ip = ip
 
         try:
-            # Add route if IP specified
-            if ip:
+            pyads = self._lazy_pyads()
+
+            # Add route if IP specified (once per process)
+            if ip and (ams_net_id, ip) not in _ROUTE_CACHE:
                 pyads.add_route(ams_net_id, ip)
+                _ROUTE_CACHE.add((ams_net_id, ip))
 
             self._plc = pyads.Connection(ams_net_id, port)
             self._plc.open()
             self._connected = True
+            self._require = _connected
 
-            # Read device info
-            self._device_info = self._read_device_info()
+            # Read device info (cached across reconnects to the same target)
+            self._device_info = self._cached("device_info", DEVICE_INFO_TTL, self._read_device_info)
+
+            if coalesce_reads:
+                self._coalescer = _ReadCoalescer(
+                    self._read_symbol, self.read_tags, last_error=lambda: self._last_error
+                )
+            if keepalive:
+                self._schedule_keepalive()
 
             return True
         except Exception as e:
@@ -96,15 +439,93 @@ class BeckhoffADSDriver(PLCDevice):
             self._connected = False
             return False
 
+    def _schedule_keepalive(self) -> None:
+        """Arm the next keepalive state read"""
+        self._keepalive = threading.Timer(KEEPALIVE_INTERVAL, self._keepalive_tick)
+        self._keepalive.daemon = True
+        self._keepalive.start()
+
+    def _keepalive_tick(self) -> None:
+        """Read the PLC state; mark the driver disconnected if it fails"""
+        plc = self._plc
+        if plc is None or not self._connected:
+            return
+
+        try:
+            plc.read_state()
+        except Exception as e:
+            self._last_error = f"Connection lost: {e}"
+            self._connected = False
+            self._require = _raise_not_connected
+            return
+
+        self._schedule_keepalive()
+
     def disconnect(self) -> None:
         """Disconnect from PLC."""
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            self._keepalive = None
+        for tag_name in list(self._notifications):
+            self.unsubscribe_tag(tag_name)
+        if self._coalescer is not None:
+            self._coalescer.close()
+            self._coalescer = None
         if self._plc:
+            for handle in self._handle_cache.values():
+                try:
+                    self._plc.release_handle(handle)
+                except Exception:
+                    pass
             try:
                 self._plc.close()
             except:
                 pass
             self._plc = None
         self._connected = False
+        self._require = _raise_not_connected
+        self._symbol_cache.clear()
+        self._handle_cache.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        # Keep device info for a reconnect; connect() drops it if the target changes
+        device_info = self._cache.get("device_info")
+        self._cache.clear()
+        if device_info is not None:
+            self._cache["device_info"] = device_info
+
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn() from the result cache if it is younger than ttl"""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        value = fn()
+        self._cache[key] = (now, value)
+        return value
+
+    def _get_symbol(self, name: str) -> "AdsSymbol":
+        """Get a symbol, resolving it on the PLC only on first use"""
+        symbol = self._symbol_cache.get(name)
+        if symbol is not None:
+            self._symbol_cache.move_to_end(name)
+            return symbol
+
+        symbol = self._plc.get_symbol(name)
+        self._symbol_cache[name] = symbol
+        if len(self._symbol_cache) > SYMBOL_CACHE_SIZE:
+            self._symbol_cache.popitem(last=False)
+        return symbol
+
+    def _get_handle(self, name: str) -> int:
+        """Get a variable handle (ADSIGRP_SYM_HNDBYNAME), cached per connection"""
+        handle = self._handle_cache.get(name)
+        if handle is None:
+            handle = self._plc.get_handle(name)
+            self._handle_cache[name] = handle
+        return handle
 
     def _read_device_info(self) -> DeviceInfo:
         """Read device information via ADS."""
@@ -114,8 +535,9 @@ class BeckhoffADSDriver(PLCDevice):
                 return DeviceInfo(
                     vendor="Beckhoff",
                     model=info.name,
-                    firmware_version=f"{info.version.version}.{info.version.revision}.{info.version.build}",
-                    serial_number="",
+                    firmware=f"{info.version.version}.{info.version.revision}.{info.version.build}",
+                    serial="",
+                    name=info.name,
                     ip_address=self._ip or "",
                 )
         except Exception:
@@ -124,8 +546,9 @@ class BeckhoffADSDriver(PLCDevice):
         return DeviceInfo(
             vendor="Beckhoff",
             model="TwinCAT",
-            firmware_version="",
-            serial_number="",
+            firmware="",
+            serial="",
+            name="",
             ip_address=self._ip or "",
         )
 
@@ -133,14 +556,16 @@ class BeckhoffADSDriver(PLCDevice):
         """Get device information."""
         if self._device_info:
             return self._device_info
-        return self._read_device_info()
+        return self._cached("device_info", DEVICE_INFO_TTL, self._read_device_info)
 
     def get_protection_status(self) -> ProtectionStatus:
         """Get protection status."""
-        return ProtectionStatus(
-            protection_level=0,
-            password_protected=False,
-        )
+        return self._cached("protection", DEVICE_INFO_TTL, lambda: ProtectionStatus(
+            cpu_protected=False,
+            project_protected=False,
+            block_protected=False,
+            access_level=AccessLevel.FULL,
+        ))
 
     def read_memory(self, area: MemoryArea, start: int, length: int) -> bytes:
         """
@@ -151,38 +576,32 @@ class BeckhoffADSDriver(PLCDevice):
         - 0x4021: %I area (inputs)
         - 0x4022: %Q area (outputs)
         """
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
 
-        index_groups = {
-            MemoryArea.MEMORY: 0x4020,
-            MemoryArea.INPUT: 0x4021,
-            MemoryArea.OUTPUT: 0x4022,
-        }
-
-        ig = index_groups.get(area)
+        ig = _INDEX_GROUPS[area]
         if ig is None:
             raise ValueError(f"Unsupported memory area: {area}")
 
-        return self._plc.read(ig, start, pyads.PLCTYPE_ARR_BYTE(length))
+        # return_ctypes gives the raw byte array instead of a list of ints
+        return bytes(self._plc.read(
+            ig, start, _byte_array(length), return_ctypes=True
+        ))
 
-    def write_memory(self, area: MemoryArea, start: int, data: bytes) -> bool:
-        """Write memory by index group/offset."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
-
-        index_groups = {
-            MemoryArea.MEMORY: 0x4020,
-            MemoryArea.INPUT: 0x4021,
-            MemoryArea.OUTPUT: 0x4022,
-        }
+    def write_memory(
+        self,
+        area: MemoryArea,
+        start: int,
+        data: bytes | bytearray | memoryview
+    ) -> bool:
+        """Write memory by index group/offset (any bytes-like buffer)."""
+        self._require()
 
-        ig = index_groups.get(area)
+        ig = _INDEX_GROUPS[area]
         if ig is None:
             raise ValueError(f"Unsupported memory area: {area}")
 
         try:
-            self._plc.write(ig, start, data, pyads.PLCTYPE_ARR_BYTE(len(data)))
+            self._plc.write(ig, start, data, _byte_array(len(data)))
             return True
         except Exception as e:
             self._last_error = str(e)
@@ -190,12 +609,36 @@ class BeckhoffADSDriver(PLCDevice):
 
     def read_tag(self, tag_name: str) -> TagValue:
         """Read variable by symbolic name."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
+
+        # Subscribed tags are pushed by the PLC; no round trip needed
+        pushed = self._last_values.get(tag_name)
+        if pushed is not None:
+            return pushed
+
+        if self._coalescer is not None:
+            return self._coalescer.submit(tag_name).result(timeout=COALESCE_RESULT_TIMEOUT)
+        return self._read_symbol(tag_name)
+
+    def _read_symbol(self, tag_name: str) -> TagValue:
+        """
+        Read one variable through its (cached) symbol.
 
+        Scalars and strings are read as raw bytes and decoded with the
+        precompiled _TYPE_STRUCTS entry; other types use symbol.read().
+        """
         try:
-            symbol = self._plc.get_symbol(tag_name)
-            value = symbol.read()
+            symbol = self._get_symbol(tag_name)
+            plc_type = symbol.plc_type
+            decoder = _TYPE_STRUCTS.get(plc_type)
+
+            if decoder is not None:
+                value = decoder.unpack_from(self._read_raw(symbol, decoder.size))[0]
+            elif _is_string_type(plc_type):
+                raw = self._read_raw(symbol, ctypes.sizeof(plc_type))
+                value = raw.split(b'\x00', 1)[0].decode('latin-1')
+            else:
+                value = symbol.read()
 
             return TagValue(
                 name=tag_name,
@@ -207,39 +650,271 @@ class BeckhoffADSDriver(PLCDevice):
             self._last_error = str(e)
             raise
 
+    def _read_raw(self, symbol: "AdsSymbol", size: int) -> bytes:
+        """Read size bytes at a symbol's index group/offset"""
+        return bytes(self._plc.read(
+            symbol.index_group,
+            symbol.index_offset,
+            _byte_array(size),
+            return_ctypes=True,
+        ))
+
     def write_tag(self, tag_name: str, value: Any) -> bool:
         """Write variable by symbolic name."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
 
         try:
-            symbol = self._plc.get_symbol(tag_name)
+            symbol = self._get_symbol(tag_name)
             symbol.write(value)
             return True
         except Exception as e:
             self._last_error = str(e)
             return False
 
+    def _plan_merged_reads(
+        self,
+        tag_names: list[str]
+    ) -> tuple[list[tuple[int, int, int, list[tuple[int, str]]]], list[str]]:
+        """
+        Group already-resolved symbols into contiguous byte ranges.
+
+        Returns:
+            (ranges, rest): ranges as (index_group, start, length,
+            [(offset, name), ...]); rest are names left for sum commands
+        """
+        by_group: dict[int, list[tuple[int, int, str]]] = {}
+
+        for name in dict.fromkeys(tag_names):
+            symbol = self._symbol_cache.get(name)
+            decoder = _TYPE_STRUCTS.get(symbol.plc_type) if symbol is not None else None
+            if decoder is None:
+                continue
+            by_group.setdefault(symbol.index_group, []).append(
+                (symbol.index_offset, decoder.size, name)
+            )
+
+        ranges = []
+        for group, items in by_group.items():
+            items.sort()
+            run: list[tuple[int, str]] = []
+            start = end = 0
+
+            for offset, size, name in items + [(None, 0, "")]:
+                if run and (offset is None or offset > end + ADS_MERGE_GAP):
+                    if len(run) >= ADS_MERGE_MIN_TAGS:
+                        ranges.append((group, start, end - start, run))
+                    run = []
+                if offset is None:
+                    break
+                if not run:
+                    start = end = offset
+                run.append((offset, name))
+                end = max(end, offset + size)
+
+        # Keep the caller's order for the sum command
+        merged = {name for _, _, _, run in ranges for _, name in run}
+        return ranges, [name for name in dict.fromkeys(tag_names) if name not in merged]
+
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple variables with ADS sum commands (optimized).
+
+        Runs of at least ADS_MERGE_MIN_TAGS adjacent, already-resolved
+        symbols are read as one byte range and decoded locally. All other
+        names go out in one ADSIGRP_SUMUP_READ request (pyads splits it
+        further only above its sub-command limit) instead of one round
+        trip per tag. Failed variables are returned with bad quality.
+        """
+        self._require()
+
+        if len(tag_names) < 2:
+            return [self._read_symbol(name) for name in tag_names]
+
+        ranges, rest = self._plan_merged_reads(tag_names)
+        results: dict[str, tuple[Any, str]] = {}
+
+        for group, start, length, run in ranges:
+            try:
+                raw = bytes(self._plc.read(
+                    group, start, _byte_array(length), return_ctypes=True
+                ))
+            except Exception as e:
+                self._last_error = str(e)
+                continue
+            for offset, name in run:
+                plc_type = self._symbol_cache[name].plc_type
+                results[name] = (
+                    _TYPE_STRUCTS[plc_type].unpack_from(raw, offset - start)[0],
+                    str(plc_type),
+                )
+
+        if rest:
+            try:
+                for name, value in self._plc.read_list_by_name(rest).items():
+                    # pyads reports per-variable failures as the ADS error text
+                    if not (isinstance(value, str) and value in self._ads_errors):
+                        results[name] = (value, type(value).__name__)
+            except Exception as e:
+                self._last_error = str(e)
+
+        timestamp_ns = time.time_ns()
+        tag_values = []
+        for name in tag_names:
+            result = results.get(name)
+            tag_values.append(TagValue(
+                name=name,
+                value=result[0] if result else None,
+                data_type=result[1] if result else "Unknown",
+                address=name,
+                quality="good" if result else "bad",
+                timestamp_ns=timestamp_ns,
+            ))
+
+        return tag_values
+
+    def iter_read_tags(self, tag_names: Iterable[str]) -> Iterator[TagValue]:
+        """
+        Read variables lazily, one sum command of ADS_SUM_CHUNK names at a time.
+
+        Only the current chunk's results are held in memory.
+        """
+        names = iter(tag_names)
+        while chunk := list(itertools.islice(names, ADS_SUM_CHUNK)):
+            yield from self.read_tags(chunk)
+
+    async def read_tags_async(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple variables without blocking the event loop.
+
+        Names are split into sum commands of ADS_SUM_CHUNK variables that
+        are submitted together from a worker pool, so the PLC pipelines
+        them instead of answering one request per round trip.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=ADS_ASYNC_WORKERS, thread_name_prefix="ads-read"
+            )
+
+        loop = asyncio.get_running_loop()
+        chunks = [
+            tag_names[i:i + ADS_SUM_CHUNK]
+            for i in range(0, len(tag_names), ADS_SUM_CHUNK)
+        ]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self.read_tags, chunk)
+            for chunk in chunks
+        ))
+        return [tag for chunk_result in results for tag in chunk_result]
+
+    def write_tags(self, tags: dict[str, Any]) -> bool:
+        """
+        Write multiple variables with one ADSIGRP_SUMUP_WRITE request (optimized).
+
+        Returns False if any variable failed; the first error is kept in
+        last_error.
+        """
+        if len(tags) < 2:
+            return super().write_tags(tags)
+
+        self._require()
+
+        try:
+            results = self._plc.write_list_by_name(tags)
+        except Exception as e:
+            self._last_error = str(e)
+            return False
+
+        errors = [f"{name}: {status}" for name, status in results.items() if status != "no error"]
+        if errors:
+            self._last_error = errors[0]
+            return False
+        return True
+
+    def subscribe_tag(
+        self,
+        tag_name: str,
+        callback: Callable[[str, TagValue], None] | None = None,
+        cycle_ms: int = 100,
+        on_change: bool = True
+    ) -> tuple[int, int]:
+        """
+        Subscribe to a variable with an ADS device notification.
+
+        The PLC pushes the value on change (or every cycle_ms when
+        on_change is False), so read_tag() answers from the last pushed
+        value instead of polling.
+
+        Args:
+            tag_name: Variable name
+            callback: Optional callback(tag_name, value) per notification
+            cycle_ms: Check interval (on change) or send interval (cyclic)
+            on_change: Notify only when the value changes
+
+        Returns:
+            (notification handle, user handle)
+        """
+        self._require()
+
+        if tag_name in self._notifications:
+            return self._notifications[tag_name]
+
+        symbol = self._get_symbol(tag_name)
+        data_type = str(symbol.plc_type)
+
+        @self._plc.notification(symbol.plc_type)
+        def on_notification(handle, name, timestamp, value):
+            tag = TagValue(
+                name=tag_name,
+                value=value,
+                data_type=data_type,
+                address=tag_name,
+                timestamp=timestamp,
+            )
+            self._last_values[tag_name] = tag
+            if callback:
+                callback(tag_name, tag)
+
+        pyads = self._pyads
+        attrib = pyads.NotificationAttrib(
+            length=ctypes.sizeof(symbol.plc_type),
+            trans_mode=pyads.ADSTRANS_SERVERONCHA if on_change else pyads.ADSTRANS_SERVERCYCLE,
+            max_delay=cycle_ms,
+            cycle_time=cycle_ms,
+        )
+        handles = self._plc.add_device_notification(tag_name, attrib, on_notification)
+        self._notifications[tag_name] = handles
+        return handles
+
+    def unsubscribe_tag(self, tag_name: str) -> None:
+        """Remove a subscription made with subscribe_tag()"""
+        handles = self._notifications.pop(tag_name, None)
+        self._last_values.pop(tag_name, None)
+        if handles is None or not self._plc:
+            return
+
+        try:
+            self._plc.del_device_notification(*handles)
+        except Exception as e:
+            self._last_error = str(e)
+
     def read_by_name(self, name: str, plc_type: Any) -> Any:
         """Read by name with explicit type."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
 
-        return self._plc.read_by_name(name, plc_type)
+        # Reading by handle (ADSIGRP_SYM_VALBYHND) skips the name lookup
+        return self._plc.read_by_name("", plc_type, handle=self._get_handle(name))
 
     def write_by_name(self, name: str, value: Any, plc_type: Any) -> None:
         """Write by name with explicit type."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
 
-        self._plc.write_by_name(name, value, plc_type)
+        self._plc.write_by_name("", value, plc_type, handle=self._get_handle(name))
 
     def get_symbol_info(self, name: str) -> dict[str, Any]:
         """Get symbol information."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
+        self._require()
 
-        symbol = self._plc.get_symbol(name)
+        symbol = self._get_symbol(name)
         return {
             "name": symbol.name,
             "index_group": symbol.index_group,
@@ -249,19 +924,34 @@ class BeckhoffADSDriver(PLCDevice):
             "comment": symbol.comment,
         }
 
+    def _upload_symbol_table(self) -> bytes:
+        """Upload the complete symbol table in one ADS transfer"""
+        info = bytes(self._plc.read(
+            ADSIGRP_SYM_UPLOADINFO2, 0, _byte_array(24), return_ctypes=True
+        ))
+        _, table_size = struct.unpack_from('<2I', info)
+        if table_size == 0:
+            return b''
+
+        return bytes(self._plc.read(
+            ADSIGRP_SYM_UPLOAD, 0, _byte_array(table_size), return_ctypes=True
+        ))
+
+    def iter_symbols(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all symbols in PLC.
+
+        The raw symbol table is cached for SYMBOL_LIST_TTL seconds and
+        parsed on demand.
+        """
+        self._require()
+
+        blob = self._cached("symbols", SYMBOL_LIST_TTL, self._upload_symbol_table)
+        return _parse_symbol_table(blob)
+
     def list_symbols(self) -> list[dict[str, Any]]:
         """List all symbols in PLC."""
-        if not self._plc or not self._connected:
-            raise ConnectionError("Not connected")
-
-        symbols = []
-        for symbol in self._plc.get_all_symbols():
-            symbols.append({
-                "name": symbol.name,
-                "plc_type": str(symbol.plc_type),
-                "symbol_type": symbol.symbol_type,
-            })
-        return symbols
+        return list(self.iter_symbols())
 
     def authenticate(self, password: str) -> bool:
         """Authenticate (not typically required for ADS)."""
@@ -286,6 +976,7 @@ class BeckhoffADSDriver(PLCDevice):
 
     def download_program(self, program: PLCProgram) -> bool:
         """Download program."""
+        self._cache.clear()
         return False
 
     def get_mode(self) -> PLCMode:
@@ -294,19 +985,10 @@ class BeckhoffADSDriver(PLCDevice):
             return PLCMode.UNKNOWN
 
         try:
-            state = self._plc.read_state()
-            state_map = {
-                pyads.ADSSTATE_INVALID: PLCMode.UNKNOWN,
-                pyads.ADSSTATE_IDLE: PLCMode.STOP,
-                pyads.ADSSTATE_RESET: PLCMode.STOP,
-                pyads.ADSSTATE_INIT: PLCMode.STOP,
-                pyads.ADSSTATE_START: PLCMode.RUN,
-                pyads.ADSSTATE_RUN: PLCMode.RUN,
-                pyads.ADSSTATE_STOP: PLCMode.STOP,
-                pyads.ADSSTATE_CONFIG: PLCMode.PROGRAM,
-                pyads.ADSSTATE_ERROR: PLCMode.FAULT,
-            }
-            return state_map.get(state[0], PLCMode.UNKNOWN)
+            state = self._plc.read_state()[0]
+            if 0 <= state < len(_ADS_STATE_MODES):
+                return _ADS_STATE_MODES[state]
+            return PLCMode.UNKNOWN
         except Exception:
             return PLCMode.UNKNOWN
 
@@ -315,11 +997,12 @@ class BeckhoffADSDriver(PLCDevice):
         if not self._plc or not self._connected:
             return False
 
+        self._cache.clear()
         try:
             if mode == PLCMode.RUN:
-                self._plc.write_control(pyads.ADSSTATE_RUN, 0, 0)
+                self._plc.write_control(self._pyads.ADSSTATE_RUN, 0, 0)
             elif mode == PLCMode.STOP:
-                self._plc.write_control(pyads.ADSSTATE_STOP, 0, 0)
+                self._plc.write_control(self._pyads.ADSSTATE_STOP, 0, 0)
             return True
         except Exception as e:
             self._last_error = str(e)
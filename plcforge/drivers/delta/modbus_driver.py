@@ -5,8 +5,16 @@ Supports Delta DVP PLCs using Modbus TCP/RTU protocol.
 Uses pymodbus library for communication.
 """
 
+import functools
+import re
+import socket
 import struct
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 try:
@@ -28,8 +36,34 @@ from plcforge.drivers.base import (
     PLCProgram,
     ProtectionStatus,
     TagValue,
+    coalesce_ranges,
+    pack_bits,
+    unpack_bits,
 )
 
+_ADDRESS_RE = re.compile(r'([DMXYTCS])(\d+)')
+
+
+@functools.lru_cache(maxsize=64)
+def _be_words(count: int) -> struct.Struct:
+    """Precompiled big-endian format for count registers"""
+    return struct.Struct(f'>{count}H')
+
+
+@dataclass
+class _PooledClient:
+    """Modbus TCP client shared by every driver connected to one host:port"""
+    client: Any
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    refs: int = 0
+
+
+# Gateways often accept only 2-4 TCP connections, so drivers for the same
+# host:port (e.g. different unit IDs behind one RTU gateway) share a client.
+# The per-client lock serializes PDUs since the sync client cannot multiplex.
+_CLIENT_POOL: dict[tuple[str, int], _PooledClient] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
 
 class DeltaDVPDriver(PLCDevice):
     """
@@ -64,6 +98,29 @@ class DeltaDVPDriver(PLCDevice):
     HOLDING_T_BASE = 0x0600   # T timer values
     HOLDING_C_BASE = 0x0E00   # C counter values
 
+    # Area letter -> (Modbus base, data type, is_bit, address radix)
+    _AREA_TABLE = {
+        'D': (HOLDING_D_BASE, 'WORD', False, 10),
+        'M': (COIL_M_BASE, 'BOOL', True, 10),
+        'X': (COIL_X_BASE, 'BOOL', True, 8),    # Octal addressing
+        'Y': (COIL_Y_BASE, 'BOOL', True, 8),    # Octal addressing
+        'T': (HOLDING_T_BASE, 'WORD', False, 10),
+        'C': (HOLDING_C_BASE, 'WORD', False, 10),
+        'S': (COIL_S_BASE, 'BOOL', True, 10),
+    }
+
+    # Modbus PDU limits for a single request
+    MAX_READ_REGISTERS = 125
+    MAX_READ_COILS = 2000
+    MAX_WRITE_REGISTERS = 123
+    MAX_WRITE_COILS = 1968
+
+    # Holes of up to READ_GAP addresses are read and discarded in read_tags
+    READ_GAP = 8
+
+    # Seconds a get_mode() result is reused (diagnostics are polled often)
+    MODE_TTL = 1.0
+
     def __init__(self):
         super().__init__()
         if not PYMODBUS_AVAILABLE:
@@ -76,6 +133,11 @@ class DeltaDVPDriver(PLCDevice):
         self._port: int = 502
         self._unit_id: int = 1
         self._connection_type: str = "tcp"
+        self._read_gap: int = self.READ_GAP
+        self._pool_key: tuple[str, int] | None = None
+        self._lock = threading.Lock()
+        self._mode_cache: tuple[float, PLCMode] | None = None
+        self._d9046_enabled: bool = False
 
     def connect(self, ip: str, **kwargs) -> bool:
         """
@@ -86,22 +148,38 @@ class DeltaDVPDriver(PLCDevice):
             port: TCP port (default 502)
             unit_id: Modbus unit ID (default 1)
             connection_type: "tcp" or "rtu"
+            read_gap: Largest address hole merged by read_tags (default 8)
+            enable_d9046: Use D9046 for run/stop and mode (default False;
+                not every model exposes it)
 
         Returns:
             True if connected
         """
+        if self._client:
+            self.disconnect()
+
         self._ip = ip
         self._port = kwargs.get('port', 502)
         self._unit_id = kwargs.get('unit_id', 1)
         self._connection_type = kwargs.get('connection_type', 'tcp')
+        self._read_gap = kwargs.get('read_gap', self.READ_GAP)
+        self._d9046_enabled = kwargs.get('enable_d9046', False)
 
         try:
             if self._connection_type == 'tcp':
-                self._client = ModbusTcpClient(
-                    host=ip,
-                    port=self._port,
-                    timeout=5
-                )
+                self._pool_key = (ip, self._port)
+                with _CLIENT_POOL_LOCK:
+                    pooled = _CLIENT_POOL.get(self._pool_key)
+                    if pooled is None:
+                        pooled = _PooledClient(ModbusTcpClient(
+                            host=ip,
+                            port=self._port,
+                            timeout=5
+                        ))
+                        _CLIENT_POOL[self._pool_key] = pooled
+                    pooled.refs += 1
+                self._client = pooled.client
+                self._lock = pooled.lock
             else:
                 # Serial/RTU connection
                 baudrate = kwargs.get('baudrate', 9600)
@@ -113,27 +191,50 @@ class DeltaDVPDriver(PLCDevice):
                     bytesize=8,
                     timeout=3
                 )
+                self._lock = threading.Lock()
+
+            with self._lock:
+                self._connected = self._client.connect()
 
-            self._connected = self._client.connect()
+            if self._connected and self._connection_type == 'tcp':
+                # Modbus polls are small request/response PDUs; disable Nagle
+                sock = getattr(self._client, 'socket', None)
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             if self._connected:
                 self._device_info = self._read_device_info()
+            else:
+                self.disconnect()
 
             return self._connected
         except Exception as e:
             self._last_error = str(e)
-            self._connected = False
+            self.disconnect()
             return False
 
     def disconnect(self) -> None:
-        """Disconnect from PLC"""
-        if self._client:
+        """Disconnect from PLC, closing the client once no driver shares it"""
+        client, self._client = self._client, None
+        self._connected = False
+        self._mode_cache = None
+
+        if self._pool_key is not None:
+            with _CLIENT_POOL_LOCK:
+                pooled = _CLIENT_POOL.get(self._pool_key)
+                if pooled is not None and pooled.client is client:
+                    pooled.refs -= 1
+                    if pooled.refs > 0:
+                        client = None
+                    else:
+                        del _CLIENT_POOL[self._pool_key]
+            self._pool_key = None
+
+        if client:
             try:
-                self._client.close()
+                client.close()
             except Exception:
                 pass
-            self._client = None
-        self._connected = False
 
     def _read_device_info(self) -> DeviceInfo:
         """Read device information"""
@@ -169,55 +270,34 @@ class DeltaDVPDriver(PLCDevice):
         )
 
     def read_memory(self, area: MemoryArea, address: int, count: int) -> bytes:
-        """Read raw memory"""
+        """
+        Read raw memory.
+
+        DATA returns count big-endian registers. Coil areas read count * 8
+        coils and return them packed 8 per byte, LSB first. Reads larger
+        than one Modbus request allows are split transparently.
+        """
         try:
             if area == MemoryArea.DATA:
                 # D registers (holding registers)
-                result = self._client.read_holding_registers(
-                    self.HOLDING_D_BASE + address,
-                    count,
-                    slave=self._unit_id
-                )
-                if result.isError():
-                    raise Exception(str(result))
-                # Convert registers to bytes
-                data = b''
-                for reg in result.registers:
-                    data += struct.pack('>H', reg)
-                return data
+                registers = self._read_span(False, self.HOLDING_D_BASE + address, count)
+                # Convert registers to big-endian bytes
+                return _be_words(len(registers)).pack(*registers)
 
             elif area == MemoryArea.INPUT:
                 # X inputs (coils)
-                result = self._client.read_coils(
-                    self.COIL_X_BASE + address,
-                    count * 8,  # count in bits
-                    slave=self._unit_id
-                )
-                if result.isError():
-                    raise Exception(str(result))
-                return bytes(result.bits[:count])
+                bits = self._read_span(True, self.COIL_X_BASE + address, count * 8)
+                return pack_bits(bits, count)
 
             elif area == MemoryArea.OUTPUT:
                 # Y outputs (coils)
-                result = self._client.read_coils(
-                    self.COIL_Y_BASE + address,
-                    count * 8,
-                    slave=self._unit_id
-                )
-                if result.isError():
-                    raise Exception(str(result))
-                return bytes(result.bits[:count])
+                bits = self._read_span(True, self.COIL_Y_BASE + address, count * 8)
+                return pack_bits(bits, count)
 
             elif area == MemoryArea.MEMORY:
                 # M auxiliary relays (coils)
-                result = self._client.read_coils(
-                    self.COIL_M_BASE + address,
-                    count * 8,
-                    slave=self._unit_id
-                )
-                if result.isError():
-                    raise Exception(str(result))
-                return bytes(result.bits[:count])
+                bits = self._read_span(True, self.COIL_M_BASE + address, count * 8)
+                return pack_bits(bits, count)
 
             else:
                 raise ValueError(f"Unsupported memory area: {area}")
@@ -226,45 +306,55 @@ class DeltaDVPDriver(PLCDevice):
             self._last_error = str(e)
             raise
 
+    def _read_span(self, is_bit: bool, start: int, count: int) -> list:
+        """
+        Read count coils or holding registers from start.
+
+        Split into requests of at most MAX_READ_COILS / MAX_READ_REGISTERS.
+        """
+        limit = self.MAX_READ_COILS if is_bit else self.MAX_READ_REGISTERS
+        values: list = []
+
+        for offset in range(0, count, limit):
+            size = min(limit, count - offset)
+            with self._lock:
+                if is_bit:
+                    result = self._client.read_coils(start + offset, size, slave=self._unit_id)
+                else:
+                    result = self._client.read_holding_registers(
+                        start + offset, size, slave=self._unit_id
+                    )
+            if result.isError():
+                raise Exception(str(result))
+            # Coil responses are padded to whole bytes
+            values += result.bits[:size] if is_bit else result.registers
+
+        return values
+
     def write_memory(self, area: MemoryArea, address: int, data: bytes) -> bool:
-        """Write raw memory"""
+        """
+        Write raw memory.
+
+        Coil areas take packed bits (8 coils per byte, LSB first), the
+        same layout read_memory returns. Writes larger than one Modbus
+        request allows are split transparently.
+        """
         try:
             if area == MemoryArea.DATA:
                 # D registers
-                # Convert bytes to registers
-                registers = []
-                for i in range(0, len(data), 2):
-                    if i + 1 < len(data):
-                        registers.append(struct.unpack('>H', data[i:i+2])[0])
-                    else:
-                        registers.append(data[i])
-
-                result = self._client.write_registers(
-                    self.HOLDING_D_BASE + address,
-                    registers,
-                    slave=self._unit_id
-                )
-                return not result.isError()
+                # Convert bytes to registers, zero-padding an odd tail byte
+                if len(data) % 2:
+                    data = bytes(data) + b'\x00'
+                registers = list(_be_words(len(data) // 2).unpack(data))
+                return self._write_span(False, self.HOLDING_D_BASE + address, registers)
 
             elif area == MemoryArea.OUTPUT:
                 # Y outputs
-                bits = [bool(b) for b in data]
-                result = self._client.write_coils(
-                    self.COIL_Y_BASE + address,
-                    bits,
-                    slave=self._unit_id
-                )
-                return not result.isError()
+                return self._write_span(True, self.COIL_Y_BASE + address, unpack_bits(data))
 
             elif area == MemoryArea.MEMORY:
                 # M relays
-                bits = [bool(b) for b in data]
-                result = self._client.write_coils(
-                    self.COIL_M_BASE + address,
-                    bits,
-                    slave=self._unit_id
-                )
-                return not result.isError()
+                return self._write_span(True, self.COIL_M_BASE + address, unpack_bits(data))
 
             else:
                 self._last_error = f"Cannot write to area: {area}"
@@ -274,6 +364,29 @@ class DeltaDVPDriver(PLCDevice):
             self._last_error = str(e)
             return False
 
+    def _write_span(self, is_bit: bool, start: int, values: list) -> bool:
+        """
+        Write coils or holding registers from start.
+
+        Split into requests of at most MAX_WRITE_COILS / MAX_WRITE_REGISTERS.
+        """
+        limit = self.MAX_WRITE_COILS if is_bit else self.MAX_WRITE_REGISTERS
+
+        for offset in range(0, len(values), limit):
+            chunk = values[offset:offset + limit]
+            with self._lock:
+                if is_bit:
+                    result = self._client.write_coils(start + offset, chunk, slave=self._unit_id)
+                else:
+                    result = self._client.write_registers(
+                        start + offset, chunk, slave=self._unit_id
+                    )
+            if result.isError():
+                self._last_error = str(result)
+                return False
+
+        return True
+
     def read_tag(self, tag_name: str) -> TagValue:
         """
         Read by Delta address format.
@@ -288,11 +401,13 @@ class DeltaDVPDriver(PLCDevice):
         """
         try:
             addr_info = self._parse_address(tag_name)
-            value = self._read_by_type(addr_info)
+            values = self._read_coalesced({tag_name: addr_info})
+            if tag_name not in values:
+                raise Exception(self._last_error)
 
             return TagValue(
                 name=tag_name,
-                value=value,
+                value=values[tag_name],
                 data_type=addr_info['type'],
                 address=tag_name,
                 timestamp=datetime.now(),
@@ -301,6 +416,66 @@ class DeltaDVPDriver(PLCDevice):
             self._last_error = str(e)
             raise
 
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags with one Modbus request per address run.
+
+        Registers and coils are sorted by Modbus address and merged into
+        runs (holes up to the configured read gap are read and dropped),
+        so N adjacent tags cost ceil(N / 125) register reads instead of N.
+        """
+        parsed: dict[str, Mapping[str, Any]] = {}
+        for name in dict.fromkeys(tag_names):
+            try:
+                parsed[name] = self._parse_address(name)
+            except ValueError as e:
+                self._last_error = str(e)
+
+        values = self._read_coalesced(parsed)
+        timestamp_ns = time.time_ns()
+
+        tag_values = []
+        for name in tag_names:
+            addr_info = parsed.get(name)
+            good = name in values
+            tag_values.append(TagValue(
+                name=name,
+                value=values[name] if good else None,
+                data_type=addr_info['type'] if addr_info else "Unknown",
+                address=name,
+                quality="good" if good else "bad",
+                timestamp_ns=timestamp_ns,
+            ))
+        return tag_values
+
+    def _read_coalesced(self, parsed: dict[str, Mapping[str, Any]]) -> dict[str, Any]:
+        """
+        Read parsed addresses, one request per coalesced range.
+
+        Returns:
+            Values by tag name; tags in failed ranges are omitted and the
+            error is left in _last_error
+        """
+        values: dict[str, Any] = {}
+
+        for is_bit, limit in ((False, self.MAX_READ_REGISTERS), (True, self.MAX_READ_COILS)):
+            points = [
+                (addr_info['modbus_addr'], name)
+                for name, addr_info in parsed.items()
+                if addr_info['is_bit'] is is_bit
+            ]
+            for start, count, members in coalesce_ranges(points, self._read_gap, limit):
+                try:
+                    data = self._read_span(is_bit, start, count)
+                except Exception as e:
+                    self._last_error = str(e)
+                    continue
+
+                for address, name in members:
+                    values[name] = data[address - start]
+
+        return values
+
     def write_tag(self, tag_name: str, value: Any) -> bool:
         """Write by Delta address format"""
         try:
@@ -310,120 +485,46 @@ class DeltaDVPDriver(PLCDevice):
             self._last_error = str(e)
             return False
 
-    def _parse_address(self, address: str) -> dict[str, Any]:
-        """Parse Delta address format"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_address(address: str) -> Mapping[str, Any]:
+        """Parse Delta address format (cached, result is read-only)"""
         address = address.upper().strip()
-        result = {
-            'area': None,
-            'address': 0,
-            'type': 'WORD',
-            'modbus_addr': 0,
-            'is_bit': False,
-        }
-
-        if address.startswith('D'):
-            # Data register
-            result['area'] = 'D'
-            result['address'] = int(address[1:])
-            result['modbus_addr'] = self.HOLDING_D_BASE + result['address']
-            result['type'] = 'WORD'
-
-        elif address.startswith('M'):
-            # Auxiliary relay
-            result['area'] = 'M'
-            result['address'] = int(address[1:])
-            result['modbus_addr'] = self.COIL_M_BASE + result['address']
-            result['type'] = 'BOOL'
-            result['is_bit'] = True
-
-        elif address.startswith('X'):
-            # Input (octal addressing)
-            result['area'] = 'X'
-            # Convert octal to decimal
-            addr_str = address[1:]
-            if addr_str:
-                result['address'] = int(addr_str, 8)
-            result['modbus_addr'] = self.COIL_X_BASE + result['address']
-            result['type'] = 'BOOL'
-            result['is_bit'] = True
-
-        elif address.startswith('Y'):
-            # Output (octal addressing)
-            result['area'] = 'Y'
-            addr_str = address[1:]
-            if addr_str:
-                result['address'] = int(addr_str, 8)
-            result['modbus_addr'] = self.COIL_Y_BASE + result['address']
-            result['type'] = 'BOOL'
-            result['is_bit'] = True
-
-        elif address.startswith('T'):
-            # Timer
-            result['area'] = 'T'
-            result['address'] = int(address[1:])
-            result['modbus_addr'] = self.HOLDING_T_BASE + result['address']
-            result['type'] = 'WORD'
-
-        elif address.startswith('C'):
-            # Counter
-            result['area'] = 'C'
-            result['address'] = int(address[1:])
-            result['modbus_addr'] = self.HOLDING_C_BASE + result['address']
-            result['type'] = 'WORD'
-
-        elif address.startswith('S'):
-            # Step relay
-            result['area'] = 'S'
-            result['address'] = int(address[1:])
-            result['modbus_addr'] = self.COIL_S_BASE + result['address']
-            result['type'] = 'BOOL'
-            result['is_bit'] = True
-
-        else:
+        match = _ADDRESS_RE.fullmatch(address)
+        if match is None:
             raise ValueError(f"Unknown address format: {address}")
 
-        return result
+        area, number = match.groups()
+        base, data_type, is_bit, radix = DeltaDVPDriver._AREA_TABLE[area]
+        offset = int(number, radix)
 
-    def _read_by_type(self, addr_info: dict[str, Any]) -> Any:
-        """Read value based on address type"""
-        if addr_info['is_bit']:
-            # Read coil
-            result = self._client.read_coils(
-                addr_info['modbus_addr'],
-                1,
-                slave=self._unit_id
-            )
-            if result.isError():
-                raise Exception(str(result))
-            return result.bits[0]
-        else:
-            # Read holding register
-            result = self._client.read_holding_registers(
-                addr_info['modbus_addr'],
-                1,
-                slave=self._unit_id
-            )
-            if result.isError():
-                raise Exception(str(result))
-            return result.registers[0]
+        return MappingProxyType({
+            'area': area,
+            'address': offset,
+            'type': data_type,
+            'modbus_addr': base + offset,
+            'is_bit': is_bit,
+        })
 
-    def _write_by_type(self, addr_info: dict[str, Any], value: Any) -> bool:
+    def _write_by_type(self, addr_info: Mapping[str, Any], value: Any) -> bool:
         """Write value based on address type"""
         try:
             if addr_info['is_bit']:
                 # Write coil
-                result = self._client.write_coil(
-                    addr_info['modbus_addr'],
-                    bool(value),
-                    slave=self._unit_id
-                )
+                with self._lock:
+                    result = self._client.write_coil(
+                        addr_info['modbus_addr'],
+                        bool(value),
+                        slave=self._unit_id
+                    )
             else:
                 # Write holding register
-                result = self._client.write_register(
-                    addr_info['modbus_addr'],
-                    int(value),
-                    slave=self._unit_id
-                )
+                with self._lock:
+                    result = self._client.write_register(
+                        addr_info['modbus_addr'],
+                        int(value),
+                        slave=self._unit_id
+                    )
 
             return not result.isError()
         except Exception as e:
@@ -453,14 +554,19 @@ class DeltaDVPDriver(PLCDevice):
 
     def start(self) -> bool:
         """Start PLC - limited support"""
+        self._mode_cache = None
+        if not self._d9046_enabled:
+            self._last_error = "Remote run/stop requires connect(..., enable_d9046=True)"
+            return False
         # Some Delta PLCs support run/stop via special registers
         try:
             # D9046 is often used for remote run/stop
-            result = self._client.write_register(
-                0x1000 + 9046,
-                1,  # 1 = RUN
-                slave=self._unit_id
-            )
+            with self._lock:
+                result = self._client.write_register(
+                    0x1000 + 9046,
+                    1,  # 1 = RUN
+                    slave=self._unit_id
+                )
             return not result.isError()
         except Exception as e:
             self._last_error = str(e)
@@ -468,26 +574,45 @@ class DeltaDVPDriver(PLCDevice):
 
     def stop(self) -> bool:
         """Stop PLC"""
+        self._mode_cache = None
+        if not self._d9046_enabled:
+            self._last_error = "Remote run/stop requires connect(..., enable_d9046=True)"
+            return False
         try:
-            result = self._client.write_register(
-                0x1000 + 9046,
-                0,  # 0 = STOP
-                slave=self._unit_id
-            )
+            with self._lock:
+                result = self._client.write_register(
+                    0x1000 + 9046,
+                    0,  # 0 = STOP
+                    slave=self._unit_id
+                )
             return not result.isError()
         except Exception as e:
             self._last_error = str(e)
             return False
 
     def get_mode(self) -> PLCMode:
-        """Get PLC mode"""
+        """Get PLC mode (cached for MODE_TTL seconds)"""
+        if not self._d9046_enabled:
+            return PLCMode.UNKNOWN
+
+        now = time.monotonic()
+        if self._mode_cache is not None and now - self._mode_cache[0] < self.MODE_TTL:
+            return self._mode_cache[1]
+
+        mode = self._read_mode()
+        self._mode_cache = (now, mode) if mode is not PLCMode.UNKNOWN else None
+        return mode
+
+    def _read_mode(self) -> PLCMode:
+        """Read PLC mode from the run/stop register"""
         try:
             # Read status register
-            result = self._client.read_holding_registers(
-                0x1000 + 9046,
-                1,
-                slave=self._unit_id
-            )
+            with self._lock:
+                result = self._client.read_holding_registers(
+                    0x1000 + 9046,
+                    1,
+                    slave=self._unit_id
+                )
             if not result.isError():
                 if result.registers[0] == 1:
                     return PLCMode.RUN
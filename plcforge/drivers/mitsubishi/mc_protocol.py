@@ -5,10 +5,15 @@ Supports MELSEC-Q, MELSEC-L, iQ-R, and iQ-F series PLCs.
 Uses SLMP (Seamless Message Protocol) over TCP/UDP.
 """
 
+import functools
+import re
 import socket
 import struct
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from enum import IntEnum
+from types import MappingProxyType
 from typing import Any
 
 from plcforge.drivers.base import (
@@ -23,6 +28,7 @@ from plcforge.drivers.base import (
     PLCProgram,
     ProtectionStatus,
     TagValue,
+    coalesce_ranges,
 )
 
 
@@ -51,6 +57,9 @@ class MCDeviceCode(IntEnum):
     CS = 0xC4   # Counter contact
     CC = 0xC3   # Counter coil
 
+    # Special registers
+    SD = 0xA9   # Special register
+
 
 # Memory area to device code mapping
 DEVICE_MAP = {
@@ -62,6 +71,22 @@ DEVICE_MAP = {
     MemoryArea.COUNTER: MCDeviceCode.CN,
 }
 
+_TAG_RE = re.compile(r'([A-Z]{1,2})(\d+)')
+
+# SD203 CPU status -> mode (STEP-RUN executes like RUN, PAUSE holds
+# outputs like STOP)
+_CPU_STATUS_MODES = {
+    0: PLCMode.RUN,
+    1: PLCMode.RUN,
+    2: PLCMode.STOP,
+    3: PLCMode.STOP,
+}
+
+# Precompiled formats for per-request fields
+_U8 = struct.Struct('<B')
+_U8_PAIR = struct.Struct('<BB')     # Random access word/dword point counts
+_U16_LE = struct.Struct('<H')
+
 
 @dataclass
 class MCFrame:
@@ -78,6 +103,21 @@ class MCFrame:
     data: bytes
 
 
+@dataclass
+class _MCSession:
+    """TCP connection shared by every driver connected to one PLC"""
+    socket: socket.socket
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    refs: int = 0
+
+
+# CPUs accept a limited number of MC connections (often 4-16), so drivers
+# for the same ip:port share one socket; the lock keeps request/response
+# pairs from interleaving.
+_SESSION_POOL: dict[tuple[str, int], _MCSession] = {}
+_SESSION_POOL_LOCK = threading.Lock()
+
+
 class MitsubishiMCDriver(PLCDevice):
     """
     Mitsubishi MC Protocol driver.
@@ -105,6 +145,55 @@ class MitsubishiMCDriver(PLCDevice):
     CMD_RANDOM_WRITE = 0x1402
     CMD_MONITOR = 0x0801
     CMD_CPU_MODEL_READ = 0x0101
+    CMD_REMOTE_RUN = 0x1001
+    CMD_REMOTE_STOP = 0x1002
+
+    # SD203 holds the CPU operating status in its low nibble
+    SD_CPU_STATUS = 203
+
+    # 3E request header through subcommand; response data length + end code
+    _FRAME_STRUCT = struct.Struct('<HBBHBHHHH')
+    _RESPONSE_STRUCT = struct.Struct('<HH')
+
+    # Device spec: code (1 byte) + address (3 bytes, as low word + high byte),
+    # optionally followed by a point count and/or a value
+    _SPEC_STRUCT = struct.Struct('<BHB')
+    _SPEC_WORD_STRUCT = struct.Struct('<BHBH')
+    _SPEC_BYTE_STRUCT = struct.Struct('<BHBB')
+    _WRITE_WORD_STRUCT = struct.Struct('<BHBHH')
+    _WRITE_BIT_STRUCT = struct.Struct('<BHBHB')
+    MONITORING_TIMER = 0x0010  # 1.0s
+    RESPONSE_HEADER_SIZE = 9   # Subheader through response data length
+    RX_BUFFER_SIZE = RESPONSE_HEADER_SIZE + 0xFFFF  # Largest possible response
+    KEEPALIVE_IDLE = 15        # Seconds idle before TCP keepalive probes
+
+    # Bit devices, read in word units (16 points per word)
+    BIT_DEVICES = frozenset({'X', 'Y', 'M', 'L', 'B'})
+
+    # Tag device prefix -> device code
+    _DEVICE_CODES = MappingProxyType({
+        'X': MCDeviceCode.X,
+        'Y': MCDeviceCode.Y,
+        'M': MCDeviceCode.M,
+        'L': MCDeviceCode.L,
+        'B': MCDeviceCode.B,
+        'D': MCDeviceCode.D,
+        'W': MCDeviceCode.W,
+        'R': MCDeviceCode.R,
+        'TN': MCDeviceCode.TN,
+        'CN': MCDeviceCode.CN,
+    })
+
+    # Batch read limit in word units
+    MAX_READ_POINTS = 960
+
+    # Holes of up to READ_GAP words are read and discarded in read_tags
+    READ_GAP = 8
+
+    # Random read/write limits in access points per request
+    MAX_RANDOM_READ_POINTS = 192
+    MAX_RANDOM_WRITE_POINTS = 160
+    MAX_RANDOM_BIT_WRITE_POINTS = 188
 
     def __init__(self):
         super().__init__()
@@ -113,6 +202,9 @@ class MitsubishiMCDriver(PLCDevice):
         self._port: int = 5000  # Default MC Protocol port
         self._timeout: float = 5.0
         self._frame_type: str = "3E"
+        self._lock = threading.Lock()
+        # Responses are received in place; data views are valid until the next request
+        self._rx_view = memoryview(bytearray(self.RX_BUFFER_SIZE))
 
     @property
     def vendor(self) -> str:
@@ -120,14 +212,22 @@ class MitsubishiMCDriver(PLCDevice):
 
     def connect(self, ip: str, port: int = 5000, timeout: float = 5.0) -> bool:
         """Connect to Mitsubishi PLC via MC Protocol."""
+        if self._socket:
+            self.disconnect()
+
         self._ip = ip
         self._port = port
         self._timeout = timeout
 
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.settimeout(self._timeout)
-            self._socket.connect((self._ip, self._port))
+            with _SESSION_POOL_LOCK:
+                session = _SESSION_POOL.get((ip, port))
+                if session is None:
+                    session = _MCSession(self._open_socket())
+                    _SESSION_POOL[(ip, port)] = session
+                session.refs += 1
+            self._socket = session.socket
+            self._lock = session.lock
             self._connected = True
 
             # Read CPU model to verify connection
@@ -136,93 +236,161 @@ class MitsubishiMCDriver(PLCDevice):
             return True
         except Exception as e:
             self._last_error = f"Connection failed: {e}"
-            self._connected = False
+            self.disconnect()
             return False
 
+    def _open_socket(self) -> socket.socket:
+        """Open and tune a new TCP connection to the PLC."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # Small request/response frames: don't let Nagle delay them,
+            # and probe idle connections so a dead PLC is noticed quickly
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE)
+            sock.settimeout(self._timeout)
+            sock.connect((self._ip, self._port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
     def disconnect(self) -> None:
-        """Disconnect from PLC."""
-        if self._socket:
-            try:
-                self._socket.close()
-            except:
-                pass
-            self._socket = None
+        """Disconnect from PLC, closing the socket once no driver shares it."""
+        sock, self._socket = self._socket, None
         self._connected = False
+        if sock is None:
+            return
+
+        key = (self._ip, self._port)
+        with _SESSION_POOL_LOCK:
+            session = _SESSION_POOL.get(key)
+            if session is not None and session.socket is sock:
+                session.refs -= 1
+                if session.refs > 0:
+                    return
+                del _SESSION_POOL[key]
+
+        try:
+            sock.close()
+        except OSError:
+            pass
 
     def _build_frame(self, command: int, subcommand: int, data: bytes) -> bytes:
         """Build MC Protocol 3E frame."""
         # Data length = monitoring timer(2) + command(2) + subcommand(2) + data
-        data_length = 6 + len(data)
-
-        frame = struct.pack('<H', self.SUBHEADER_3E)  # Subheader
-        frame += struct.pack('<B', self.NETWORK_NO)   # Network number
-        frame += struct.pack('<B', self.PC_NO)        # PC number
-        frame += struct.pack('<H', self.MODULE_IO)    # Request dest module I/O
-        frame += struct.pack('<B', self.MODULE_STATION)  # Request dest module station
-        frame += struct.pack('<H', data_length)       # Request data length
-        frame += struct.pack('<H', 0x0010)            # Monitoring timer (1.0s)
-        frame += struct.pack('<H', command)           # Command
-        frame += struct.pack('<H', subcommand)        # Subcommand
-        frame += data                                 # Data
-
-        return frame
-
-    def _parse_response(self, response: bytes) -> tuple[int, bytes]:
-        """Parse MC Protocol response."""
+        return self._FRAME_STRUCT.pack(
+            self.SUBHEADER_3E,
+            self.NETWORK_NO,
+            self.PC_NO,
+            self.MODULE_IO,
+            self.MODULE_STATION,
+            6 + len(data),
+            self.MONITORING_TIMER,
+            command,
+            subcommand,
+        ) + data
+
+    def _parse_response(self, response: bytes) -> tuple[int, memoryview]:
+        """Parse MC Protocol response, returning a view of the data."""
         if len(response) < 11:
             raise ValueError("Response too short")
 
-        # Parse header
-        struct.unpack('<H', response[0:2])[0]
-        response[2]
-        response[3]
-        struct.unpack('<H', response[4:6])[0]
-        response[6]
-        data_length = struct.unpack('<H', response[7:9])[0]
-        end_code = struct.unpack('<H', response[9:11])[0]
+        data_length, end_code = self._RESPONSE_STRUCT.unpack_from(response, 7)
 
         if end_code != 0:
             raise ValueError(f"MC Protocol error: 0x{end_code:04X}")
 
-        # Return data after header
-        data = response[11:11 + data_length - 2]
-        return end_code, data
+        # Data after header, without copying
+        return end_code, memoryview(response)[11:11 + data_length - 2]
 
-    def _send_receive(self, command: int, subcommand: int, data: bytes) -> bytes:
+    def _send_receive(self, command: int, subcommand: int, data: bytes) -> memoryview:
         """Send command and receive response."""
         if not self._socket or not self._connected:
             raise ConnectionError("Not connected")
 
         frame = self._build_frame(command, subcommand, data)
-        self._socket.send(frame)
+        with self._lock:
+            try:
+                return self._exchange(frame)
+            except OSError:
+                # A closed or timed-out stream may hold part of a response,
+                # so no driver sharing it can trust the next frame
+                self._discard_session()
+                raise
+
+    def _discard_session(self) -> None:
+        """Remove a failed shared socket from the pool and close it."""
+        sock = self._socket
+        self._connected = False
+
+        key = (self._ip, self._port)
+        with _SESSION_POOL_LOCK:
+            session = _SESSION_POOL.get(key)
+            if session is not None and session.socket is sock:
+                del _SESSION_POOL[key]
 
-        # Receive response
-        response = self._socket.recv(4096)
-        end_code, data = self._parse_response(response)
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def _exchange(self, frame: bytes) -> memoryview:
+        """Send a frame and receive its response (caller holds the lock)."""
+        self._socket.sendall(frame)
+
+        # Only one request is outstanding, so read greedily: a whole
+        # response usually arrives in the first recv_into. Loop only for
+        # the rest of a header or payload split across TCP segments.
+        rx = self._rx_view
+        header_size = self.RESPONSE_HEADER_SIZE
+        received = 0
+        while received < header_size:
+            received += self._recv_some(rx[received:])
+        total = header_size + int.from_bytes(rx[7:header_size], 'little')
+        if received < total:
+            self._recv_exact(rx[received:total])
+        end_code, data = self._parse_response(rx[:total])
 
         return data
 
+    def _recv_some(self, view: memoryview) -> int:
+        """Receive into view, returning the byte count (at least one)."""
+        received = self._socket.recv_into(view)
+        if not received:
+            self._connected = False
+            raise ConnectionError("Connection closed by PLC")
+        return received
+
+    def _recv_exact(self, view: memoryview) -> None:
+        """Fill view completely, across partial TCP reads."""
+        while view:
+            view = view[self._recv_some(view):]
+
     def _read_cpu_model(self) -> DeviceInfo:
         """Read CPU model information."""
         try:
             data = self._send_receive(self.CMD_CPU_MODEL_READ, 0x0000, b'')
 
             # Parse CPU model response
-            model_name = data[0:16].decode('ascii').strip('\x00')
+            model_name = bytes(data[0:16]).decode('ascii').strip('\x00')
 
             return DeviceInfo(
                 vendor="Mitsubishi",
                 model=model_name,
-                firmware_version="",
-                serial_number="",
+                firmware="",
+                serial="",
+                name=model_name,
                 ip_address=self._ip or "",
             )
         except Exception:
             return DeviceInfo(
                 vendor="Mitsubishi",
                 model="Unknown",
-                firmware_version="",
-                serial_number="",
+                firmware="",
+                serial="",
+                name="",
                 ip_address=self._ip or "",
             )
 
@@ -245,14 +413,11 @@ class MitsubishiMCDriver(PLCDevice):
         if device_code is None:
             raise ValueError(f"Unsupported memory area: {area}")
 
-        # Build read request
         # Device code (1 byte) + address (3 bytes) + points (2 bytes)
-        data = struct.pack('<B', device_code)
-        data += struct.pack('<I', start)[:3]  # 3-byte address
-        data += struct.pack('<H', length)
+        data = self._SPEC_WORD_STRUCT.pack(device_code, start & 0xFFFF, start >> 16, length)
 
         response = self._send_receive(self.CMD_BATCH_READ, 0x0000, data)
-        return response
+        return bytes(response)
 
     def write_memory(self, area: MemoryArea, start: int, data: bytes) -> bool:
         """Write to memory area."""
@@ -260,12 +425,11 @@ class MitsubishiMCDriver(PLCDevice):
         if device_code is None:
             raise ValueError(f"Unsupported memory area: {area}")
 
-        # Build write request
-        points = len(data) // 2
-        request = struct.pack('<B', device_code)
-        request += struct.pack('<I', start)[:3]  # 3-byte address
-        request += struct.pack('<H', points)
-        request += data
+        # Build write request in one buffer
+        header = self._SPEC_WORD_STRUCT
+        request = bytearray(header.size + len(data))
+        header.pack_into(request, 0, device_code, start & 0xFFFF, start >> 16, len(data) // 2)
+        request[header.size:] = data
 
         try:
             self._send_receive(self.CMD_BATCH_WRITE, 0x0000, request)
@@ -276,44 +440,196 @@ class MitsubishiMCDriver(PLCDevice):
 
     def read_tag(self, tag_name: str) -> TagValue:
         """Read tag by name (D100, M0, etc.)."""
-        device, address = self._parse_tag(tag_name)
-        device_code = self._get_device_code(device)
-
-        # Build read request
-        data = struct.pack('<B', device_code)
-        data += struct.pack('<I', address)[:3]
-        data += struct.pack('<H', 1)
-
-        response = self._send_receive(self.CMD_BATCH_READ, 0x0000, data)
+        resolved = self._resolve_tag(tag_name)
 
-        if device in ['X', 'Y', 'M', 'L', 'B']:  # Bit devices
-            value = response[0] & 0x01
-        else:  # Word devices
-            value = struct.unpack('<H', response[0:2])[0]
+        values = self._read_coalesced({tag_name: resolved})
+        if tag_name not in values:
+            raise ConnectionError(self._last_error)
 
         return TagValue(
             name=tag_name,
-            value=value,
-            data_type="WORD" if device in ['D', 'W', 'R'] else "BOOL",
+            value=values[tag_name],
+            data_type="BOOL" if resolved[2] else "WORD",
             address=tag_name,
         )
 
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags with one batch read per address run.
+
+        Tags are grouped by device, sorted by address and merged into
+        runs (small holes are read and dropped), so adjacent tags share
+        a single CMD_BATCH_READ round-trip.
+        """
+        parsed: dict[str, tuple[int, int, bool]] = {}
+        for name in dict.fromkeys(tag_names):
+            try:
+                parsed[name] = self._resolve_tag(name)
+            except ValueError as e:
+                self._last_error = str(e)
+
+        values = self._read_coalesced(parsed)
+        timestamp_ns = time.time_ns()
+
+        tag_values = []
+        for name in tag_names:
+            resolved = parsed.get(name)
+            good = name in values
+            tag_values.append(TagValue(
+                name=name,
+                value=values[name] if good else None,
+                data_type=(
+                    "Unknown" if resolved is None
+                    else "BOOL" if resolved[2] else "WORD"
+                ),
+                address=name,
+                quality="good" if good else "bad",
+                timestamp_ns=timestamp_ns,
+            ))
+        return tag_values
+
+    def _read_coalesced(self, parsed: dict[str, tuple[int, int, bool]]) -> dict[str, Any]:
+        """
+        Read parsed tags with as few requests as possible.
+
+        Runs spanning several words get one CMD_BATCH_READ each; isolated
+        points (one word) are gathered into CMD_RANDOM_READ requests of up
+        to MAX_RANDOM_READ_POINTS words.
+
+        Returns:
+            Values by tag name; tags in failed requests are omitted and the
+            error is left in _last_error
+        """
+        by_device: dict[tuple[int, bool], list[tuple[int, str]]] = {}
+        for name, (device_code, address, is_bit) in parsed.items():
+            by_device.setdefault((device_code, is_bit), []).append((address, name))
+
+        runs = []
+        singles = []
+        for (device_code, is_bit), points in by_device.items():
+            # Bit devices are addressed per point but transferred per word
+            scale = 16 if is_bit else 1
+            ranges = coalesce_ranges(
+                points, self.READ_GAP * scale, self.MAX_READ_POINTS * scale
+            )
+            for start, count, members in ranges:
+                target = runs if count > scale else singles
+                target.append((device_code, scale, start, count, members))
+
+        values: dict[str, Any] = {}
+
+        for device_code, scale, start, count, members in runs:
+            data = self._SPEC_WORD_STRUCT.pack(
+                device_code, start & 0xFFFF, start >> 16, -(-count // scale)
+            )
+            try:
+                response = self._send_receive(self.CMD_BATCH_READ, 0x0000, data)
+            except Exception as e:
+                self._last_error = str(e)
+                continue
+            self._decode_points(response, 0, start, scale, members, values)
+
+        for i in range(0, len(singles), self.MAX_RANDOM_READ_POINTS):
+            chunk = singles[i:i + self.MAX_RANDOM_READ_POINTS]
+            # Word access points, no double-word points
+            data = _U8_PAIR.pack(len(chunk), 0)
+            data += b''.join(self._device_spec(code, start) for code, _, start, _, _ in chunk)
+            try:
+                response = self._send_receive(self.CMD_RANDOM_READ, 0x0000, data)
+            except Exception as e:
+                self._last_error = str(e)
+                continue
+            for word, (_, scale, start, _, members) in enumerate(chunk):
+                self._decode_points(response, word, start, scale, members, values)
+
+        return values
+
+    @classmethod
+    def _device_spec(cls, device_code: int, address: int) -> bytes:
+        """Device code (1 byte) + address (3 bytes)."""
+        return cls._SPEC_STRUCT.pack(device_code, address & 0xFFFF, address >> 16)
+
+    @staticmethod
+    def _decode_points(
+        response: memoryview,
+        word: int,
+        start: int,
+        scale: int,
+        members: list[tuple[int, str]],
+        values: dict[str, Any],
+    ) -> None:
+        """Extract point values from words starting at response word index."""
+        for address, name in members:
+            offset = address - start
+            if scale == 1:
+                values[name] = _U16_LE.unpack_from(response, (word + offset) * 2)[0]
+            else:
+                bits = _U16_LE.unpack_from(response, (word + offset // 16) * 2)[0]
+                values[name] = (bits >> (offset % 16)) & 0x01
+
+    def write_tags(self, tags: dict[str, Any]) -> bool:
+        """
+        Write multiple tags with CMD_RANDOM_WRITE.
+
+        Word devices are written in word units and bit devices in bit
+        units, each in as few requests as the per-request point limits
+        allow. Returns False if any tag failed (error in _last_error).
+        """
+        words = []
+        bits = []
+        ok = True
+        for name, value in tags.items():
+            try:
+                device_code, address, is_bit = self._resolve_tag(name)
+            except ValueError as e:
+                self._last_error = str(e)
+                ok = False
+                continue
+            if is_bit:
+                bits.append(self._SPEC_BYTE_STRUCT.pack(
+                    device_code, address & 0xFFFF, address >> 16, 1 if value else 0
+                ))
+            else:
+                words.append(self._SPEC_WORD_STRUCT.pack(
+                    device_code, address & 0xFFFF, address >> 16, int(value) & 0xFFFF
+                ))
+
+        requests = [
+            (0x0000, _U8_PAIR.pack(len(chunk), 0) + b''.join(chunk))
+            for chunk in (
+                words[i:i + self.MAX_RANDOM_WRITE_POINTS]
+                for i in range(0, len(words), self.MAX_RANDOM_WRITE_POINTS)
+            )
+        ]
+        requests += [
+            (0x0001, _U8.pack(len(chunk)) + b''.join(chunk))
+            for chunk in (
+                bits[i:i + self.MAX_RANDOM_BIT_WRITE_POINTS]
+                for i in range(0, len(bits), self.MAX_RANDOM_BIT_WRITE_POINTS)
+            )
+        ]
+
+        for subcommand, data in requests:
+            try:
+                self._send_receive(self.CMD_RANDOM_WRITE, subcommand, data)
+            except Exception as e:
+                self._last_error = str(e)
+                ok = False
+        return ok
+
     def write_tag(self, tag_name: str, value: Any) -> bool:
         """Write tag by name."""
-        device, address = self._parse_tag(tag_name)
-        device_code = self._get_device_code(device)
-
-        if device in ['X', 'Y', 'M', 'L', 'B']:  # Bit devices
-            # Use bit write
-            data = struct.pack('<B', device_code)
-            data += struct.pack('<I', address)[:3]
-            data += struct.pack('<H', 1)
-            data += struct.pack('<B', 1 if value else 0)
-        else:  # Word devices
-            data = struct.pack('<B', device_code)
-            data += struct.pack('<I', address)[:3]
-            data += struct.pack('<H', 1)
-            data += struct.pack('<H', int(value))
+        device_code, address, is_bit = self._resolve_tag(tag_name)
+
+        # Device spec + one point + value, packed in one call
+        if is_bit:
+            data = self._WRITE_BIT_STRUCT.pack(
+                device_code, address & 0xFFFF, address >> 16, 1, 1 if value else 0
+            )
+        else:
+            data = self._WRITE_WORD_STRUCT.pack(
+                device_code, address & 0xFFFF, address >> 16, 1, int(value) & 0xFFFF
+            )
 
         try:
             self._send_receive(self.CMD_BATCH_WRITE, 0x0000, data)
@@ -322,39 +638,34 @@ class MitsubishiMCDriver(PLCDevice):
             self._last_error = str(e)
             return False
 
-    def _parse_tag(self, tag: str) -> tuple[str, int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _resolve_tag(tag: str) -> tuple[int, int, bool]:
+        """Parse and cache a tag as (device_code, address, is_bit)."""
+        device, address = MitsubishiMCDriver._parse_tag(tag)
+        return (
+            MitsubishiMCDriver._get_device_code(device),
+            address,
+            device in MitsubishiMCDriver.BIT_DEVICES,
+        )
+
+    @staticmethod
+    def _parse_tag(tag: str) -> tuple[str, int]:
         """Parse tag name into device and address."""
         # Examples: D100, M0, X0, Y10
         tag = tag.upper()
+        match = _TAG_RE.fullmatch(tag)
+        if match is None:
+            raise ValueError(f"Invalid tag format: {tag}")
+        return match.group(1), int(match.group(2))
 
-        # Find where numbers start
-        for i, c in enumerate(tag):
-            if c.isdigit():
-                device = tag[:i]
-                address = int(tag[i:])
-                return device, address
-
-        raise ValueError(f"Invalid tag format: {tag}")
-
-    def _get_device_code(self, device: str) -> int:
+    @classmethod
+    def _get_device_code(cls, device: str) -> int:
         """Get device code from device letter."""
-        device_codes = {
-            'X': MCDeviceCode.X,
-            'Y': MCDeviceCode.Y,
-            'M': MCDeviceCode.M,
-            'L': MCDeviceCode.L,
-            'B': MCDeviceCode.B,
-            'D': MCDeviceCode.D,
-            'W': MCDeviceCode.W,
-            'R': MCDeviceCode.R,
-            'TN': MCDeviceCode.TN,
-            'CN': MCDeviceCode.CN,
-        }
-
-        if device not in device_codes:
+        device_code = cls._DEVICE_CODES.get(device)
+        if device_code is None:
             raise ValueError(f"Unknown device: {device}")
-
-        return device_codes[device]
+        return device_code
 
     def authenticate(self, password: str) -> bool:
         """Authenticate with password (not typically required for MC Protocol)."""
@@ -381,20 +692,44 @@ class MitsubishiMCDriver(PLCDevice):
         return False
 
     def get_mode(self) -> PLCMode:
-        """Get PLC mode."""
-        return PLCMode.RUN
+        """Get PLC mode from the CPU status register (SD203)."""
+        request = self._SPEC_WORD_STRUCT.pack(MCDeviceCode.SD, self.SD_CPU_STATUS, 0, 1)
+        try:
+            response = self._send_receive(self.CMD_BATCH_READ, 0x0000, request)
+            status = _U16_LE.unpack_from(response)[0] & 0x0F
+        except Exception as e:
+            self._last_error = str(e)
+            return PLCMode.UNKNOWN
+
+        # 0 = RUN, 1 = STEP-RUN, 2 = STOP, 3 = PAUSE
+        return _CPU_STATUS_MODES.get(status, PLCMode.UNKNOWN)
 
     def set_mode(self, mode: PLCMode) -> bool:
-        """Set PLC mode (not supported via MC Protocol)."""
+        """Set PLC mode (RUN or STOP)."""
+        if mode == PLCMode.RUN:
+            return self.start()
+        if mode == PLCMode.STOP:
+            return self.stop()
+        self._last_error = f"Unsupported mode: {mode}"
         return False
 
     def start(self) -> bool:
-        """Start PLC (not supported via MC Protocol)."""
-        return False
+        """Start PLC with a remote RUN (no force, keep device memory)."""
+        # Mode 0x0001 (no force), clear mode 0x00 (don't clear), fixed 0x00
+        return self._remote_control(self.CMD_REMOTE_RUN, b'\x01\x00\x00\x00')
 
     def stop(self) -> bool:
-        """Stop PLC (not supported via MC Protocol)."""
-        return False
+        """Stop PLC with a remote STOP."""
+        return self._remote_control(self.CMD_REMOTE_STOP, b'\x01\x00')
+
+    def _remote_control(self, command: int, data: bytes) -> bool:
+        """Send a remote operation command."""
+        try:
+            self._send_receive(command, 0x0000, data)
+            return True
+        except Exception as e:
+            self._last_error = str(e)
+            return False
 
     def get_access_level(self) -> AccessLevel:
         """Get current access level."""
@@ -4,6 +4,7 @@ Omron PLC Drivers
 Supports CP/CJ/CS series via FINS protocol.
 """
 
-from plcforge.drivers.omron.fins_driver import OmronFINSDriver
+from plcforge.drivers.omron.fins_driver import FINSError, OmronFINSDriver
+from plcforge.drivers.omron.pool import FINSConnectionPool, get_fins_pool
 
-__all__ = ['OmronFINSDriver']
+__all__ = ['OmronFINSDriver', 'FINSError', 'FINSConnectionPool', 'get_fins_pool']
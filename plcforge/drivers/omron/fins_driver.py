@@ -4,10 +4,19 @@ Omron FINS Protocol Driver
 Supports Omron CP/CJ/CS series PLCs using FINS protocol.
 """
 
+import asyncio
+import functools
+import re
+import selectors
 import socket
 import struct
-from datetime import datetime
-from typing import Any
+import sys
+import time
+from array import array
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from plcforge.drivers.base import (
     AccessLevel,
@@ -21,8 +30,50 @@ from plcforge.drivers.base import (
     PLCProgram,
     ProtectionStatus,
     TagValue,
+    coalesce_ranges,
 )
 
+if TYPE_CHECKING:
+    from plcforge.drivers.omron.pool import FINSConnectionPool
+
+# Precompiled formats for FINS frames
+_U16_BE = struct.Struct('>H')
+_HEADER = struct.Struct('>10BH')        # 10-byte FINS header + command code
+_AREA_REQUEST = struct.Struct('>BHBH')  # Area, word address, bit, count
+_AREA_ITEM = struct.Struct('>BHB')      # Multiple read item: area, word address, bit
+_AREA_WORD = struct.Struct('>BH')       # Multiple read result: area, word
+
+# Not exported by the socket module; value from <asm-generic/socket.h>
+_SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+# Controller status byte -> mode (bit 0 = run, bit 1 = program, else stop)
+_STATUS_MODES = tuple(
+    PLCMode.RUN if status & 0x01 else PLCMode.PROGRAM if status & 0x02 else PLCMode.STOP
+    for status in range(256)
+)
+
+
+def _decode_words(data: bytes) -> array:
+    """Decode big-endian FINS words into a native uint16 array in one pass"""
+    words = array('H')
+    words.frombytes(data[:len(data) & ~1])
+    if sys.byteorder == 'little':
+        words.byteswap()
+    return words
+
+
+class FINSError(Exception):
+    """FINS command failure, with the response end code when one was received"""
+
+    def __init__(self, message: str, end_code: int | None = None):
+        super().__init__(message)
+        self.end_code = end_code
+
+
+# Failures a FINS exchange can raise: socket errors and timeouts
+# (OSError) and protocol errors (FINSError)
+_FINS_ERRORS = (OSError, FINSError)
+
 
 class FINSClient:
     """Low-level FINS protocol client"""
@@ -30,6 +81,7 @@ class FINSClient:
     # FINS command codes
     CMD_MEMORY_AREA_READ = 0x0101
     CMD_MEMORY_AREA_WRITE = 0x0102
+    CMD_MULTIPLE_MEMORY_AREA_READ = 0x0104
     CMD_CONTROLLER_DATA_READ = 0x0501
     CMD_CONTROLLER_STATUS_READ = 0x0601
     CMD_RUN = 0x0401
@@ -37,6 +89,12 @@ class FINSClient:
     CMD_ACCESS_RIGHT_ACQUIRE = 0x0620
     CMD_ACCESS_RIGHT_RELEASE = 0x0621
 
+    # Command code plus payload for frames that only vary by SID
+    _DATA_READ_TAIL = _U16_BE.pack(CMD_CONTROLLER_DATA_READ)
+    _STATUS_READ_TAIL = _U16_BE.pack(CMD_CONTROLLER_STATUS_READ)
+    _RUN_TAIL = _U16_BE.pack(CMD_RUN) + b'\x04\x01'  # Program number, monitor mode
+    _STOP_TAIL = _U16_BE.pack(CMD_STOP)
+
     # Memory area codes
     AREA_CIO = 0xB0      # CIO (I/O) area - word
     AREA_WR = 0xB1       # Work area - word
@@ -50,153 +108,319 @@ class FINSClient:
     AREA_WR_BIT = 0x31   # Work area bit
     AREA_HR_BIT = 0x32   # Holding area bit
 
-    def __init__(self, host: str, port: int = 9600):
+    # Initial transmit buffer size (largest FINS/UDP frame is 2012 bytes)
+    TX_BUFFER_SIZE = 4096
+    RX_BUFFER_SIZE = 4096
+
+    # Socket buffer sizes in bytes; bursts of large D-memory responses can
+    # overflow the default receive buffer (the kernel caps these at
+    # net.core.rmem_max / wmem_max)
+    RCVBUF_SIZE = 1 << 20
+    SNDBUF_SIZE = 1 << 18
+
+    # SO_BUSY_POLL time in microseconds (Linux); busy-polls the NIC queue
+    # while waiting for a response, trading CPU for latency. 0 leaves it off.
+    BUSY_POLL_US = 0
+
+    def __init__(self, host: str, port: int = 9600, timeout: float = 5.0):
         self.host = host
         self.port = port
+        self.timeout = timeout
+        self._address = (host, port)
         self.sock: socket.socket | None = None
-        self.local_node = 0
-        self.remote_node = 0
+        self._selector: selectors.BaseSelector | None = None
         self.sid = 0
+        # Commands are packed in place; grown (replaced) only for larger frames
+        self._tx_buf = bytearray(self.TX_BUFFER_SIZE)
+        self._tx_view = memoryview(self._tx_buf)
+        # FINS/UDP uses fixed node addresses, no node address handshake
+        self._set_nodes(1, 1)
+        # Responses are received in place; data views are valid until the next command
+        self._rx_buf = bytearray(self.RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
 
     def connect(self) -> bool:
-        """Connect to PLC via FINS/TCP"""
+        """
+        Open the FINS/UDP socket.
+
+        The socket is non-blocking; responses are awaited with a selector,
+        and fileno() lets an external event loop watch the client.
+        """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.sock.settimeout(5.0)
-
-            # For FINS/UDP, send node address request
-            self._request_node_address()
-
+            self.sock.setblocking(False)
+            self.set_buffer_sizes(self.RCVBUF_SIZE, self.SNDBUF_SIZE)
+            if self.BUSY_POLL_US and sys.platform == 'linux':
+                try:
+                    self.sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, self.BUSY_POLL_US)
+                except OSError:
+                    pass  # Raising it above net.core.busy_poll needs CAP_NET_ADMIN
+
+            # A connected UDP socket skips the per-datagram route lookup and
+            # drops datagrams from other hosts
+            self.sock.connect(self._address)
+
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.sock, selectors.EVENT_READ)
             return True
-        except Exception:
+        except OSError:
             return False
 
-    def _request_node_address(self):
-        """Request node address assignment (FINS/TCP only)"""
-        # For UDP, we use a fixed node address
-        self.local_node = 1
-        self.remote_node = 1
+    def fileno(self) -> int:
+        """Socket file descriptor, for registering the client with a selector"""
+        return self.sock.fileno()
+
+    def set_buffer_sizes(self, rcvbuf: int | None = None, sndbuf: int | None = None) -> None:
+        """Set the socket receive and/or send buffer size in bytes"""
+        if rcvbuf:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        if sndbuf:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+
+    def _set_nodes(self, local_node: int, remote_node: int) -> None:
+        """Set node addresses and write the fixed header bytes to the transmit buffer"""
+        self.local_node = local_node
+        self.remote_node = remote_node
+        self._header_template = bytes((
+            0x80,           # ICF: Command, response required
+            0x00,           # RSV: Reserved
+            0x02,           # GCT: Gateway count
+            0x00,           # DNA: Destination network (local)
+            remote_node,    # DA1: Destination node
+            0x00,           # DA2: Destination unit (CPU)
+            0x00,           # SNA: Source network
+            local_node,     # SA1: Source node
+            0x00,           # SA2: Source unit
+        ))
+        self._tx_buf[:9] = self._header_template
 
     def close(self):
         """Close connection"""
+        if self._selector:
+            self._selector.close()
+            self._selector = None
         if self.sock:
             self.sock.close()
             self.sock = None
 
-    def _build_header(self, command: int, data: bytes) -> bytes:
-        """Build FINS header"""
+    def _recv(self) -> int:
+        """Receive one datagram into the receive buffer, waiting up to timeout"""
+        try:
+            return self.sock.recv_into(self._rx_buf)
+        except BlockingIOError:
+            pass
+
+        if not self._selector.select(self.timeout):
+            raise TimeoutError("FINS response timed out")
+        return self.sock.recv_into(self._rx_buf)
+
+    def _begin(self, command: int, size: int) -> bytearray:
+        """
+        Start a frame of size bytes in the transmit buffer.
+
+        The fixed header bytes are already in place, so only the SID and
+        command code are written; callers pack their data from offset 12.
+        """
         self.sid = (self.sid + 1) & 0xFF
 
-        header = bytes([
-            0x80,           # ICF: Command, response required
-            0x00,           # RSV: Reserved
-            0x02,           # GCT: Gateway count
-            0x00,           # DNA: Destination network (local)
-            self.remote_node,  # DA1: Destination node
-            0x00,           # DA2: Destination unit (CPU)
-            0x00,           # SNA: Source network
-            self.local_node,   # SA1: Source node
-            0x00,           # SA2: Source unit
-            self.sid,       # SID: Service ID
-        ])
+        if size > len(self._tx_buf):
+            self._tx_buf = bytearray(size)
+            self._tx_view = memoryview(self._tx_buf)
+            self._tx_buf[:9] = self._header_template
 
-        # Add command code
-        cmd_bytes = struct.pack('>H', command)
+        tx_buf = self._tx_buf
+        tx_buf[9] = self.sid                    # SID: Service ID
+        _U16_BE.pack_into(tx_buf, 10, command)  # Command code
+        return tx_buf
 
-        return header + cmd_bytes + data
+    def _build_header(self, command: int, data: bytes) -> memoryview:
+        """Build FINS packet in the transmit buffer (valid until the next command)"""
+        size = _HEADER.size + len(data)
+        self._begin(command, size)[_HEADER.size:size] = data
+        return self._tx_view[:size]
 
-    def _send_command(self, command: int, data: bytes = b'') -> tuple[int, bytes]:
-        """Send FINS command and receive response"""
-        packet = self._build_header(command, data)
+    def _transact(self, size: int) -> tuple[int, memoryview]:
+        """
+        Send the first size bytes of the transmit buffer and receive the response.
 
-        self.sock.sendto(packet, (self.host, self.port))
+        The response data is a view into the receive buffer, valid until
+        the next command.
+        """
+        self.sock.send(self._tx_view[:size])
 
-        response, _ = self.sock.recvfrom(4096)
+        sid = self.sid
+        rx_buf = self._rx_buf
+        while True:
+            size = self._recv()
+            if size < 10 or rx_buf[9] == sid:
+                break
+            # Late response to an earlier batched or timed-out command
 
         # Parse response
-        if len(response) < 14:
-            raise Exception("Response too short")
+        if size < 14:
+            raise FINSError("Response too short")
 
         # Check response code
-        end_code = struct.unpack('>H', response[12:14])[0]
-        response_data = response[14:]
+        end_code = _U16_BE.unpack_from(self._rx_buf, 12)[0]
 
-        return end_code, response_data
+        return end_code, self._rx_view[14:size]
 
-    def memory_area_read(self, area: int, address: int, count: int) -> bytes:
-        """Read from memory area"""
-        # Build data: Area code, Address (3 bytes), Bit position, Count
-        data = bytes([
-            area,
-            (address >> 8) & 0xFF,
-            address & 0xFF,
-            0x00,  # Bit position (for word access)
-        ]) + struct.pack('>H', count)
+    def _send_fixed(self, tail: bytes) -> tuple[int, memoryview]:
+        """Send a prebuilt command code and payload, writing only the SID"""
+        self.sid = (self.sid + 1) & 0xFF
 
-        end_code, response = self._send_command(self.CMD_MEMORY_AREA_READ, data)
+        size = 10 + len(tail)
+        tx_buf = self._tx_buf
+        tx_buf[9] = self.sid
+        tx_buf[10:size] = tail
+        return self._transact(size)
+
+    def _send_command(self, command: int, data: bytes = b'') -> tuple[int, memoryview]:
+        """Send FINS command and receive response (data view valid until the next command)"""
+        return self._transact(len(self._build_header(command, data)))
+
+    def send_batch(self, commands: list[tuple[int, bytes]]) -> list[tuple[int, bytes]]:
+        """
+        Send several commands back to back and collect their responses.
+
+        Each frame gets its own SID and responses are matched by the SID
+        echoed in byte 9, so N commands wait one round trip instead of N.
+        Response data is copied out of the receive buffer.
+
+        Returns:
+            (end_code, data) per command, in command order
+        """
+        if len(commands) > 255:
+            raise ValueError("At most 255 commands per batch")
+
+        sock = self.sock
+        pending: dict[int, int] = {}
+        for index, (command, data) in enumerate(commands):
+            sock.send(self._build_header(command, data))
+            pending[self.sid] = index
+
+        results: list[tuple[int, bytes]] = [(0, b'')] * len(commands)
+        rx_buf = self._rx_buf
+        while pending:
+            size = self._recv()
+            if size < 14:
+                continue
+            index = pending.pop(rx_buf[9], None)
+            if index is None:
+                continue  # Late response to an earlier, timed-out command
+            results[index] = (_U16_BE.unpack_from(rx_buf, 12)[0], bytes(self._rx_view[14:size]))
+
+        return results
+
+    def memory_area_read(self, area: int, address: int, count: int) -> memoryview:
+        """Read from memory area (view valid until the next command)"""
+        size = _HEADER.size + _AREA_REQUEST.size
+
+        # Data: Area code, Address (2 bytes), Bit position (0 for word access), Count
+        _AREA_REQUEST.pack_into(
+            self._begin(self.CMD_MEMORY_AREA_READ, size), _HEADER.size,
+            area, address & 0xFFFF, 0x00, count,
+        )
+
+        end_code, response = self._transact(size)
 
         if end_code != 0:
-            raise Exception(f"FINS error: {end_code:04X}")
+            raise FINSError(f"FINS error: {end_code:04X}", end_code)
 
         return response
 
+    def memory_area_read_into(self, area: int, address: int, count: int, out: Any) -> int:
+        """
+        Read from memory area into a caller-supplied writable buffer.
+
+        Returns:
+            Number of bytes copied into out
+        """
+        response = self.memory_area_read(area, address, count)
+        size = len(response)
+        memoryview(out).cast('B')[:size] = response
+        return size
+
+    def memory_area_read_multiple(self, points: list[tuple[int, int]]) -> list[int]:
+        """Read scattered (area, address) words with one Multiple Memory Area Read"""
+        end_code, response = self._send_command(
+            self.CMD_MULTIPLE_MEMORY_AREA_READ, self._pack_multiple_read(points)
+        )
+
+        if end_code != 0:
+            raise FINSError(f"FINS error: {end_code:04X}", end_code)
+
+        return self._unpack_multiple_read(response, len(points))
+
+    @staticmethod
+    def _pack_multiple_read(points: list[tuple[int, int]]) -> bytes:
+        """Build Multiple Memory Area Read data for word (area, address) points"""
+        return b''.join(_AREA_ITEM.pack(area, address & 0xFFFF, 0x00) for area, address in points)
+
+    @staticmethod
+    def _unpack_multiple_read(data: bytes, count: int) -> list[int]:
+        """Extract words from a Multiple Memory Area Read response"""
+        # Each result echoes its area code ahead of the word
+        size = count * _AREA_WORD.size
+        if len(data) < size:
+            raise FINSError("Multiple memory area read response too short")
+        return [word for _, word in _AREA_WORD.iter_unpack(data[:size])]
+
     def memory_area_write(self, area: int, address: int, data: bytes) -> bool:
         """Write to memory area"""
-        count = len(data) // 2  # Word count
+        offset = _HEADER.size + _AREA_REQUEST.size
+        size = offset + len(data)
 
-        # Build command data
-        cmd_data = bytes([
-            area,
-            (address >> 8) & 0xFF,
-            address & 0xFF,
-            0x00,  # Bit position
-        ]) + struct.pack('>H', count) + data
+        tx_buf = self._begin(self.CMD_MEMORY_AREA_WRITE, size)
+        _AREA_REQUEST.pack_into(tx_buf, _HEADER.size, area, address & 0xFFFF, 0x00, len(data) // 2)
+        tx_buf[offset:size] = data
 
-        end_code, _ = self._send_command(self.CMD_MEMORY_AREA_WRITE, cmd_data)
+        end_code, _ = self._transact(size)
 
         return end_code == 0
 
     def controller_data_read(self) -> dict[str, Any]:
         """Read controller data"""
-        end_code, response = self._send_command(self.CMD_CONTROLLER_DATA_READ, b'')
+        end_code, response = self._send_fixed(self._DATA_READ_TAIL)
 
         if end_code != 0 or len(response) < 64:
             return {}
 
         return {
-            'model': response[0:20].decode('ascii', errors='ignore').strip(),
-            'version': response[20:40].decode('ascii', errors='ignore').strip(),
+            'model': bytes(response[0:20]).decode('ascii', errors='ignore').strip(),
+            'version': bytes(response[20:40]).decode('ascii', errors='ignore').strip(),
         }
 
     def controller_status_read(self) -> dict[str, Any]:
         """Read controller status"""
-        end_code, response = self._send_command(self.CMD_CONTROLLER_STATUS_READ, b'')
+        end_code, response = self._send_fixed(self._STATUS_READ_TAIL)
 
         if end_code != 0 or len(response) < 2:
             return {'mode': 'unknown'}
 
         status = response[0]
-        if status & 0x01:
-            mode = 'run'
-        elif status & 0x02:
-            mode = 'program'
-        else:
-            mode = 'stop'
-
         return {
-            'mode': mode,
+            'mode': _STATUS_MODES[status].value,
             'fatal_error': bool(status & 0x40),
             'non_fatal_error': bool(status & 0x80),
         }
 
+    def controller_mode(self) -> PLCMode:
+        """Read controller status and return only the operating mode"""
+        end_code, response = self._send_fixed(self._STATUS_READ_TAIL)
+
+        if end_code != 0 or len(response) < 2:
+            return PLCMode.UNKNOWN
+        return _STATUS_MODES[response[0]]
+
     def run(self) -> bool:
         """Set PLC to RUN mode"""
-        end_code, _ = self._send_command(self.CMD_RUN, bytes([0x04, 0x01]))
+        end_code, _ = self._send_fixed(self._RUN_TAIL)
         return end_code == 0
 
     def stop(self) -> bool:
         """Set PLC to STOP mode"""
-        end_code, _ = self._send_command(self.CMD_STOP, b'')
+        end_code, _ = self._send_fixed(self._STOP_TAIL)
         return end_code == 0
 
     def authenticate(self, password: str) -> bool:
@@ -208,6 +432,123 @@ class FINSClient:
         return end_code == 0
 
 
+class _FINSDatagramProtocol(asyncio.DatagramProtocol):
+    """Routes datagrams and socket errors to an AsyncFINSClient"""
+
+    def __init__(self, client: 'AsyncFINSClient'):
+        self._client = client
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._client._on_response(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self._client._fail_pending(exc)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._client._fail_pending(exc or ConnectionError("FINS endpoint closed"))
+
+
+class AsyncFINSClient:
+    """
+    FINS/UDP client that keeps many commands in flight.
+
+    Each command gets a free service ID (SID) and a future; responses are
+    matched back by the SID echoed in byte 9, so commands sent together
+    overlap their round trips instead of queuing behind each other.
+    """
+
+    def __init__(self, host: str, port: int = 9600, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.local_node = 1
+        self.remote_node = 1
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._sid = 0
+
+    async def connect(self) -> None:
+        """Open the UDP endpoint on the running loop"""
+        self.loop = asyncio.get_running_loop()
+        self._transport, _ = await self.loop.create_datagram_endpoint(
+            lambda: _FINSDatagramProtocol(self),
+            remote_addr=(self.host, self.port),
+        )
+
+    def close(self) -> None:
+        """Close the endpoint, failing outstanding commands"""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+        self._fail_pending(ConnectionError("FINS endpoint closed"))
+
+    def _next_sid(self) -> int:
+        """Next service ID not used by an outstanding command"""
+        if len(self._pending) >= 256:
+            raise ConnectionError("Too many outstanding FINS commands")
+        while True:
+            self._sid = (self._sid + 1) & 0xFF
+            if self._sid not in self._pending:
+                return self._sid
+
+    async def send_command(self, command: int, data: bytes = b'') -> tuple[int, bytes]:
+        """Send FINS command and await its response"""
+        if self._transport is None:
+            raise ConnectionError("Not connected")
+
+        sid = self._next_sid()
+        future = self.loop.create_future()
+        self._pending[sid] = future
+
+        self._transport.sendto(_HEADER.pack(
+            0x80, 0x00, 0x02, 0x00, self.remote_node, 0x00,
+            0x00, self.local_node, 0x00, sid, command,
+        ) + data)
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(sid, None)
+
+    async def memory_area_read(self, area: int, address: int, count: int) -> bytes:
+        """Read from memory area"""
+        end_code, response = await self.send_command(
+            FINSClient.CMD_MEMORY_AREA_READ,
+            _AREA_REQUEST.pack(area, address & 0xFFFF, 0x00, count),
+        )
+        if end_code != 0:
+            raise FINSError(f"FINS error: {end_code:04X}", end_code)
+        return response
+
+    def _on_response(self, data: bytes) -> None:
+        """Resolve the command whose SID the response echoes"""
+        if len(data) < 14:
+            return
+        future = self._pending.get(data[9])
+        if future is not None and not future.done():
+            future.set_result((_U16_BE.unpack_from(data, 12)[0], data[14:]))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail every outstanding command"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+
+# Tag address: area prefix, word number and optional bit (e.g. D100, CIO0.05)
+_ADDR_RE = re.compile(r'(CIO|D|W|H|A|T|C)(\d+)(?:\.(\d+))?')
+
+_AREA_LOOKUP = {
+    'CIO': FINSClient.AREA_CIO,
+    'D': FINSClient.AREA_DM,
+    'W': FINSClient.AREA_WR,
+    'H': FINSClient.AREA_HR,
+    'A': FINSClient.AREA_AR,
+    'T': FINSClient.AREA_TIM,
+    'C': FINSClient.AREA_CNT,
+}
+
+
 class OmronFINSDriver(PLCDevice):
     """
     Omron FINS protocol driver.
@@ -227,47 +568,93 @@ class OmronFINSDriver(PLCDevice):
     - C: Counters (0000-4095)
     """
 
-    # Memory area mapping
-    AREA_MAP = {
-        MemoryArea.INPUT: FINSClient.AREA_CIO,
-        MemoryArea.OUTPUT: FINSClient.AREA_CIO,
-        MemoryArea.MEMORY: FINSClient.AREA_WR,
-        MemoryArea.DATA: FINSClient.AREA_DM,
-        MemoryArea.TIMER: FINSClient.AREA_TIM,
-        MemoryArea.COUNTER: FINSClient.AREA_CNT,
-    }
+    # FINS area codes, indexed by MemoryArea value
+    AREA_MAP = (
+        FINSClient.AREA_CIO,  # INPUT
+        FINSClient.AREA_CIO,  # OUTPUT
+        FINSClient.AREA_WR,   # MEMORY
+        FINSClient.AREA_DM,   # DATA
+        FINSClient.AREA_TIM,  # TIMER
+        FINSClient.AREA_CNT,  # COUNTER
+        None,                 # SPECIAL
+    )
+
+    # Words per memory area read request, and holes merged by read_tags
+    MAX_READ_WORDS = 999
+    READ_GAP = 2
+
+    # Memory area reads sent back to back before collecting responses; kept
+    # small so full-size responses fit the socket receive buffer
+    MAX_BATCH = 8
+
+    # Runs shorter than this are read word by word through Multiple Memory
+    # Area Read, up to MAX_MULTI_READ_ITEMS words per request (CS/CJ take 167)
+    MULTI_READ_MIN_WORDS = 4
+    MAX_MULTI_READ_ITEMS = 128
 
     def __init__(self):
         super().__init__()
         self._client: FINSClient | None = None
         self._ip: str | None = None
         self._port: int = 9600
+        self._async_client: AsyncFINSClient | None = None
+        self._pool: FINSConnectionPool | None = None
+        # Read time shared by reads inside a batch() block
+        self._batch_ts_ns: int | None = None
 
     def connect(self, ip: str, **kwargs) -> bool:
-        """Connect to Omron PLC via FINS"""
+        """
+        Connect to Omron PLC via FINS.
+
+        Args:
+            ip: IP address
+            port: FINS/UDP port (default 9600)
+            pool: FINSConnectionPool to take the client from (default:
+                the global pool); disconnect() returns it there
+            rcvbuf: Socket receive buffer size in bytes (default
+                FINSClient.RCVBUF_SIZE)
+            sndbuf: Socket send buffer size in bytes (default
+                FINSClient.SNDBUF_SIZE)
+        """
+        from plcforge.drivers.omron.pool import get_fins_pool
+
+        if self._client:
+            self.disconnect()
+
         self._ip = ip
         self._port = kwargs.get('port', 9600)
+        self._pool = kwargs.get('pool') or get_fins_pool()
 
         try:
-            self._client = FINSClient(ip, self._port)
-            self._connected = self._client.connect()
+            self._client = self._pool.acquire(ip, self._port)
+            self._connected = True
+            if kwargs.get('rcvbuf') or kwargs.get('sndbuf'):
+                self._client.set_buffer_sizes(kwargs.get('rcvbuf'), kwargs.get('sndbuf'))
 
-            if self._connected:
-                self._device_info = self._read_device_info()
+            self._device_info = self._read_device_info()
 
-            return self._connected
-        except Exception as e:
+            return True
+        except OSError as e:
             self._last_error = str(e)
             self._connected = False
             return False
 
     def disconnect(self) -> None:
-        """Disconnect"""
+        """Disconnect, returning the client to its pool"""
         if self._client:
-            self._client.close()
+            self._pool.release(self._client)
             self._client = None
+        if self._async_client:
+            self._async_client.close()
+            self._async_client = None
         self._connected = False
 
+    def _require(self) -> FINSClient:
+        """Connected client; raises ConnectionError if not connected"""
+        if self._client is None:
+            raise ConnectionError("Not connected")
+        return self._client
+
     def _read_device_info(self) -> DeviceInfo:
         """Read device info"""
         try:
@@ -280,7 +667,7 @@ class OmronFINSDriver(PLCDevice):
                 name="Omron PLC",
                 ip_address=self._ip,
             )
-        except Exception:
+        except _FINS_ERRORS:
             return DeviceInfo(
                 vendor="Omron",
                 model="Unknown",
@@ -307,29 +694,89 @@ class OmronFINSDriver(PLCDevice):
 
     def read_memory(self, area: MemoryArea, address: int, count: int) -> bytes:
         """Read memory"""
-        fins_area = self.AREA_MAP.get(area)
+        fins_area = self.AREA_MAP[area]
+        if fins_area is None:
+            raise ValueError(f"Unsupported area: {area}")
+
+        try:
+            return bytes(self._require().memory_area_read(fins_area, address, count))
+        except _FINS_ERRORS as e:
+            self._last_error = str(e)
+            raise
+
+    def read_memory_into(self, area: MemoryArea, address: int, count: int, buffer: Any) -> int:
+        """
+        Read count words into a caller-supplied bytearray or memoryview.
+
+        Pollers that reuse one destination avoid allocating a bytes
+        object per read.
+
+        Returns:
+            Number of bytes written to buffer
+        """
+        fins_area = self.AREA_MAP[area]
         if fins_area is None:
             raise ValueError(f"Unsupported area: {area}")
 
         try:
-            return self._client.memory_area_read(fins_area, address, count)
-        except Exception as e:
+            return self._require().memory_area_read_into(fins_area, address, count, buffer)
+        except _FINS_ERRORS as e:
+            self._last_error = str(e)
+            raise
+
+    def read_words(self, area: MemoryArea, address: int, count: int) -> array:
+        """
+        Read count words as an array of unsigned 16-bit values.
+
+        The whole response is decoded at once, which suits large blocks
+        such as recipes; wrap with numpy.frombuffer(words, dtype='u2')
+        if an ndarray is needed.
+        """
+        fins_area = self.AREA_MAP[area]
+        if fins_area is None:
+            raise ValueError(f"Unsupported area: {area}")
+
+        try:
+            return _decode_words(self._require().memory_area_read(fins_area, address, count))
+        except _FINS_ERRORS as e:
             self._last_error = str(e)
             raise
 
     def write_memory(self, area: MemoryArea, address: int, data: bytes) -> bool:
         """Write memory"""
-        fins_area = self.AREA_MAP.get(area)
+        fins_area = self.AREA_MAP[area]
         if fins_area is None:
             self._last_error = f"Unsupported area: {area}"
             return False
 
         try:
-            return self._client.memory_area_write(fins_area, address, data)
-        except Exception as e:
+            return self._require().memory_area_write(fins_area, address, data)
+        except _FINS_ERRORS as e:
             self._last_error = str(e)
             return False
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Give every read inside the block the same timestamp.
+
+        Usage:
+            with driver.batch():
+                speed = driver.read_tag("D100")
+                flags = driver.read_tags(["W0.00", "W0.01"])
+        """
+        outer = self._batch_ts_ns
+        if outer is None:
+            self._batch_ts_ns = time.time_ns()
+        try:
+            yield
+        finally:
+            self._batch_ts_ns = outer
+
+    def _timestamp_ns(self) -> int:
+        """Batch timestamp, or the current time outside a batch() block"""
+        return self._batch_ts_ns or time.time_ns()
+
     def read_tag(self, tag_name: str) -> TagValue:
         """
         Read by Omron address format.
@@ -344,125 +791,302 @@ class OmronFINSDriver(PLCDevice):
         """
         try:
             addr_info = self._parse_address(tag_name)
-            value = self._read_by_address(addr_info)
+            values = self._read_coalesced({tag_name: addr_info})
+            if tag_name not in values:
+                raise FINSError(self._last_error or f"Read failed: {tag_name}")
 
             return TagValue(
                 name=tag_name,
-                value=value,
+                value=values[tag_name],
                 data_type=addr_info['type'],
                 address=tag_name,
-                timestamp=datetime.now(),
+                timestamp_ns=self._timestamp_ns(),
             )
-        except Exception as e:
+        except (*_FINS_ERRORS, ValueError) as e:
             self._last_error = str(e)
             raise
 
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags with one memory area read per address run.
+
+        Words (and bits within them) are grouped per FINS area, sorted and
+        merged into runs, so N neighbouring tags cost one round-trip.
+        """
+        parsed: dict[str, Mapping[str, Any]] = {}
+        for name in dict.fromkeys(tag_names):
+            try:
+                parsed[name] = self._parse_address(name)
+            except ValueError as e:
+                self._last_error = str(e)
+
+        values = self._read_coalesced(parsed)
+        timestamp_ns = self._timestamp_ns()
+
+        tag_values = []
+        for name in tag_names:
+            addr_info = parsed.get(name)
+            good = name in values
+            tag_values.append(TagValue(
+                name=name,
+                value=values[name] if good else None,
+                data_type=addr_info['type'] if addr_info else "Unknown",
+                address=name,
+                quality="good" if good else "bad",
+                timestamp_ns=timestamp_ns,
+            ))
+        return tag_values
+
+    def _read_coalesced(self, parsed: dict[str, Mapping[str, Any]]) -> dict[str, Any]:
+        """
+        Read parsed addresses, batching the reads for coalesced runs.
+
+        Runs of MULTI_READ_MIN_WORDS or more get one memory area read;
+        words of shorter runs are gathered into multiple memory area reads.
+
+        Returns:
+            Values by tag name; tags in failed runs are omitted and the
+            error is left in _last_error
+        """
+        values: dict[str, Any] = {}
+        plan = self._plan_reads(parsed)
+        if len(plan) == 1:
+            fins_area, start, count, members = plan[0]
+            try:
+                data = self._require().memory_area_read(fins_area, start, count)
+            except _FINS_ERRORS as e:
+                self._last_error = str(e)
+                return values
+            self._decode_run(data, start, members, parsed, values)
+            return values
+
+        # Several runs: long runs get a memory area read each, the words of
+        # short runs are gathered into multiple memory area reads
+        commands: list[tuple[int, bytes]] = []
+        targets: list[Any] = []
+        scattered: list[tuple[int, int, list[str]]] = []
+        for fins_area, start, count, members in plan:
+            if count >= self.MULTI_READ_MIN_WORDS:
+                commands.append((
+                    FINSClient.CMD_MEMORY_AREA_READ,
+                    _AREA_REQUEST.pack(fins_area, start & 0xFFFF, 0x00, count),
+                ))
+                targets.append((start, members))
+                continue
+
+            names_by_word: dict[int, list[str]] = {}
+            for address, name in members:
+                names_by_word.setdefault(address, []).append(name)
+            scattered += [(fins_area, address, names) for address, names in names_by_word.items()]
+
+        for offset in range(0, len(scattered), self.MAX_MULTI_READ_ITEMS):
+            items = scattered[offset:offset + self.MAX_MULTI_READ_ITEMS]
+            commands.append((
+                FINSClient.CMD_MULTIPLE_MEMORY_AREA_READ,
+                FINSClient._pack_multiple_read([(area, address) for area, address, _ in items]),
+            ))
+            targets.append(items)
+
+        # Send each batch of commands back to back
+        for offset in range(0, len(commands), self.MAX_BATCH):
+            batch = commands[offset:offset + self.MAX_BATCH]
+            try:
+                responses = self._require().send_batch(batch)
+            except _FINS_ERRORS as e:
+                self._last_error = str(e)
+                continue
+
+            batch_targets = targets[offset:offset + self.MAX_BATCH]
+            for (command, _), target, (end_code, data) in zip(
+                batch, batch_targets, responses, strict=True
+            ):
+                if end_code != 0:
+                    self._last_error = f"FINS error: {end_code:04X}"
+                elif command == FINSClient.CMD_MEMORY_AREA_READ:
+                    self._decode_run(data, target[0], target[1], parsed, values)
+                else:
+                    try:
+                        words = FINSClient._unpack_multiple_read(data, len(target))
+                    except FINSError as e:
+                        self._last_error = str(e)
+                        continue
+                    for (_, _, names), word_value in zip(target, words, strict=True):
+                        for name in names:
+                            bit = parsed[name]['bit']
+                            values[name] = (
+                                word_value if bit is None else bool(word_value & (1 << bit))
+                            )
+
+        return values
+
+    async def read_tags_async(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags without blocking the event loop.
+
+        Runs are planned as in read_tags, but every memory area read is
+        sent at once over an AsyncFINSClient, so the round trips overlap.
+        """
+        client = self._async_client
+        if client is None or client.loop is not asyncio.get_running_loop():
+            if client is not None:
+                client.close()
+            client = AsyncFINSClient(self._ip, self._port)
+            await client.connect()
+            self._async_client = client
+
+        parsed: dict[str, Mapping[str, Any]] = {}
+        for name in dict.fromkeys(tag_names):
+            try:
+                parsed[name] = self._parse_address(name)
+            except ValueError as e:
+                self._last_error = str(e)
+
+        plan = self._plan_reads(parsed)
+        results = await asyncio.gather(
+            *(client.memory_area_read(area, start, count) for area, start, count, _ in plan),
+            return_exceptions=True,
+        )
+
+        values: dict[str, Any] = {}
+        for (_, start, _, members), data in zip(plan, results, strict=True):
+            if isinstance(data, BaseException):
+                self._last_error = str(data)
+                continue
+            self._decode_run(data, start, members, parsed, values)
+
+        timestamp_ns = self._timestamp_ns()
+        return [
+            TagValue(
+                name=name,
+                value=values.get(name),
+                data_type=parsed[name]['type'] if name in parsed else "Unknown",
+                address=name,
+                quality="good" if name in values else "bad",
+                timestamp_ns=timestamp_ns,
+            )
+            for name in tag_names
+        ]
+
+    def _plan_reads(
+        self,
+        parsed: dict[str, Mapping[str, Any]]
+    ) -> list[tuple[int, int, int, list[tuple[int, str]]]]:
+        """Group parsed addresses into (fins_area, start, count, members) runs"""
+        by_area: dict[int, list[tuple[int, str]]] = {}
+        for name, addr_info in parsed.items():
+            by_area.setdefault(addr_info['fins_area'], []).append((addr_info['address'], name))
+
+        return [
+            (fins_area, start, count, members)
+            for fins_area, points in by_area.items()
+            for start, count, members in coalesce_ranges(
+                points, self.READ_GAP, self.MAX_READ_WORDS
+            )
+        ]
+
+    @staticmethod
+    def _decode_run(
+        data: bytes,
+        start: int,
+        members: list[tuple[int, str]],
+        parsed: dict[str, Mapping[str, Any]],
+        values: dict[str, Any],
+    ) -> None:
+        """Extract word or bit values for each member of a run"""
+        words = _decode_words(data)
+        for address, name in members:
+            word_value = words[address - start]
+            bit = parsed[name]['bit']
+            values[name] = word_value if bit is None else bool(word_value & (1 << bit))
+
     def write_tag(self, tag_name: str, value: Any) -> bool:
         """Write by Omron address format"""
         try:
             addr_info = self._parse_address(tag_name)
             return self._write_by_address(addr_info, value)
-        except Exception as e:
+        except (*_FINS_ERRORS, ValueError, TypeError, struct.error) as e:
             self._last_error = str(e)
             return False
 
-    def _parse_address(self, address: str) -> dict[str, Any]:
-        """Parse Omron address format"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_address(address: str) -> Mapping[str, Any]:
+        """Parse Omron address format (cached, result is read-only)"""
         address = address.upper().strip()
-        result = {
-            'area': None,
-            'fins_area': None,
-            'address': 0,
-            'bit': None,
-            'type': 'WORD',
-        }
-
-        # Check for bit address (e.g., D0.00)
-        if '.' in address:
-            parts = address.split('.')
-            address = parts[0]
-            result['bit'] = int(parts[1])
-            result['type'] = 'BOOL'
-
-        if address.startswith('D'):
-            result['area'] = 'D'
-            result['fins_area'] = FINSClient.AREA_DM
-            result['address'] = int(address[1:])
-
-        elif address.startswith('W'):
-            result['area'] = 'W'
-            result['fins_area'] = FINSClient.AREA_WR
-            result['address'] = int(address[1:])
-
-        elif address.startswith('H'):
-            result['area'] = 'H'
-            result['fins_area'] = FINSClient.AREA_HR
-            result['address'] = int(address[1:])
-
-        elif address.startswith('A'):
-            result['area'] = 'A'
-            result['fins_area'] = FINSClient.AREA_AR
-            result['address'] = int(address[1:])
-
-        elif address.startswith('CIO'):
-            result['area'] = 'CIO'
-            result['fins_area'] = FINSClient.AREA_CIO
-            result['address'] = int(address[3:])
-
-        elif address.startswith('T'):
-            result['area'] = 'T'
-            result['fins_area'] = FINSClient.AREA_TIM
-            result['address'] = int(address[1:])
-
-        elif address.startswith('C'):
-            result['area'] = 'C'
-            result['fins_area'] = FINSClient.AREA_CNT
-            result['address'] = int(address[1:])
-
-        else:
+        match = _ADDR_RE.fullmatch(address)
+        if match is None:
             raise ValueError(f"Unknown address format: {address}")
 
-        return result
+        area, offset, bit = match.groups()
+        if bit is not None and int(bit) > 15:
+            raise ValueError(f"Bit number out of range 0-15: {address}")
 
-    def _read_by_address(self, addr_info: dict[str, Any]) -> Any:
-        """Read value by parsed address"""
-        data = self._client.memory_area_read(
-            addr_info['fins_area'],
-            addr_info['address'],
-            1
-        )
+        return MappingProxyType({
+            'area': area,
+            'fins_area': _AREA_LOOKUP[area],
+            'address': int(offset),
+            'bit': None if bit is None else int(bit),
+            'type': 'WORD' if bit is None else 'BOOL',
+        })
 
-        word_value = struct.unpack('>H', data[:2])[0]
+    def write_bits(self, bits: dict[str, bool]) -> bool:
+        """
+        Write several bit addresses with one read-modify-write per word.
 
-        if addr_info['bit'] is not None:
-            return bool(word_value & (1 << addr_info['bit']))
+        Bits are grouped by area and word first, so setting K bits of the
+        same word costs two round trips instead of 2K. Stops at the first
+        word that fails.
+        """
+        # (fins_area, word address) -> [set mask, clear mask]
+        words: dict[tuple[int, int], list[int]] = {}
+        try:
+            for name, value in bits.items():
+                addr_info = self._parse_address(name)
+                if addr_info['bit'] is None:
+                    raise ValueError(f"Not a bit address: {name}")
+
+                masks = words.setdefault((addr_info['fins_area'], addr_info['address']), [0, 0])
+                mask = 1 << addr_info['bit']
+                if value:
+                    masks[0] |= mask
+                    masks[1] &= ~mask
+                else:
+                    masks[1] |= mask
+                    masks[0] &= ~mask
+
+            modify_word = self._modify_word
+            for (fins_area, address), (set_mask, clear_mask) in words.items():
+                if not modify_word(fins_area, address, set_mask, clear_mask):
+                    self._last_error = f"Bit write failed at word {address}"
+                    return False
+            return True
+        except (*_FINS_ERRORS, ValueError) as e:
+            self._last_error = str(e)
+            return False
 
-        return word_value
+    def _modify_word(self, fins_area: int, address: int, set_mask: int, clear_mask: int) -> bool:
+        """Read one word, set and clear the masked bits, and write it back"""
+        client = self._require()
+        data = client.memory_area_read(fins_area, address, 1)
+        word_value = (_U16_BE.unpack_from(data)[0] | set_mask) & ~clear_mask
+        return client.memory_area_write(fins_area, address, _U16_BE.pack(word_value))
 
-    def _write_by_address(self, addr_info: dict[str, Any], value: Any) -> bool:
+    def _write_by_address(self, addr_info: Mapping[str, Any], value: Any) -> bool:
         """Write value by parsed address"""
         if addr_info['bit'] is not None:
             # Read-modify-write for bit access
-            data = self._client.memory_area_read(
+            mask = 1 << addr_info['bit']
+            return self._modify_word(
                 addr_info['fins_area'],
                 addr_info['address'],
-                1
+                mask if value else 0,
+                0 if value else mask,
             )
-            word_value = struct.unpack('>H', data[:2])[0]
-
-            if value:
-                word_value |= (1 << addr_info['bit'])
-            else:
-                word_value &= ~(1 << addr_info['bit'])
-
-            data = struct.pack('>H', word_value)
-        else:
-            data = struct.pack('>H', int(value))
 
-        return self._client.memory_area_write(
+        return self._require().memory_area_write(
             addr_info['fins_area'],
             addr_info['address'],
-            data
+            _U16_BE.pack(int(value))
         )
 
     def upload_program(self) -> PLCProgram:
@@ -489,41 +1113,31 @@ class OmronFINSDriver(PLCDevice):
     def start(self) -> bool:
         """Start PLC"""
         try:
-            return self._client.run()
-        except Exception as e:
+            return self._require().run()
+        except _FINS_ERRORS as e:
             self._last_error = str(e)
             return False
 
     def stop(self) -> bool:
         """Stop PLC"""
         try:
-            return self._client.stop()
-        except Exception as e:
+            return self._require().stop()
+        except _FINS_ERRORS as e:
             self._last_error = str(e)
             return False
 
     def get_mode(self) -> PLCMode:
         """Get PLC mode"""
         try:
-            status = self._client.controller_status_read()
-            mode_str = status.get('mode', 'unknown')
-
-            if mode_str == 'run':
-                return PLCMode.RUN
-            elif mode_str == 'program':
-                return PLCMode.PROGRAM
-            elif mode_str == 'stop':
-                return PLCMode.STOP
-            else:
-                return PLCMode.UNKNOWN
-        except Exception:
+            return self._require().controller_mode()
+        except _FINS_ERRORS:
             return PLCMode.UNKNOWN
 
     def authenticate(self, password: str) -> bool:
         """Authenticate with password"""
         try:
-            return self._client.authenticate(password)
-        except Exception as e:
+            return self._require().authenticate(password)
+        except _FINS_ERRORS as e:
             self._last_error = str(e)
             return False
 
@@ -534,10 +1148,10 @@ class OmronFINSDriver(PLCDevice):
     def get_diagnostics(self) -> dict[str, Any]:
         """Get diagnostics"""
         try:
-            status = self._client.controller_status_read()
+            status = self._require().controller_status_read()
             return {
                 'connected': self._connected,
                 'status': status,
             }
-        except Exception as e:
+        except _FINS_ERRORS as e:
             return {'error': str(e)}
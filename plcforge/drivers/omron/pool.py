@@ -0,0 +1,89 @@
+"""
+FINS Connection Pool
+
+Keeps connected FINSClient objects between driver sessions so polling
+many PLCs does not tear down and recreate a socket on every connect.
+"""
+
+import threading
+import time
+
+from plcforge.drivers.omron.fins_driver import FINSClient
+
+
+class FINSConnectionPool:
+    """
+    Thread-safe pool of FINS clients keyed by (ip, port).
+
+    A client is handed to one driver at a time: acquire() checks out an
+    idle client (or opens a new one) and release() returns it for the
+    next connect to the same PLC. At most max_size idle clients are kept.
+
+    Usage:
+        pool = FINSConnectionPool(max_size=64)
+        driver.connect("192.168.250.1", pool=pool)
+        ...
+        pool.close_idle(ttl=300)
+    """
+
+    def __init__(self, max_size: int = 32):
+        self._idle: dict[tuple[str, int], list[tuple[float, FINSClient]]] = {}
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def acquire(self, ip: str, port: int = 9600) -> FINSClient:
+        """Check out a connected client for ip:port"""
+        with self._lock:
+            idle = self._idle.get((ip, port))
+            if idle:
+                return idle.pop()[1]
+
+        client = FINSClient(ip, port)
+        if not client.connect():
+            raise ConnectionError(f"Could not open FINS connection to {ip}:{port}")
+        return client
+
+    def release(self, client: FINSClient) -> None:
+        """Return a client to the pool, closing it if the pool is full"""
+        with self._lock:
+            if len(self) < self._max_size:
+                self._idle.setdefault((client.host, client.port), []).append(
+                    (time.monotonic(), client)
+                )
+                return
+        client.close()
+
+    def close_idle(self, ttl: float) -> int:
+        """Close clients idle for more than ttl seconds, returning how many"""
+        cutoff = time.monotonic() - ttl
+        expired = []
+
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                expired += [client for released, client in idle if released < cutoff]
+                idle[:] = [entry for entry in idle if entry[0] >= cutoff]
+                if not idle:
+                    del self._idle[key]
+
+        for client in expired:
+            client.close()
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close every idle client"""
+        self.close_idle(ttl=-1)
+
+    def __len__(self) -> int:
+        return sum(len(idle) for idle in self._idle.values())
+
+
+# Global pool used by drivers connected without an explicit pool
+_pool: FINSConnectionPool | None = None
+
+
+def get_fins_pool() -> FINSConnectionPool:
+    """Get global FINS connection pool"""
+    global _pool
+    if _pool is None:
+        _pool = FINSConnectionPool()
+    return _pool
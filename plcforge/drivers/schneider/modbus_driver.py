@@ -5,14 +5,19 @@ Supports Modicon M340, M580, Premium, Quantum, and Micro series PLCs.
 Uses pymodbus library for Modbus TCP/RTU communication.
 """
 
+import asyncio
+import functools
+import re
+import socket
 import struct
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from enum import IntEnum
 from typing import Any
 
 try:
-    from pymodbus.client import ModbusSerialClient, ModbusTcpClient
-    from pymodbus.constants import Endian
-    from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
+    from pymodbus.client import AsyncModbusTcpClient, ModbusSerialClient, ModbusTcpClient
     PYMODBUS_AVAILABLE = True
 except ImportError:
     PYMODBUS_AVAILABLE = False
@@ -29,6 +34,9 @@ from plcforge.drivers.base import (
     PLCProgram,
     ProtectionStatus,
     TagValue,
+    coalesce_ranges,
+    pack_bits,
+    unpack_bits,
 )
 
 
@@ -56,6 +64,69 @@ ADDRESS_RANGES = {
     '%MF': (0, 0x3FFF, SchneiderMemoryType.HOLDING_REGISTER),   # Internal floats
 }
 
+# Address type prefix (longest alternative first), word number and optional bit
+_ADDRESS_RE = re.compile(
+    '(' + '|'.join(sorted(ADDRESS_RANGES, key=len, reverse=True)) + r')(\d+)(?:\.(\d+))?'
+)
+
+# Register pair (high word first) and the 32-bit values it holds, with the
+# Struct methods bound once so the 32-bit codecs skip the attribute lookups
+_REGISTER_PAIR = struct.Struct('>HH')
+_DINT = struct.Struct('>i')
+_REAL = struct.Struct('>f')
+_pack_pair, _unpack_pair = _REGISTER_PAIR.pack, _REGISTER_PAIR.unpack
+_pack_dint, _unpack_dint = _DINT.pack, _DINT.unpack
+_pack_real, _unpack_real = _REAL.pack, _REAL.unpack
+
+
+def _decode_dint(response: Any, i: int) -> int:
+    """DINT held in registers i and i + 1 of a read response"""
+    registers = response.registers
+    return _unpack_dint(_pack_pair(registers[i], registers[i + 1]))[0]
+
+
+def _decode_real(response: Any, i: int) -> float:
+    """REAL held in registers i and i + 1 of a read response"""
+    registers = response.registers
+    return _unpack_real(_pack_pair(registers[i], registers[i + 1]))[0]
+
+
+# Registers spanned by each tag data type (default 1)
+_WIDTHS = {"DINT": 2, "REAL": 2}
+
+# Value of a tag at an offset into a read response, by data type
+_DECODERS: dict[str, Callable[[Any, int], Any]] = {
+    "BOOL": lambda response, i: bool(response.bits[i]),
+    "WORD": lambda response, i: response.registers[i],
+    "DINT": _decode_dint,
+    "REAL": _decode_real,
+}
+
+# Register pair written for a 32-bit tag value, by data type
+_ENCODERS: dict[str, Callable[[Any], list[int]]] = {
+    "DINT": lambda value: list(_unpack_pair(_pack_dint(int(value)))),
+    "REAL": lambda value: list(_unpack_pair(_pack_real(float(value)))),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _be_words(count: int) -> struct.Struct:
+    """Precompiled big-endian format for count registers"""
+    return struct.Struct(f'>{count}H')
+
+
+@functools.lru_cache(maxsize=64)
+def _native_words(count: int) -> struct.Struct:
+    """Precompiled native-order format for count registers (array('H') layout)"""
+    return struct.Struct(f'={count}H')
+
+
+def _check(response: Any) -> Any:
+    """Return a read response, raising ValueError if it is a Modbus exception"""
+    if response.isError():
+        raise ValueError(f"Read error: {response}")
+    return response
+
 
 class SchneiderModbusDriver(PLCDevice):
     """
@@ -71,10 +142,32 @@ class SchneiderModbusDriver(PLCDevice):
     Uses standard Modbus TCP/RTU with Schneider-specific addressing.
     """
 
+    __slots__ = (
+        '_client', '_ip', '_port', '_unit_id', '_timeout', '_use_rtu',
+        '_serial_port', '_baudrate', '_read_gap', '_supports_fc43', '_async_client',
+        '_async_loop', '_async_lock', '_tag_cache', '_cache_ttl',
+    )
+
     # Default ports
     DEFAULT_TCP_PORT = 502
     DEFAULT_UNIT_ID = 1
 
+    # Per-request limits (Modbus spec) and holes merged by read_tags
+    MAX_READ_REGISTERS = 125
+    MAX_READ_BITS = 2000
+    READ_GAP = 8
+
+    # Tag values kept for read_tag when a cache TTL is set
+    TAG_CACHE_SIZE = 1024
+
+    # pymodbus read method for each memory type
+    _READ_METHODS = {
+        SchneiderMemoryType.DISCRETE_INPUT: 'read_discrete_inputs',
+        SchneiderMemoryType.COIL: 'read_coils',
+        SchneiderMemoryType.INPUT_REGISTER: 'read_input_registers',
+        SchneiderMemoryType.HOLDING_REGISTER: 'read_holding_registers',
+    }
+
     def __init__(self):
         super().__init__()
         if not PYMODBUS_AVAILABLE:
@@ -88,6 +181,16 @@ class SchneiderModbusDriver(PLCDevice):
         self._timeout: float = 5.0
         self._use_rtu: bool = False
         self._serial_port: str | None = None
+        self._baudrate: int = 19200
+        self._read_gap: int = self.READ_GAP
+        self._supports_fc43: bool = True
+        self._async_client: AsyncModbusTcpClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_lock: asyncio.Lock | None = None
+
+        # Recent read_tag results: tag name -> (monotonic time, value)
+        self._tag_cache: OrderedDict[str, tuple[float, TagValue]] = OrderedDict()
+        self._cache_ttl: float = 0.0
 
     @property
     def vendor(self) -> str:
@@ -98,7 +201,9 @@ class SchneiderModbusDriver(PLCDevice):
         ip: str,
         port: int = DEFAULT_TCP_PORT,
         unit_id: int = DEFAULT_UNIT_ID,
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        read_gap: int = READ_GAP,
+        cache_ttl: float = 0.0
     ) -> bool:
         """
         Connect to Schneider PLC via Modbus TCP.
@@ -108,40 +213,36 @@ class SchneiderModbusDriver(PLCDevice):
             port: TCP port (default 502)
             unit_id: Modbus unit ID (default 1)
             timeout: Connection timeout in seconds
+            read_gap: Unused addresses read_tags may read to merge two runs
+            cache_ttl: Seconds read_tag may answer from its last result
+                (0 disables the cache)
         """
+        if (ip, unit_id) != (self._ip, self._unit_id):
+            # Different device: probe identification again
+            self._supports_fc43 = True
         self._ip = ip
         self._port = port
         self._unit_id = unit_id
         self._timeout = timeout
+        self._read_gap = read_gap
+        self._cache_ttl = cache_ttl
+        self._use_rtu = False
 
-        try:
-            self._client = ModbusTcpClient(
-                host=ip,
-                port=port,
-                timeout=timeout
-            )
-
-            if not self._client.connect():
-                self._last_error = "Failed to establish TCP connection"
-                return False
-
-            self._connected = True
-
-            # Read device identification
-            self._device_info = self._read_device_info()
-
-            return True
-        except Exception as e:
-            self._last_error = f"Connection failed: {e}"
-            self._connected = False
+        if not self._open_client():
             return False
 
+        # Read device identification
+        self._device_info = self._read_device_info()
+        return True
+
     def connect_rtu(
         self,
         port: str,
         baudrate: int = 19200,
         unit_id: int = DEFAULT_UNIT_ID,
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        read_gap: int = READ_GAP,
+        cache_ttl: float = 0.0
     ) -> bool:
         """
         Connect to Schneider PLC via Modbus RTU (serial).
@@ -151,35 +252,87 @@ class SchneiderModbusDriver(PLCDevice):
             baudrate: Baud rate (default 19200)
             unit_id: Modbus unit ID (default 1)
             timeout: Communication timeout in seconds
+            read_gap: Unused addresses read_tags may read to merge two runs
+            cache_ttl: Seconds read_tag may answer from its last result
+                (0 disables the cache)
         """
+        if (port, unit_id) != (self._serial_port, self._unit_id):
+            # Different device: probe identification again
+            self._supports_fc43 = True
         self._serial_port = port
+        self._baudrate = baudrate
         self._unit_id = unit_id
         self._timeout = timeout
+        self._read_gap = read_gap
+        self._cache_ttl = cache_ttl
         self._use_rtu = True
 
-        try:
-            self._client = ModbusSerialClient(
-                port=port,
-                baudrate=baudrate,
-                timeout=timeout,
-                parity='E',  # Even parity (Schneider default)
-                stopbits=1,
-                bytesize=8
-            )
+        if not self._open_client():
+            return False
 
-            if not self._client.connect():
-                self._last_error = "Failed to establish serial connection"
-                return False
+        self._device_info = self._read_device_info()
+        return True
 
-            self._connected = True
-            self._device_info = self._read_device_info()
+    def reconnect(self) -> bool:
+        """
+        Reopen the link to the last connected PLC.
+
+        Unlike connect(), the cached DeviceInfo is kept and no device
+        identification request is sent, so supervisors that reopen the
+        session periodically pay only for the TCP (or serial) open.
+        """
+        if self._ip is None and self._serial_port is None:
+            self._last_error = "No previous connection to reopen"
+            return False
 
-            return True
+        self.disconnect()
+        return self._open_client()
+
+    def _open_client(self) -> bool:
+        """
+        Open the TCP or serial link with the stored connection settings.
+
+        Only a connected client is published, so _require() is one test.
+        """
+        try:
+            if self._use_rtu:
+                client = ModbusSerialClient(
+                    port=self._serial_port,
+                    baudrate=self._baudrate,
+                    timeout=self._timeout,
+                    parity='E',  # Even parity (Schneider default)
+                    stopbits=1,
+                    bytesize=8
+                )
+                if not client.connect():
+                    self._last_error = "Failed to establish serial connection"
+                    return False
+            else:
+                client = ModbusTcpClient(
+                    host=self._ip,
+                    port=self._port,
+                    timeout=self._timeout
+                )
+                if not client.connect():
+                    self._last_error = "Failed to establish TCP connection"
+                    return False
+
+                # Modbus polls are small request/response PDUs; disable Nagle
+                # and let the OS notice a silently dropped PLC
+                sock = getattr(client, 'socket', None)
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         except Exception as e:
-            self._last_error = f"RTU connection failed: {e}"
+            prefix = "RTU connection" if self._use_rtu else "Connection"
+            self._last_error = f"{prefix} failed: {e}"
             self._connected = False
             return False
 
+        self._client = client
+        self._connected = True
+        return True
+
     def disconnect(self) -> None:
         """Disconnect from PLC."""
         if self._client:
@@ -188,44 +341,74 @@ class SchneiderModbusDriver(PLCDevice):
             except:
                 pass
             self._client = None
+        if self._async_client:
+            self._async_client.close()
+            self._async_client = None
+        self._tag_cache.clear()
         self._connected = False
 
+    def _require(self) -> 'ModbusTcpClient | ModbusSerialClient':
+        """Connected client; raises ConnectionError if not connected"""
+        client = self._client
+        if client is None:
+            raise ConnectionError("Not connected")
+        return client
+
     def _read_device_info(self) -> DeviceInfo:
-        """Read device identification via Modbus Device Information."""
+        """
+        Read device identification via Modbus Device Information.
+
+        Servers that reject function code 43/14 are remembered, so later
+        connections to the same device skip the probe.
+        """
         model = "Modicon"
         firmware = ""
 
-        try:
-            if self._client:
-                # Try to read device identification (function code 43/14)
-                # Object ID 0x00 = Vendor Name
-                # Object ID 0x01 = Product Code
-                # Object ID 0x02 = Major/Minor Revision
+        if self._client and self._supports_fc43:
+            # Read device identification (function code 43/14)
+            # Object ID 0x00 = Vendor Name
+            # Object ID 0x01 = Product Code
+            # Object ID 0x02 = Major/Minor Revision
+            try:
                 response = self._client.read_device_information(
                     slave=self._unit_id
                 )
-                if response and not response.isError():
-                    info = response.information
-                    if 0x01 in info:
-                        model = info[0x01].decode('ascii', errors='ignore')
-                    if 0x02 in info:
-                        firmware = info[0x02].decode('ascii', errors='ignore')
-        except Exception:
-            pass
+            except AttributeError:
+                # Client has no device information support
+                self._supports_fc43 = False
+                response = None
+            except Exception as e:
+                self._last_error = f"Device identification failed: {e}"
+                response = None
+
+            if response is not None and response.isError():
+                # Exception response (illegal function): not implemented
+                self._supports_fc43 = False
+            elif response is not None:
+                info = response.information
+                if 0x01 in info:
+                    model = info[0x01].decode('ascii', errors='ignore')
+                if 0x02 in info:
+                    firmware = info[0x02].decode('ascii', errors='ignore')
 
         return DeviceInfo(
             vendor="Schneider Electric",
             model=model,
-            firmware_version=firmware,
-            serial_number="",
+            firmware=firmware,
+            serial="",
+            name=model,
             ip_address=self._ip or self._serial_port or "",
+            additional_info={
+                'unit_id': self._unit_id,
+                'connection_type': 'rtu' if self._use_rtu else 'tcp',
+            }
         )
 
     def get_device_info(self) -> DeviceInfo:
-        """Get device information."""
-        if self._device_info:
-            return self._device_info
-        return self._read_device_info()
+        """Get device information (read once per connection)."""
+        if self._device_info is None:
+            self._device_info = self._read_device_info()
+        return self._device_info
 
     def get_protection_status(self) -> ProtectionStatus:
         """Get protection status."""
@@ -240,90 +423,65 @@ class SchneiderModbusDriver(PLCDevice):
 
         Maps generic memory areas to Schneider-specific addresses.
         """
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
 
         # Map memory areas to Modbus function codes
         if area == MemoryArea.INPUT:
             # Read discrete inputs
-            response = self._client.read_discrete_inputs(
+            response = _check(client.read_discrete_inputs(
                 address=start,
                 count=length * 8,
                 slave=self._unit_id
-            )
-            if response.isError():
-                raise ValueError(f"Read error: {response}")
+            ))
             # Pack bits into bytes
-            bits = response.bits[:length * 8]
-            return bytes([
-                sum(bits[i*8:(i+1)*8][j] << j for j in range(8))
-                for i in range(length)
-            ])
+            return pack_bits(response.bits, length)
 
         elif area == MemoryArea.OUTPUT:
             # Read coils
-            response = self._client.read_coils(
+            response = _check(client.read_coils(
                 address=start,
                 count=length * 8,
                 slave=self._unit_id
-            )
-            if response.isError():
-                raise ValueError(f"Read error: {response}")
-            bits = response.bits[:length * 8]
-            return bytes([
-                sum(bits[i*8:(i+1)*8][j] << j for j in range(8))
-                for i in range(length)
-            ])
+            ))
+            return pack_bits(response.bits, length)
 
         elif area in (MemoryArea.MEMORY, MemoryArea.DATA):
             # Read holding registers
             # Length is in bytes, convert to registers (2 bytes each)
             reg_count = (length + 1) // 2
-            response = self._client.read_holding_registers(
+            response = _check(client.read_holding_registers(
                 address=start,
                 count=reg_count,
                 slave=self._unit_id
-            )
-            if response.isError():
-                raise ValueError(f"Read error: {response}")
+            ))
             # Convert registers to bytes
-            result = b''
-            for reg in response.registers:
-                result += struct.pack('>H', reg)
-            return result[:length]
+            registers = response.registers
+            return _be_words(len(registers)).pack(*registers)[:length]
 
         else:
             raise ValueError(f"Unsupported memory area: {area}")
 
     def write_memory(self, area: MemoryArea, start: int, data: bytes) -> bool:
         """Write to memory area."""
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
+        self._tag_cache.clear()
 
         try:
             if area == MemoryArea.OUTPUT:
                 # Write coils
-                bits = []
-                for byte in data:
-                    for i in range(8):
-                        bits.append(bool(byte & (1 << i)))
-                response = self._client.write_coils(
+                response = client.write_coils(
                     address=start,
-                    values=bits,
+                    values=unpack_bits(data),
                     slave=self._unit_id
                 )
                 return not response.isError()
 
             elif area in (MemoryArea.MEMORY, MemoryArea.DATA):
-                # Write holding registers
-                registers = []
-                for i in range(0, len(data), 2):
-                    if i + 1 < len(data):
-                        reg = struct.unpack('>H', data[i:i+2])[0]
-                    else:
-                        reg = data[i] << 8
-                    registers.append(reg)
-                response = self._client.write_registers(
+                # Write holding registers (an odd tail byte is the high byte)
+                if len(data) % 2:
+                    data = bytes(data) + b'\x00'
+                registers = list(_be_words(len(data) // 2).unpack(data))
+                response = client.write_registers(
                     address=start,
                     values=registers,
                     slave=self._unit_id
@@ -349,177 +507,250 @@ class SchneiderModbusDriver(PLCDevice):
         - %Q1.2 (output bit)
         - %M100 (internal bit)
         """
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
 
-        address_type, address, bit = self._parse_address(tag_name)
-        value: Any = None
-        data_type = "WORD"
+        if self._cache_ttl:
+            entry = self._tag_cache.get(tag_name)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                self._tag_cache.move_to_end(tag_name)
+                return entry[1]
 
-        try:
-            if address_type in ('%I',):
-                # Read discrete input
-                response = self._client.read_discrete_inputs(
-                    address=address * 8 + (bit or 0),
-                    count=1,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                value = response.bits[0]
-                data_type = "BOOL"
-
-            elif address_type in ('%Q', '%M'):
-                # Read coil
-                response = self._client.read_coils(
-                    address=address * 8 + (bit or 0) if bit is not None else address,
-                    count=1,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                value = response.bits[0]
-                data_type = "BOOL"
-
-            elif address_type in ('%IW',):
-                # Read input register
-                response = self._client.read_input_registers(
-                    address=address,
-                    count=1,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                value = response.registers[0]
-                data_type = "WORD"
-
-            elif address_type in ('%MW', '%QW'):
-                # Read holding register (word)
-                response = self._client.read_holding_registers(
-                    address=address,
-                    count=1,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                value = response.registers[0]
-                data_type = "WORD"
-
-            elif address_type == '%MD':
-                # Read holding registers (double word)
-                response = self._client.read_holding_registers(
-                    address=address * 2,
-                    count=2,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    response.registers,
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.BIG
-                )
-                value = decoder.decode_32bit_int()
-                data_type = "DINT"
-
-            elif address_type == '%MF':
-                # Read holding registers (float)
-                response = self._client.read_holding_registers(
-                    address=address * 2,
-                    count=2,
-                    slave=self._unit_id
-                )
-                if response.isError():
-                    raise ValueError(f"Read error: {response}")
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    response.registers,
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.BIG
-                )
-                value = decoder.decode_32bit_float()
-                data_type = "REAL"
+        memory_type, address, data_type = self._tag_location(tag_name)
+        read = getattr(client, self._READ_METHODS[memory_type])
 
-            else:
-                raise ValueError(f"Unknown address type: {address_type}")
+        try:
+            response = _check(read(
+                address=address,
+                count=_WIDTHS.get(data_type, 1),
+                slave=self._unit_id
+            ))
 
-            return TagValue(
+            tag_value = TagValue(
                 name=tag_name,
-                value=value,
+                value=_DECODERS[data_type](response, 0),
                 data_type=data_type,
                 address=tag_name,
             )
+            if self._cache_ttl:
+                self._tag_cache[tag_name] = (time.monotonic(), tag_value)
+                if len(self._tag_cache) > self.TAG_CACHE_SIZE:
+                    self._tag_cache.popitem(last=False)
+            return tag_value
 
         except Exception as e:
             self._last_error = str(e)
             raise
 
+    def read_tags(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags with one Modbus request per address run.
+
+        Tags are grouped by memory type, sorted by Modbus address and
+        merged into runs (holes up to the read gap are read and dropped),
+        so N adjacent tags cost ceil(N / 125) register reads instead of N.
+        """
+        client = self._require()
+
+        locations = self._locate_tags(tag_names)
+        values: dict[str, Any] = {}
+        for memory_type, start, count, members in self._plan_reads(locations):
+            read = getattr(client, self._READ_METHODS[memory_type])
+            try:
+                response = _check(read(address=start, count=count, slave=self._unit_id))
+            except Exception as e:
+                self._last_error = str(e)
+                continue
+            self._decode_span(response, start, members, locations, values)
+
+        return self._tag_values(tag_names, locations, values)
+
+    async def read_tag_async(self, tag_name: str) -> TagValue:
+        """Read a single tag without blocking the event loop."""
+        tag_value = (await self.read_tags_async([tag_name]))[0]
+        if tag_value.quality != "good":
+            raise ValueError(self._last_error)
+        return tag_value
+
+    async def read_tags_async(self, tag_names: list[str]) -> list[TagValue]:
+        """
+        Read multiple tags without blocking the event loop.
+
+        Runs are planned as in read_tags and sent over an
+        AsyncModbusTcpClient. Transactions to this slave stay serialized,
+        so the overlap comes from scanning many PLCs on one event loop.
+        RTU connections (one serial bus) are read in a worker thread.
+        """
+        self._require()
+        if self._use_rtu:
+            return await asyncio.to_thread(self.read_tags, tag_names)
+
+        client = await self._connect_async()
+        locations = self._locate_tags(tag_names)
+        values: dict[str, Any] = {}
+        async with self._async_lock:
+            for memory_type, start, count, members in self._plan_reads(locations):
+                read = getattr(client, self._READ_METHODS[memory_type])
+                try:
+                    response = _check(await read(address=start, count=count, slave=self._unit_id))
+                except Exception as e:
+                    self._last_error = str(e)
+                    continue
+                self._decode_span(response, start, members, locations, values)
+
+        return self._tag_values(tag_names, locations, values)
+
+    async def _connect_async(self) -> 'AsyncModbusTcpClient':
+        """Async client bound to the running event loop, opened on first use"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            if self._async_client is not None:
+                self._async_client.close()
+                self._async_client = None
+            client = AsyncModbusTcpClient(
+                host=self._ip,
+                port=self._port,
+                timeout=self._timeout
+            )
+            if not await client.connect():
+                raise ConnectionError("Failed to establish async TCP connection")
+            self._async_client = client
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
+        return self._async_client
+
+    def _locate_tags(
+        self,
+        tag_names: list[str]
+    ) -> dict[str, tuple[SchneiderMemoryType, int, str]]:
+        """Locate each distinct tag; unparsable names are left out"""
+        locations: dict[str, tuple[SchneiderMemoryType, int, str]] = {}
+        for name in dict.fromkeys(tag_names):
+            try:
+                locations[name] = self._tag_location(name)
+            except ValueError as e:
+                self._last_error = str(e)
+        return locations
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _tag_location(tag_name: str) -> tuple[SchneiderMemoryType, int, str]:
+        """
+        Memory type, Modbus address and data type of a tag (cached).
+
+        Polling the same names resolves each with one dict lookup instead
+        of parsing the address and mapping its prefix every call.
+        """
+        address_type, address, bit = SchneiderModbusDriver._parse_address(tag_name)
+        memory_type = ADDRESS_RANGES[address_type][2]
+
+        if address_type == '%I':
+            return memory_type, address * 8 + (bit or 0), "BOOL"
+        if address_type in ('%Q', '%M'):
+            return memory_type, address * 8 + bit if bit is not None else address, "BOOL"
+        if address_type == '%MD':
+            return memory_type, address * 2, "DINT"
+        if address_type == '%MF':
+            return memory_type, address * 2, "REAL"
+        return memory_type, address, "WORD"
+
+    def _plan_reads(
+        self,
+        locations: dict[str, tuple[SchneiderMemoryType, int, str]]
+    ) -> list[tuple[SchneiderMemoryType, int, int, list[tuple[int, str]]]]:
+        """Group located tags into (memory_type, start, count, members) runs"""
+        by_type: dict[SchneiderMemoryType, list[tuple[int, str]]] = {}
+        widths: dict[str, int] = {}
+        for name, (memory_type, address, data_type) in locations.items():
+            by_type.setdefault(memory_type, []).append((address, name))
+            if data_type in _WIDTHS:
+                widths[name] = _WIDTHS[data_type]
+
+        plan = []
+        for memory_type, points in by_type.items():
+            is_bit = memory_type in (
+                SchneiderMemoryType.DISCRETE_INPUT, SchneiderMemoryType.COIL
+            )
+            limit = self.MAX_READ_BITS if is_bit else self.MAX_READ_REGISTERS
+            for start, count, members in coalesce_ranges(points, self._read_gap, limit, widths):
+                plan.append((memory_type, start, count, members))
+        return plan
+
+    @staticmethod
+    def _decode_span(
+        response: Any,
+        start: int,
+        members: list[tuple[int, str]],
+        locations: dict[str, tuple[SchneiderMemoryType, int, str]],
+        values: dict[str, Any]
+    ) -> None:
+        """Decode the tags of one read run from its response into values"""
+        for address, name in members:
+            values[name] = _DECODERS[locations[name][2]](response, address - start)
+
+    @staticmethod
+    def _tag_values(
+        tag_names: list[str],
+        locations: dict[str, tuple[SchneiderMemoryType, int, str]],
+        values: dict[str, Any]
+    ) -> list[TagValue]:
+        """TagValues for tag_names in order, bad quality where no value was read"""
+        timestamp_ns = time.time_ns()
+        return [
+            TagValue(
+                name=name,
+                value=values.get(name),
+                data_type=locations[name][2] if name in locations else "Unknown",
+                address=name,
+                quality="good" if name in values else "bad",
+                timestamp_ns=timestamp_ns,
+            )
+            for name in tag_names
+        ]
+
     def write_tag(self, tag_name: str, value: Any) -> bool:
         """Write tag by Schneider address format."""
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
+        # Tags may alias the written addresses (%MW0 and %MD0, %M bits)
+        self._tag_cache.clear()
 
-        address_type, address, bit = self._parse_address(tag_name)
+        memory_type, address, data_type = self._tag_location(tag_name)
 
         try:
-            if address_type in ('%Q', '%M'):
+            if memory_type == SchneiderMemoryType.COIL:
                 # Write single coil
-                addr = address * 8 + (bit or 0) if bit is not None else address
-                response = self._client.write_coil(
-                    address=addr,
+                response = client.write_coil(
+                    address=address,
                     value=bool(value),
                     slave=self._unit_id
                 )
-                return not response.isError()
-
-            elif address_type in ('%MW', '%QW'):
+            elif memory_type != SchneiderMemoryType.HOLDING_REGISTER:
+                address_type = self._parse_address(tag_name)[0]
+                raise ValueError(f"Cannot write to address type: {address_type}")
+            elif data_type == "WORD":
                 # Write single register
-                response = self._client.write_register(
+                response = client.write_register(
                     address=address,
                     value=int(value),
                     slave=self._unit_id
                 )
-                return not response.isError()
-
-            elif address_type == '%MD':
-                # Write double word (2 registers)
-                builder = BinaryPayloadBuilder(
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.BIG
-                )
-                builder.add_32bit_int(int(value))
-                payload = builder.to_registers()
-                response = self._client.write_registers(
-                    address=address * 2,
-                    values=payload,
-                    slave=self._unit_id
-                )
-                return not response.isError()
-
-            elif address_type == '%MF':
-                # Write float (2 registers)
-                builder = BinaryPayloadBuilder(
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.BIG
-                )
-                builder.add_32bit_float(float(value))
-                payload = builder.to_registers()
-                response = self._client.write_registers(
-                    address=address * 2,
-                    values=payload,
+            else:
+                # Write double word / float (2 registers)
+                response = client.write_registers(
+                    address=address,
+                    values=_ENCODERS[data_type](value),
                     slave=self._unit_id
                 )
-                return not response.isError()
-
-            else:
-                raise ValueError(f"Cannot write to address type: {address_type}")
+            return not response.isError()
 
         except Exception as e:
             self._last_error = str(e)
             return False
 
-    def _parse_address(self, address: str) -> tuple[str, int, int | None]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_address(address: str) -> tuple[str, int, int | None]:
         """
-        Parse Schneider address format.
+        Parse Schneider address format (cached).
 
         Returns: (address_type, address_number, bit_number)
 
@@ -529,20 +760,12 @@ class SchneiderModbusDriver(PLCDevice):
         - "%I0.3" -> ("%I", 0, 3)
         """
         address = address.upper().strip()
+        match = _ADDRESS_RE.fullmatch(address)
+        if match is None:
+            raise ValueError(f"Invalid Schneider address format: {address}")
 
-        # Extract address type prefix
-        for prefix in sorted(ADDRESS_RANGES.keys(), key=len, reverse=True):
-            if address.startswith(prefix):
-                rest = address[len(prefix):]
-
-                # Check for bit address (X.Y format)
-                if '.' in rest:
-                    parts = rest.split('.')
-                    return prefix, int(parts[0]), int(parts[1])
-                else:
-                    return prefix, int(rest), None
-
-        raise ValueError(f"Invalid Schneider address format: {address}")
+        prefix, number, bit = match.groups()
+        return prefix, int(number), int(bit) if bit is not None else None
 
     def read_multiple_registers(
         self,
@@ -551,17 +774,16 @@ class SchneiderModbusDriver(PLCDevice):
         register_type: str = "holding"
     ) -> list[int]:
         """Read multiple registers efficiently."""
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
 
         if register_type == "holding":
-            response = self._client.read_holding_registers(
+            response = client.read_holding_registers(
                 address=start_address,
                 count=count,
                 slave=self._unit_id
             )
         elif register_type == "input":
-            response = self._client.read_input_registers(
+            response = client.read_input_registers(
                 address=start_address,
                 count=count,
                 slave=self._unit_id
@@ -569,10 +791,36 @@ class SchneiderModbusDriver(PLCDevice):
         else:
             raise ValueError(f"Unknown register type: {register_type}")
 
-        if response.isError():
-            raise ValueError(f"Read error: {response}")
+        return _check(response).registers
 
-        return response.registers
+    def read_multiple_registers_into(
+        self,
+        start_address: int,
+        count: int,
+        out: Any,
+        register_type: str = "holding"
+    ) -> int:
+        """
+        Read registers into a caller-supplied buffer of 16-bit words.
+
+        out may be an array('H'), a uint16 numpy array or any writable
+        buffer, so scaling pipelines can poll into one preallocated
+        destination instead of converting a new list every time.
+
+        pymodbus still decodes the response into a list; the registers are
+        packed from it straight into out without another intermediate copy.
+
+        Returns:
+            Number of registers written to out
+        """
+        capacity = memoryview(out).nbytes // 2
+        if capacity < count:
+            raise ValueError(f"Buffer holds {capacity} registers, {count} requested")
+
+        registers = self.read_multiple_registers(start_address, count, register_type)
+        size = len(registers)
+        _native_words(size).pack_into(out, 0, *registers)
+        return size
 
     def write_multiple_registers(
         self,
@@ -580,11 +828,11 @@ class SchneiderModbusDriver(PLCDevice):
         values: list[int]
     ) -> bool:
         """Write multiple registers efficiently."""
-        if not self._client or not self._connected:
-            raise ConnectionError("Not connected")
+        client = self._require()
+        self._tag_cache.clear()
 
         try:
-            response = self._client.write_registers(
+            response = client.write_registers(
                 address=start_address,
                 values=values,
                 slave=self._unit_id
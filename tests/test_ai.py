@@ -86,3 +86,355 @@ class TestCodeLanguageValues:
         assert CodeLanguage.STRUCTURED_TEXT.value == "st"
         assert CodeLanguage.FUNCTION_BLOCK.value == "fbd"
         assert CodeLanguage.INSTRUCTION_LIST.value == "il"
+
+
+class TestResponseCache:
+    """Tests for LLM response caching."""
+
+    def _target(self):
+        from plcforge.ai.code_generator import CodeTarget, Vendor as AIVendor
+        return CodeTarget(
+            vendor=AIVendor.SIEMENS,
+            model="S7-1500",
+            language=CodeLanguage.STRUCTURED_TEXT,
+        )
+
+    def test_repeat_prompt_skips_llm_call(self):
+        """Test identical prompts are served from the cache."""
+        from plcforge.ai.code_generator import AICodeGenerator
+        from plcforge.ai.response_cache import ResponseCache
+
+        generator = AICodeGenerator(provider="openai", cache=ResponseCache())
+        response = "Start motor.\n```st\nMotor := Start AND NOT EStop;\n```"
+
+        with patch.object(generator, "_call_openai", return_value=response) as mock_call:
+            first = generator.generate("Start the motor", self._target())
+            second = generator.generate("Start   the motor", self._target())
+
+        assert mock_call.call_count == 1
+        assert second.code == first.code
+        assert second.metadata['cached'] is True
+
+    def test_cache_persists_to_sqlite(self, tmp_path):
+        """Test cached responses survive a new cache instance."""
+        from plcforge.ai.response_cache import ResponseCache
+
+        db_path = tmp_path / "llm_cache.db"
+        key = ResponseCache.make_key("openai", "gpt-4", "system", "user")
+
+        cache = ResponseCache(db_path=db_path)
+        cache.put(key, "Motor := TRUE;", "Simple motor control")
+        cache.close()
+
+        reloaded = ResponseCache(db_path=db_path)
+        entry = reloaded.get(key)
+        reloaded.close()
+
+        assert entry is not None
+        assert entry.code == "Motor := TRUE;"
+
+
+class TestGenerateMany:
+    """Tests for concurrent multi-prompt generation."""
+
+    def test_results_keep_request_order(self):
+        """Test generate_many returns one result per request, in order."""
+        from unittest.mock import AsyncMock
+        from plcforge.ai.code_generator import AICodeGenerator, CodeTarget, Vendor as AIVendor
+
+        target = CodeTarget(
+            vendor=AIVendor.SIEMENS,
+            model="S7-1500",
+            language=CodeLanguage.STRUCTURED_TEXT,
+        )
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+
+        async def fake_call(system_prompt, user_prompt, **kwargs):
+            name = user_prompt.rsplit("\n", 1)[-1]
+            return f"```st\n{name} := TRUE;\n```"
+
+        with patch.object(generator, "_acall_openai", AsyncMock(side_effect=fake_call)):
+            results = generator.generate_many([("Pump", target), ("Valve", target)])
+
+        assert [r.code for r in results] == ["Pump := TRUE;", "Valve := TRUE;"]
+
+
+class TestStreaming:
+    """Tests for streamed LLM responses."""
+
+    def test_fence_watcher_handles_split_fences(self):
+        """Test closing fence is detected when split across deltas."""
+        from plcforge.ai.code_generator import _FenceWatcher
+
+        watcher = _FenceWatcher()
+        deltas = ["Intro\n`", "``st\nMotor := TRUE;\n`", "`", "`\nTrailing"]
+        done = [watcher.feed(d) for d in deltas]
+
+        assert done == [False, False, False, True]
+
+    def test_openai_stream_stops_after_code_block(self):
+        """Test streaming stops once the code block is complete."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        def chunk(text):
+            c = MagicMock()
+            c.choices = [MagicMock()]
+            c.choices[0].delta.content = text
+            return c
+
+        stream = MagicMock()
+        stream.__iter__.return_value = iter([
+            chunk("Approach\n```st\n"), chunk("Motor := TRUE;\n"), chunk("```"),
+            chunk("\nSafety notes that are never read"),
+        ])
+        client = MagicMock()
+        client.chat.completions.create.return_value = stream
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        tokens = []
+        with patch.object(generator, "_get_client", return_value=client):
+            response = generator._call_openai("sys", "user", stop_after_code=True,
+                                              on_token=tokens.append)
+
+        assert response == "Approach\n```st\nMotor := TRUE;\n```"
+        assert len(tokens) == 3
+        stream.close.assert_called_once()
+
+
+class TestSafetyAnalysis:
+    """Tests for generated code safety analysis."""
+
+    def _analyze(self, code):
+        from plcforge.ai.code_generator import AICodeGenerator, CodeTarget, Vendor as AIVendor
+
+        target = CodeTarget(
+            vendor=AIVendor.SIEMENS,
+            model="S7-1500",
+            language=CodeLanguage.STRUCTURED_TEXT,
+        )
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        return [issue.message for issue in generator._analyze_safety(code, target)]
+
+    def test_clean_code_has_no_issues(self):
+        """Test code with e-stop handling and initialization passes."""
+        code = "VAR Motor : BOOL := FALSE; END_VAR\nIF NOT EStop THEN Motor := Start; END_IF;"
+        assert self._analyze(code) == []
+
+    def test_detects_all_issue_types(self):
+        """Test each safety check fires in report order."""
+        code = "VAR\n  Delay : TIME;\nEND_VAR\nWHILE TRUE DO\n  T1(PT := T#120S);\nEND_WHILE"
+        messages = self._analyze(code.replace(":=", "=>"))
+
+        assert messages == [
+            "No emergency stop handling detected",
+            "Potential infinite loop detected",
+            "Long timer duration detected: 120s",
+            "Variables declared without initialization",
+        ]
+
+
+class TestModelRouting:
+    """Tests for small/large model routing."""
+
+    def _target(self, language=CodeLanguage.STRUCTURED_TEXT):
+        from plcforge.ai.code_generator import CodeTarget, Vendor as AIVendor
+        return CodeTarget(vendor=AIVendor.SIEMENS, model="S7-1500", language=language)
+
+    def test_short_prompt_uses_small_model(self):
+        """Test short prompts are routed to the small model."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        response = "```st\nMotor := Start AND NOT EStop;\n```"
+
+        with patch.object(generator, "_call_openai", return_value=response) as mock_call:
+            result = generator.generate("Start the motor", self._target())
+
+        assert mock_call.call_args.kwargs['model'] == generator.small_model
+        assert result.metadata['model'] == generator.small_model
+
+    def test_context_and_ladder_use_large_model(self):
+        """Test prompts with context or ladder output skip the small model."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+
+        assert generator._select_model("Start", self._target(), "existing code") == generator.model
+        assert generator._select_model(
+            "Start", self._target(CodeLanguage.LADDER), None
+        ) == generator.model
+
+    def test_escalates_when_small_model_returns_no_code(self):
+        """Test a response without a code block is retried on the large model."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        responses = ["I cannot help with that.", "```st\nMotor := NOT EStop;\n```"]
+
+        with patch.object(generator, "_call_openai", side_effect=responses) as mock_call:
+            result = generator.generate("Start the motor", self._target())
+
+        assert mock_call.call_count == 2
+        assert result.metadata['model'] == generator.model
+        assert result.code == "Motor := NOT EStop;"
+
+    def test_escalation_streams_only_accepted_response(self):
+        """Test a rejected small-model stream is not passed to on_token."""
+        from plcforge.ai.code_generator import AICodeGenerator
+        from plcforge.ai.response_cache import ResponseCache
+
+        generator = AICodeGenerator(provider="openai", cache=ResponseCache())
+        responses = ["I cannot help with that.", "```st\nMotor := NOT EStop;\n```"]
+
+        def call_openai(system_prompt, user_prompt, on_token=None, **kwargs):
+            response = responses.pop(0)
+            on_token(response)
+            return response
+
+        tokens = []
+        with patch.object(generator, "_call_openai", side_effect=call_openai):
+            generator.generate("Start the motor", self._target(), on_token=tokens.append)
+
+        assert tokens == ["```st\nMotor := NOT EStop;\n```"]
+
+        # The cached entry is labelled with the model that produced it
+        cached = generator.generate("Start the motor", self._target())
+        assert cached.metadata['cached'] is True
+        assert cached.metadata['model'] == generator.model
+
+    def test_small_model_stream_flushed_when_accepted(self):
+        """Test an accepted small-model response is streamed to on_token."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        response = "```st\nMotor := Start AND NOT EStop;\n```"
+
+        def call_openai(system_prompt, user_prompt, on_token=None, **kwargs):
+            on_token(response)
+            return response
+
+        tokens = []
+        with patch.object(generator, "_call_openai", side_effect=call_openai):
+            generator.generate("Start the motor", self._target(), on_token=tokens.append)
+
+        assert tokens == [response]
+
+    def test_explicit_model_disables_routing(self):
+        """Test an explicitly chosen model is always used."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", model="gpt-4o", use_cache=False)
+        assert generator._select_model("Start", self._target(), None) == "gpt-4o"
+
+
+class TestTokenBudget:
+    """Tests for prompt token budgeting."""
+
+    def _target(self):
+        from plcforge.ai.code_generator import CodeTarget, Vendor as AIVendor
+        return CodeTarget(vendor=AIVendor.SIEMENS, model="S7-1500", language=CodeLanguage.STRUCTURED_TEXT)
+
+    def test_oversized_context_is_trimmed_from_head(self):
+        """Test old context is dropped so the prompt fits the budget."""
+        from plcforge.ai.code_generator import _MAX_OUTPUT_TOKENS, AICodeGenerator
+
+        generator = AICodeGenerator(
+            provider="openai", use_cache=False, max_context_tokens=_MAX_OUTPUT_TOKENS + 2000
+        )
+        context = "OLD_LINE;\n" * 5000 + "NEWEST_LINE;"
+
+        system_prompt, user_prompt, input_tokens = generator._prepare_prompts(
+            "Start the motor", self._target(), context
+        )
+
+        assert input_tokens <= 2000
+        assert "NEWEST_LINE;" in user_prompt
+        assert user_prompt.count("OLD_LINE;") < 5000
+
+    def test_prompt_over_budget_raises_before_call(self):
+        """Test a prompt that cannot fit raises without calling the API."""
+        from plcforge.ai.code_generator import _MAX_OUTPUT_TOKENS, AICodeGenerator
+
+        generator = AICodeGenerator(
+            provider="openai", use_cache=False, max_context_tokens=_MAX_OUTPUT_TOKENS + 10
+        )
+
+        with patch.object(generator, "_call_openai") as mock_call:
+            with pytest.raises(ValueError):
+                generator.generate("Start the motor", self._target())
+
+        mock_call.assert_not_called()
+
+    def test_input_tokens_in_metadata(self):
+        """Test the counted input tokens are reported in metadata."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        response = "```st\nMotor := Start AND NOT EStop;\n```"
+
+        with patch.object(generator, "_call_openai", return_value=response):
+            result = generator.generate("Start the motor", self._target())
+
+        assert result.metadata['input_tokens'] > 0
+
+
+class TestResponseParsing:
+    """Tests for extracting code from LLM responses."""
+
+    def test_extract_indented_block(self):
+        """Test unfenced indented code is extracted including inner blank lines."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        response = "Here is the code:\n    Motor := Start;\n\n    Lamp := Motor;\nDone."
+
+        assert generator._extract_code(response) == "Motor := Start;\n\n    Lamp := Motor;"
+
+    def test_plain_text_returned_unchanged(self):
+        """Test responses without any code block are returned as-is."""
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False)
+        assert generator._extract_code("No code here.") == "No code here."
+
+
+class TestStructuredOutput:
+    """Tests for JSON schema / tool-call structured output."""
+
+    def test_structured_response_parsed_from_json(self):
+        """Test code and explanation are read directly from the JSON payload."""
+        import json
+        from plcforge.ai.code_generator import AICodeGenerator, CodeTarget, Vendor as AIVendor
+
+        target = CodeTarget(
+            vendor=AIVendor.SIEMENS,
+            model="S7-1500",
+            language=CodeLanguage.STRUCTURED_TEXT,
+        )
+        generator = AICodeGenerator(provider="openai", use_cache=False, structured_output=True)
+        response = json.dumps({
+            "explanation": "Interlock motor with e-stop",
+            "code": "Motor := Start AND NOT EStop;",
+            "notes": "",
+        })
+
+        with patch.object(generator, "_call_openai", return_value=response) as mock_call:
+            result = generator.generate("Start the motor", target)
+
+        assert mock_call.call_args.kwargs['structured'] is True
+        assert result.code == "Motor := Start AND NOT EStop;"
+        assert result.explanation == "Interlock motor with e-stop"
+
+    def test_structured_response_with_non_string_fields(self):
+        """Test null explanation is allowed and non-text code falls back to None."""
+        import json
+        from plcforge.ai.code_generator import AICodeGenerator
+
+        generator = AICodeGenerator(provider="openai", use_cache=False, structured_output=True)
+
+        assert generator._parse_structured(
+            json.dumps({"code": "Motor := TRUE;", "explanation": None})
+        ) == ("Motor := TRUE;", "")
+        assert generator._parse_structured(json.dumps({"code": 42, "explanation": "x"})) is None
+        assert generator._parse_structured(json.dumps({"code": "x", "explanation": 1})) is None
+        assert generator._parse_structured(json.dumps(["code"])) is None
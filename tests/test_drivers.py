@@ -1,5 +1,7 @@
 """Unit tests for PLC drivers."""
 
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -44,6 +46,11 @@ class TestMemoryArea:
         assert MemoryArea.TIMER is not None
         assert MemoryArea.COUNTER is not None
 
+    def test_memory_area_indexes_tuples(self):
+        """Test MemoryArea values are consecutive ints usable as indexes."""
+        assert [int(area) for area in MemoryArea] == list(range(len(MemoryArea)))
+        assert MemoryArea.DATA.name.lower() == "data"
+
 
 class TestSiemensDriverImport:
     """Tests for Siemens driver import."""
@@ -128,3 +135,1669 @@ class TestTIAProjectParser:
         from plcforge.drivers.siemens.project_parser import TIAPortalParser
         parser = TIAPortalParser()
         assert parser is not None
+
+
+class TestAllenBradleyBatching:
+    """Tests for Allen-Bradley multi-tag request chunking."""
+
+    def _driver(self):
+        from plcforge.drivers.allen_bradley import cip_driver
+        with patch.object(cip_driver, "PYCOMM3_AVAILABLE", True):
+            driver = cip_driver.AllenBradleyDriver()
+        driver._plc = MagicMock()
+        driver._connected = True
+        return driver
+
+    def test_chunks_fit_request_budget(self):
+        """Test tag names are packed into budget-sized chunks in order."""
+        from plcforge.drivers.allen_bradley.cip_driver import (
+            CIP_REQUEST_BUDGET, _chunk_by_size, _estimate_cip_size,
+        )
+
+        names = [f"Program:Main.Tag_{i:04d}" for i in range(100)]
+        chunks = _chunk_by_size(names)
+
+        assert len(chunks) > 1
+        assert [n for chunk in chunks for n in chunk] == names
+        for chunk in chunks:
+            assert sum(_estimate_cip_size(n) for n in chunk) <= CIP_REQUEST_BUDGET
+
+    def test_failed_chunk_only_marks_its_tags_bad(self):
+        """Test an exception in one request does not discard other results."""
+        driver = self._driver()
+        names = [f"Program:Main.Tag_{i:04d}" for i in range(40)]
+
+        def fake_read(*tags):
+            if tags[0] == names[0]:
+                raise RuntimeError("connection reset")
+            return [MagicMock(value=1, type="DINT", error=None) for _ in tags]
+
+        driver._plc.read.side_effect = fake_read
+        values = driver.read_tags(names)
+
+        assert [v.name for v in values] == names
+        assert values[0].quality == "bad"
+        assert values[-1].quality == "good"
+
+
+class TestTagBatch:
+    """Tests for struct-of-arrays tag batches."""
+
+    def test_numeric_values_packed_into_array(self):
+        """Test numeric batches use a float64 array with NaN for bad tags."""
+        import math
+        from array import array
+        from plcforge.drivers.base import TagBatch
+
+        quality = bytearray([0, 1, 0])
+        values = TagBatch.pack_values([1, None, 2.5], quality)
+
+        assert isinstance(values, array)
+        assert values[0] == 1.0 and values[2] == 2.5
+        assert math.isnan(values[1])
+
+    def test_mixed_values_fall_back_to_list(self):
+        """Test non-numeric batches keep a plain list."""
+        from plcforge.drivers.base import TagBatch
+
+        values = TagBatch.pack_values(["text", 1], bytearray(2))
+        assert values == ["text", 1]
+
+    def test_tag_value_timestamp_built_lazily(self):
+        """Test TagValue converts timestamp_ns to datetime on access."""
+        from datetime import datetime
+        from plcforge.drivers.base import TagValue
+
+        explicit = datetime(2024, 1, 1)
+        assert TagValue("A", 1, "INT", timestamp=explicit).timestamp == explicit
+        assert TagValue("A", 1, "INT").timestamp is None
+
+        tag = TagValue("A", 1, "INT", timestamp_ns=1_700_000_000_000_000_000)
+        assert tag.timestamp == datetime.fromtimestamp(1_700_000_000)
+
+    def test_tag_value_eq_hash_replace_after_timestamp_read(self):
+        """Test reading .timestamp does not change equality, hash or replace()."""
+        import dataclasses
+        import pickle
+        from datetime import datetime
+        from plcforge.drivers.base import TagValue
+
+        first = TagValue("A", 1, "INT", timestamp_ns=1_700_000_000_000_000_000)
+        second = TagValue("A", 1, "INT", timestamp_ns=1_700_000_000_000_000_000)
+        first.timestamp
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert "_timestamp" not in dataclasses.asdict(first)
+
+        changed = dataclasses.replace(first, value=2)
+        assert changed.value == 2 and changed.timestamp == first.timestamp
+
+        explicit = TagValue("A", 1, "INT", timestamp=datetime(2024, 1, 1))
+        explicit.timestamp
+        assert dataclasses.replace(explicit, value=2).timestamp == datetime(2024, 1, 1)
+        assert explicit == TagValue("A", 1, "INT", timestamp=datetime(2024, 1, 1))
+
+        copied = pickle.loads(pickle.dumps(first))
+        assert copied == first and copied.timestamp == first.timestamp
+
+    def test_tag_value_is_slotted_and_frozen(self):
+        """Test TagValue has no instance dict and rejects mutation."""
+        import dataclasses
+        from plcforge.drivers.base import TagValue
+
+        tag = TagValue("A", 1, "INT", "DB1.DBW0")
+        assert not hasattr(tag, "__dict__")
+        assert tag.address == "DB1.DBW0" and tag.quality == "good"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tag.value = 2
+
+    def test_allen_bradley_read_tags_soa(self):
+        """Test Allen-Bradley fills a TagBatch from batched reads."""
+        from plcforge.drivers.allen_bradley import cip_driver
+
+        with patch.object(cip_driver, "PYCOMM3_AVAILABLE", True):
+            driver = cip_driver.AllenBradleyDriver()
+        driver._plc = MagicMock()
+        driver._plc.read.return_value = [
+            MagicMock(value=10, type="DINT", error=None),
+            MagicMock(value=None, type=None, error="Tag not found"),
+        ]
+
+        batch = driver.read_tags_soa(["Speed", "Missing"])
+
+        assert len(batch) == 2
+        assert batch.values[0] == 10.0
+        assert list(batch.quality) == [0, 1]
+        assert batch.data_types == ["DINT", "Unknown"]
+        assert [t.quality for t in batch.to_tag_values()] == ["good", "bad"]
+
+
+class TestAllenBradleyTagCache:
+    """Tests for Allen-Bradley tag list caching."""
+
+    def test_tag_list_downloaded_once(self):
+        """Test diagnostics polling reuses the cached tag list."""
+        from plcforge.drivers.allen_bradley import cip_driver
+
+        with patch.object(cip_driver, "PYCOMM3_AVAILABLE", True):
+            driver = cip_driver.AllenBradleyDriver()
+        driver._plc = MagicMock()
+        driver._plc.get_tag_list.return_value = [{'tag_name': 'Speed', 'data_type': 'DINT'}]
+
+        driver.get_diagnostics()
+        diagnostics = driver.get_diagnostics()
+
+        assert diagnostics['tag_count'] == 1
+        assert driver._plc.get_tag_list.call_count == 1
+
+        driver.get_tag_list(refresh=True)
+        assert driver._plc.get_tag_list.call_count == 2
+
+
+class TestBeckhoffSumCommands:
+    """Tests for Beckhoff ADS sum-command batching."""
+
+    @pytest.fixture
+    def driver(self):
+        from plcforge.drivers.beckhoff import ads_driver
+
+        driver_cls = ads_driver.BeckhoffADSDriver
+        # The driver does not implement every abstract PLCDevice method yet
+        with patch.object(ads_driver, "PYADS_AVAILABLE", True), \
+                patch.object(driver_cls, "_pyads", MagicMock()), \
+                patch.object(driver_cls, "_ads_errors", frozenset({"ADSERR_DEVICE_SYMBOLNOTFOUND"})), \
+                patch.object(driver_cls, "__abstractmethods__", frozenset()):
+            driver = driver_cls()
+            driver._plc = MagicMock()
+            driver._connected = True
+            driver._require = ads_driver._connected
+            yield driver
+
+    def test_read_tags_uses_single_sum_read(self, driver):
+        """Test multiple tags are read in one sum request."""
+        driver._plc.read_list_by_name.return_value = {
+            "MAIN.Speed": 42,
+            "MAIN.Missing": "ADSERR_DEVICE_SYMBOLNOTFOUND",
+        }
+
+        tags = driver.read_tags(["MAIN.Speed", "MAIN.Missing"])
+
+        driver._plc.read_list_by_name.assert_called_once_with(["MAIN.Speed", "MAIN.Missing"])
+        assert tags[0].value == 42 and tags[0].quality == "good"
+        assert tags[1].value is None and tags[1].quality == "bad"
+
+    def test_write_tags_reports_first_error(self, driver):
+        """Test sum writes fail if any variable reports an error."""
+        driver._plc.write_list_by_name.return_value = {
+            "MAIN.A": "no error",
+            "MAIN.B": "ADSERR_DEVICE_SYMBOLNOTFOUND",
+        }
+
+        assert driver.write_tags({"MAIN.A": 1, "MAIN.B": 2}) is False
+        assert driver.last_error == "MAIN.B: ADSERR_DEVICE_SYMBOLNOTFOUND"
+        driver._plc.write_list_by_name.assert_called_once()
+
+    def test_symbols_resolved_once(self, driver):
+        """Test repeated reads reuse the resolved symbol."""
+        symbol = driver._plc.get_symbol.return_value
+        symbol.read.return_value = 7
+
+        driver.read_tag("MAIN.Speed")
+        driver.read_tag("MAIN.Speed")
+
+        driver._plc.get_symbol.assert_called_once_with("MAIN.Speed")
+        assert symbol.read.call_count == 2
+
+    def test_read_by_name_uses_cached_handle(self, driver):
+        """Test explicit-type reads go through a cached variable handle."""
+        driver._plc.get_handle.return_value = 0x1234
+
+        driver.read_by_name("MAIN.Speed", int)
+        driver.read_by_name("MAIN.Speed", int)
+
+        driver._plc.get_handle.assert_called_once_with("MAIN.Speed")
+        driver._plc.read_by_name.assert_called_with("", int, handle=0x1234)
+
+        plc = driver._plc
+        driver.disconnect()
+        plc.release_handle.assert_called_once_with(0x1234)
+        assert not driver._symbol_cache and not driver._handle_cache
+
+    def test_read_tags_async_splits_into_sum_commands(self, driver):
+        """Test async reads submit one sum command per chunk and keep order."""
+        import asyncio
+        from plcforge.drivers.beckhoff import ads_driver
+
+        names = [f"MAIN.V{i}" for i in range(6)]
+        driver._plc.read_list_by_name.side_effect = lambda chunk: dict.fromkeys(chunk, 1)
+
+        with patch.object(ads_driver, "ADS_SUM_CHUNK", 2):
+            tags = asyncio.run(driver.read_tags_async(names))
+
+        assert [t.name for t in tags] == names
+        assert driver._plc.read_list_by_name.call_count == 3
+        driver.disconnect()
+
+    def test_get_mode_maps_ads_states(self, driver):
+        """Test ADS state numbers map to PLC modes."""
+        for state, mode in ((5, PLCMode.RUN), (6, PLCMode.STOP), (11, PLCMode.FAULT),
+                            (15, PLCMode.PROGRAM), (99, PLCMode.UNKNOWN)):
+            driver._plc.read_state.return_value = (state, 0)
+            assert driver.get_mode() == mode
+
+    def test_symbol_list_cached_until_invalidated(self, driver):
+        """Test list_symbols reuses the uploaded table until a mode change."""
+        import struct
+        from plcforge.drivers.beckhoff import ads_driver
+
+        entry = b"MAIN.Speed\x00INT\x00Motor speed\x00"
+        header = struct.pack('<6I3H', 30 + len(entry), 0x4040, 8, 2, 2, 0, 10, 3, 11)
+        table = header + entry
+        info = struct.pack('<6I', 1, len(table), 0, 0, 0, 0)
+        driver._plc.read.side_effect = lambda group, *args, **kwargs: (
+            info if group == ads_driver.ADSIGRP_SYM_UPLOADINFO2 else table
+        )
+
+        first = driver.list_symbols()
+        second = driver.list_symbols()
+        assert first == second and first is not second
+        assert driver._plc.read.call_count == 2
+
+        driver.set_mode(PLCMode.RUN)
+        driver.list_symbols()
+
+        assert driver._plc.read.call_count == 4
+        assert first == [{
+            "name": "MAIN.Speed",
+            "plc_type": "INT",
+            "symbol_type": "INT",
+            "index_group": 0x4040,
+            "index_offset": 8,
+            "size": 2,
+            "comment": "Motor speed",
+        }]
+
+    def test_read_memory_returns_bytes(self, driver):
+        """Test raw memory reads return bytes rather than a list of ints."""
+        import ctypes
+        from plcforge.drivers.base import MemoryArea
+
+        driver._plc.read.return_value = (ctypes.c_ubyte * 3)(1, 2, 3)
+
+        data = driver.read_memory(MemoryArea.MEMORY, 0, 3)
+
+        assert data == b"\x01\x02\x03"
+        assert driver._plc.read.call_args.kwargs == {"return_ctypes": True}
+
+    def test_read_coalescer_merges_concurrent_reads(self):
+        """Test queued read_tag requests are served by one batched read."""
+        from plcforge.drivers.base import TagValue
+        from plcforge.drivers.beckhoff.ads_driver import ADSReadError, _ReadCoalescer
+
+        batches = []
+
+        def read_many(names):
+            batches.append(names)
+            return [
+                TagValue(name=n, value=1, data_type="INT",
+                         quality="bad" if n == "MAIN.Bad" else "good")
+                for n in names
+            ]
+
+        coalescer = _ReadCoalescer(
+            MagicMock(), read_many, max_batch=3, max_wait=1.0,
+            last_error=lambda: "symbol not found",
+        )
+        futures = [coalescer.submit(n) for n in ("MAIN.A", "MAIN.B", "MAIN.Bad")]
+
+        assert futures[0].result(timeout=2).value == 1
+        assert futures[1].result(timeout=2).name == "MAIN.B"
+        with pytest.raises(ADSReadError, match="MAIN.Bad: symbol not found"):
+            futures[2].result(timeout=2)
+        assert batches == [["MAIN.A", "MAIN.B", "MAIN.Bad"]]
+        coalescer.close()
+
+    def test_read_coalescer_rejects_reads_after_close(self):
+        """Test a read submitted after close fails instead of hanging."""
+        from plcforge.drivers.beckhoff.ads_driver import _ReadCoalescer
+
+        coalescer = _ReadCoalescer(MagicMock(), MagicMock())
+        coalescer.close()
+        coalescer.close()
+
+        with pytest.raises(ConnectionError):
+            coalescer.submit("MAIN.A")
+        assert not coalescer._thread.is_alive()
+
+    def test_driver_has_no_instance_dict(self, driver):
+        """Test the slotted driver carries no per-instance __dict__."""
+        assert not hasattr(driver, "__dict__")
+
+    def test_subscribed_tag_read_from_notification(self, driver):
+        """Test subscribed tags are served from the last notification."""
+        import ctypes
+
+        driver._plc.get_symbol.return_value.plc_type = ctypes.c_int16
+        driver._plc.notification.return_value = lambda func: func
+        driver._plc.add_device_notification.return_value = (10, 20)
+        received = []
+
+        assert driver.subscribe_tag("MAIN.Speed", lambda n, t: received.append(t)) == (10, 20)
+
+        on_notification = driver._plc.add_device_notification.call_args.args[2]
+        on_notification(10, "MAIN.Speed", None, 55)
+
+        assert received[0].value == 55
+        assert driver.read_tag("MAIN.Speed").value == 55
+        driver._plc.get_symbol.return_value.read.assert_not_called()
+
+        plc = driver._plc
+        driver.disconnect()
+        plc.del_device_notification.assert_called_once_with(10, 20)
+
+    def test_subscribe_passes_cycle_in_ms(self, driver):
+        """Test NotificationAttrib gets milliseconds (pyads converts to 100 ns)."""
+        import ctypes
+
+        driver._plc.get_symbol.return_value.plc_type = ctypes.c_int16
+        driver._plc.notification.return_value = lambda func: func
+        driver._plc.add_device_notification.return_value = (10, 20)
+
+        driver.subscribe_tag("MAIN.Speed", cycle_ms=250)
+
+        kwargs = driver._pyads.NotificationAttrib.call_args.kwargs
+        assert kwargs["length"] == 2
+        assert kwargs["max_delay"] == 250 and kwargs["cycle_time"] == 250
+
+    def test_adjacent_symbols_read_as_one_range(self, driver):
+        """Test runs of adjacent resolved symbols become one raw read."""
+        import ctypes
+        import struct
+
+        names = [f"MAIN.W{i}" for i in range(16)]
+        for i, name in enumerate(names):
+            driver._symbol_cache[name] = MagicMock(
+                index_group=0x4020, index_offset=2 * i, plc_type=ctypes.c_int16
+            )
+        driver._symbol_cache["MAIN.Far"] = MagicMock(
+            index_group=0x4020, index_offset=1000, plc_type=ctypes.c_int16
+        )
+        driver._plc.read.return_value = struct.pack('<16h', *range(16))
+        driver._plc.read_list_by_name.return_value = {"MAIN.Far": 7, "MAIN.Other": 8}
+
+        tags = driver.read_tags(names + ["MAIN.Far", "MAIN.Other"])
+
+        driver._plc.read.assert_called_once()
+        assert driver._plc.read.call_args.args[:2] == (0x4020, 0)
+        driver._plc.read_list_by_name.assert_called_once_with(["MAIN.Far", "MAIN.Other"])
+        assert [t.value for t in tags] == list(range(16)) + [7, 8]
+
+    def test_read_tag_decodes_raw_bytes(self, driver):
+        """Test scalar and string symbols are decoded from raw reads."""
+        import ctypes
+        import struct
+
+        symbol = driver._plc.get_symbol.return_value
+        symbol.plc_type = ctypes.c_int32
+        driver._plc.read.return_value = struct.pack('<i', -5)
+        assert driver.read_tag("MAIN.Count").value == -5
+        symbol.read.assert_not_called()
+
+        symbol.plc_type = ctypes.c_char * 81
+        driver._plc.read.return_value = b"Motor 1\x00junk".ljust(81, b"\x00")
+        assert driver.read_tag("MAIN.Label").value == "Motor 1"
+
+    def test_iter_read_tags_streams_sum_chunks(self, driver):
+        """Test iter_read_tags issues one sum command per chunk on demand."""
+        from plcforge.drivers.beckhoff import ads_driver
+
+        driver._plc.read_list_by_name.side_effect = lambda chunk: dict.fromkeys(chunk, 1)
+        names = (f"MAIN.V{i}" for i in range(6))
+
+        with patch.object(ads_driver, "ADS_SUM_CHUNK", 3):
+            tags = driver.iter_read_tags(names)
+            assert next(tags).name == "MAIN.V0"
+            assert driver._plc.read_list_by_name.call_count == 1
+            assert [t.name for t in tags] == [f"MAIN.V{i}" for i in range(1, 6)]
+
+        assert driver._plc.read_list_by_name.call_count == 2
+
+    def test_disconnected_driver_raises(self, driver):
+        """Test transfer methods raise once the driver is disconnected."""
+        driver.disconnect()
+
+        with pytest.raises(ConnectionError):
+            driver.read_tag("MAIN.Speed")
+        with pytest.raises(ConnectionError):
+            driver.read_tags(["MAIN.A", "MAIN.B"])
+
+    def test_byte_array_types_reused(self, driver):
+        """Test raw transfers reuse one cached ctypes array type per length."""
+        import ctypes
+        from plcforge.drivers.base import MemoryArea
+        from plcforge.drivers.beckhoff.ads_driver import _byte_array
+
+        driver._plc.read.return_value = (ctypes.c_ubyte * 4)()
+        driver.read_memory(MemoryArea.INPUT, 0, 4)
+
+        assert driver._plc.read.call_args.args[2] is _byte_array(4)
+        assert ctypes.sizeof(_byte_array(4)) == 4
+
+    def test_reconnect_skips_route_and_device_info(self, driver):
+        """Test a reconnect reuses the added route and cached device info."""
+        from plcforge.drivers.beckhoff import ads_driver
+
+        pyads = driver._pyads
+        pyads.Connection.return_value.read_device_info.return_value = MagicMock(name="CX")
+
+        with patch.object(ads_driver, "_ROUTE_CACHE", set()):
+            assert driver.connect("5.1.2.3.1.1", ip="192.168.1.10")
+            driver.disconnect()
+            assert driver.connect("5.1.2.3.1.1", ip="192.168.1.10")
+
+        pyads.add_route.assert_called_once_with("5.1.2.3.1.1", "192.168.1.10")
+        pyads.Connection.return_value.read_device_info.assert_called_once()
+
+        # A different target is read again
+        assert driver.connect("5.1.2.3.1.2")
+        assert pyads.Connection.return_value.read_device_info.call_count == 2
+
+    def test_protection_status_cached(self, driver):
+        """Test get_protection_status builds a valid status and caches it."""
+        from plcforge.drivers.base import AccessLevel
+
+        status = driver.get_protection_status()
+
+        assert not status.cpu_protected
+        assert status.access_level == AccessLevel.FULL
+        assert driver.get_protection_status() is status
+
+    def test_connect_twice_stops_old_coalescer(self, driver):
+        """Test a second connect() replaces the coalescer instead of leaking it."""
+        from plcforge.drivers.beckhoff import ads_driver
+
+        with patch.object(ads_driver, "_ROUTE_CACHE", set()):
+            assert driver.connect("5.1.2.3.1.1", coalesce_reads=True)
+            first = driver._coalescer
+            assert driver.connect("5.1.2.3.1.1", coalesce_reads=True)
+
+        assert driver._coalescer is not first
+        assert not first._thread.is_alive()
+        driver.disconnect()
+        assert driver._coalescer is None
+
+    def test_keepalive_failure_marks_disconnected(self, driver):
+        """Test a failed keepalive state read disconnects the driver."""
+        driver._plc.read_state.side_effect = OSError("timeout")
+
+        driver._keepalive_tick()
+
+        assert not driver.is_connected()
+        with pytest.raises(ConnectionError):
+            driver.read_tag("MAIN.Speed")
+
+
+class TestCoalescedReads:
+    """Tests for address-run coalescing in Delta and Mitsubishi drivers."""
+
+    @pytest.fixture
+    def delta(self):
+        from plcforge.drivers.delta import modbus_driver
+
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True):
+            driver = modbus_driver.DeltaDVPDriver()
+        driver._client = MagicMock()
+        driver._connected = True
+        return driver
+
+    def test_coalesce_ranges_merges_small_gaps(self):
+        """Test nearby addresses merge and distant ones split."""
+        from plcforge.drivers.base import coalesce_ranges
+
+        ranges = coalesce_ranges([(10, "a"), (0, "b"), (3, "c"), (50, "d")], 8, 125)
+
+        assert [(start, count) for start, count, _ in ranges] == [(0, 11), (50, 1)]
+        assert ranges[0][2] == [(0, "b"), (3, "c"), (10, "a")]
+
+    def test_coalesce_ranges_respects_request_limit(self):
+        """Test ranges never exceed the per-request count."""
+        from plcforge.drivers.base import coalesce_ranges
+
+        ranges = coalesce_ranges(((i, i) for i in range(300)), 8, 125)
+
+        assert [count for _, count, _ in ranges] == [125, 125, 50]
+
+    def test_delta_read_tags_single_register_request(self, delta):
+        """Test adjacent D registers are read with one request."""
+        delta._client.read_holding_registers.return_value = MagicMock(
+            registers=[10, 11, 12, 13, 14], **{"isError.return_value": False}
+        )
+
+        tags = delta.read_tags(["D4", "D0", "D2"])
+
+        delta._client.read_holding_registers.assert_called_once_with(0x1000, 5, slave=1)
+        assert [t.value for t in tags] == [14, 10, 12]
+        assert all(t.quality == "good" for t in tags)
+
+    def test_delta_read_tags_bad_address(self, delta):
+        """Test an unparseable address is reported bad without a request."""
+        tags = delta.read_tags(["Q1"])
+
+        assert tags[0].quality == "bad"
+        delta._client.read_holding_registers.assert_not_called()
+        delta._client.read_coils.assert_not_called()
+
+    def test_mitsubishi_read_tags_single_batch_read(self):
+        """Test a D run costs one batch read and an isolated M word one random read."""
+        import struct
+        from plcforge.drivers.mitsubishi import MitsubishiMCDriver
+
+        driver = MitsubishiMCDriver()
+        responses = {
+            0x0401: struct.pack('<3H', 100, 101, 102),
+            0x0403: struct.pack('<H', 0b0100_0000_0001),
+        }
+        with patch.object(
+            driver, "_send_receive", side_effect=lambda cmd, sub, data: responses[cmd]
+        ) as send:
+            tags = driver.read_tags(["D12", "D10", "M1", "M11"])
+
+        assert send.call_count == 2
+        assert [t.value for t in tags] == [102, 100, 1, 1]
+        assert [t.data_type for t in tags] == ["WORD", "WORD", "BOOL", "BOOL"]
+
+    def test_delta_drivers_share_pooled_client(self):
+        """Test drivers for one host:port share a client until the last disconnects."""
+        from plcforge.drivers.delta import modbus_driver
+
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True), \
+                patch.object(modbus_driver, "ModbusTcpClient", create=True) as tcp, \
+                patch.object(modbus_driver, "_CLIENT_POOL", {}):
+            first = modbus_driver.DeltaDVPDriver()
+            second = modbus_driver.DeltaDVPDriver()
+            assert first.connect("10.0.0.5", unit_id=1)
+            assert second.connect("10.0.0.5", unit_id=2)
+
+            tcp.assert_called_once()
+            assert first._client is second._client
+            assert first._lock is second._lock
+
+            first.disconnect()
+            tcp.return_value.close.assert_not_called()
+            second.disconnect()
+            tcp.return_value.close.assert_called_once()
+
+    def test_delta_memory_register_conversion(self, delta):
+        """Test D registers convert to/from big-endian bytes in one pass."""
+        delta._client.read_holding_registers.return_value = MagicMock(
+            registers=[0x0102, 0xA0B0], **{"isError.return_value": False}
+        )
+        delta._client.write_registers.return_value.isError.return_value = False
+
+        assert delta.read_memory(MemoryArea.DATA, 0, 2) == b'\x01\x02\xa0\xb0'
+        assert delta.write_memory(MemoryArea.DATA, 0, b'\x01\x02\x03')
+        assert delta._client.write_registers.call_args.args[1] == [0x0102, 0x0300]
+
+    def test_delta_coils_packed_lsb_first(self, delta):
+        """Test coil areas read and write 8 coils per byte."""
+        bits = [True, False, False, False, False, False, False, True] + [False, True] + [False] * 6
+        delta._client.read_coils.return_value = MagicMock(
+            bits=bits, **{"isError.return_value": False}
+        )
+        delta._client.write_coils.return_value.isError.return_value = False
+
+        assert delta.read_memory(MemoryArea.MEMORY, 0, 2) == b'\x81\x02'
+        delta._client.read_coils.assert_called_once_with(0x0800, 16, slave=1)
+        assert delta.write_memory(MemoryArea.OUTPUT, 0, b'\x81\x02')
+        assert delta._client.write_coils.call_args.args[1] == bits
+
+    def test_delta_parse_address_table(self, delta):
+        """Test address parsing via the area table, octal X/Y and caching."""
+        info = delta._parse_address("y17")
+
+        assert info['modbus_addr'] == 0x0500 + 0o17
+        assert info['is_bit'] and info['type'] == 'BOOL'
+        assert delta._parse_address("y17") is info
+        assert delta._parse_address("D100")['modbus_addr'] == 0x1000 + 100
+        with pytest.raises(ValueError):
+            delta._parse_address("X8")
+        with pytest.raises(ValueError):
+            delta._parse_address("Q1")
+
+    def test_delta_large_register_read_is_chunked(self, delta):
+        """Test reads above the Modbus limit are split into 125-register requests."""
+        def read(start, count, slave):
+            return MagicMock(registers=list(range(start, start + count)),
+                             **{"isError.return_value": False})
+
+        delta._client.read_holding_registers.side_effect = read
+
+        data = delta.read_memory(MemoryArea.DATA, 0, 300)
+
+        counts = [c.args[1] for c in delta._client.read_holding_registers.call_args_list]
+        assert counts == [125, 125, 50]
+        assert len(data) == 600
+        assert data[-2:] == (0x1000 + 299).to_bytes(2, 'big')
+
+    def test_delta_mode_cached_until_start(self, delta):
+        """Test get_mode reuses a recent read and start() invalidates it."""
+        delta._d9046_enabled = True
+        delta._client.read_holding_registers.return_value = MagicMock(
+            registers=[0], **{"isError.return_value": False}
+        )
+        delta._client.write_register.return_value.isError.return_value = False
+
+        assert delta.get_mode() == PLCMode.STOP
+        assert delta.get_diagnostics()['mode'] == PLCMode.STOP.value
+        delta._client.read_holding_registers.assert_called_once()
+
+        delta._client.read_holding_registers.return_value.registers = [1]
+        assert delta.start()
+        assert delta.get_mode() == PLCMode.RUN
+
+    def test_delta_large_coil_write_is_chunked(self, delta):
+        """Test packed coil writes are unpacked and split at 1968 coils."""
+        delta._client.write_coils.return_value.isError.return_value = False
+
+        assert delta.write_memory(MemoryArea.MEMORY, 0, b'\x01' * 250)
+
+        calls = delta._client.write_coils.call_args_list
+        assert [len(c.args[1]) for c in calls] == [1968, 32]
+        assert [c.args[0] for c in calls] == [0x0800, 0x0800 + 1968]
+        assert calls[1].args[1][:9] == [True] + [False] * 7 + [True]
+
+    def test_delta_d9046_is_opt_in(self, delta):
+        """Test run/stop and mode make no requests unless D9046 is enabled."""
+        assert delta.get_mode() == PLCMode.UNKNOWN
+        assert not delta.start()
+        delta._client.read_holding_registers.assert_not_called()
+        delta._client.write_register.assert_not_called()
+
+
+class TestMitsubishiFraming:
+    """Tests for Mitsubishi MC Protocol 3E framing."""
+
+    @pytest.fixture
+    def driver(self):
+        from plcforge.drivers.mitsubishi import MitsubishiMCDriver
+
+        return MitsubishiMCDriver()
+
+    def test_build_frame_layout(self, driver):
+        """Test the 3E request header is packed in one call."""
+        frame = driver._build_frame(0x0401, 0x0000, b'\xAA\xBB')
+
+        assert frame == bytes.fromhex('0050 00 ff ff03 00 0800 1000 0104 0000 aabb'.replace(' ', ''))
+
+    def test_parse_response(self, driver):
+        """Test response data is sliced by the header data length."""
+        response = bytes.fromhex('d000 00 ff ff03 00 0600 0000 3412 7856'.replace(' ', ''))
+
+        assert driver._parse_response(response) == (0, b'\x34\x12\x78\x56')
+
+    def test_parse_response_error_code(self, driver):
+        """Test a non-zero end code raises."""
+        response = bytes.fromhex('d000 00 ff ff03 00 0200 5bc0'.replace(' ', ''))
+
+        with pytest.raises(ValueError, match="0xC05B"):
+            driver._parse_response(response)
+
+    def test_send_receive_reassembles_partial_reads(self, driver):
+        """Test a response split across TCP reads is read to its full length."""
+        response = bytes.fromhex('d000 00 ff ff03 00 0600 0000 3412 7856'.replace(' ', ''))
+        chunks = iter([response[:4], response[4:9], response[9:12], response[12:]])
+
+        def recv_into(view):
+            chunk = next(chunks)
+            view[:len(chunk)] = chunk
+            return len(chunk)
+
+        sock = MagicMock(**{"recv_into.side_effect": recv_into})
+        driver._socket = sock
+        driver._connected = True
+
+        data = driver._send_receive(0x0401, 0x0000, b'')
+
+        assert data == b'\x34\x12\x78\x56'
+        assert data.obj is driver._rx_view.obj
+        sock.sendall.assert_called_once()
+
+    def test_send_receive_connection_closed(self, driver):
+        """Test an empty read marks the driver disconnected."""
+        driver._socket = MagicMock(**{"recv_into.return_value": 0})
+        driver._connected = True
+
+        with pytest.raises(ConnectionError):
+            driver._send_receive(0x0401, 0x0000, b'')
+        assert not driver.is_connected()
+
+    def test_connect_disables_nagle(self, driver):
+        """Test the MC socket is created with TCP_NODELAY and keepalive."""
+        import socket
+        from plcforge.drivers.mitsubishi import mc_protocol
+
+        with patch.object(mc_protocol.socket, "socket") as sock_cls, \
+                patch.object(mc_protocol, "_SESSION_POOL", {}), \
+                patch.object(driver, "_read_cpu_model"):
+            assert driver.connect("10.0.0.9")
+
+        sock_cls.return_value.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+        sock_cls.return_value.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+        )
+
+    def test_connect_reads_cpu_model(self, driver):
+        """Test connect succeeds and reports the CPU model from the PLC."""
+        from plcforge.drivers.mitsubishi import mc_protocol
+
+        model = b'Q03UDVCPU'.ljust(16, b' ')
+        response = bytes.fromhex('d00000ffff0300') + (20).to_bytes(2, 'little') \
+            + b'\x00\x00' + model + b'\x66\x02'
+
+        def recv_into(view):
+            view[:len(response)] = response
+            return len(response)
+
+        with patch.object(mc_protocol.socket, "socket") as sock_cls, \
+                patch.object(mc_protocol, "_SESSION_POOL", {}):
+            sock_cls.return_value.recv_into.side_effect = recv_into
+            assert driver.connect("10.0.0.9"), driver._last_error
+
+            info = driver.get_device_info()
+            assert info.vendor == "Mitsubishi"
+            assert info.model.strip() == "Q03UDVCPU"
+            driver.disconnect()
+
+    def test_failed_connect_releases_session(self, driver):
+        """Test a connect that fails after pooling the socket releases it."""
+        from plcforge.drivers.mitsubishi import mc_protocol
+
+        with patch.object(mc_protocol.socket, "socket") as sock_cls, \
+                patch.object(mc_protocol, "_SESSION_POOL", {}) as pool, \
+                patch.object(driver, "_read_cpu_model", side_effect=RuntimeError("boom")):
+            assert not driver.connect("10.0.0.9")
+
+            assert pool == {}
+            assert driver._socket is None
+            sock_cls.return_value.close.assert_called_once()
+
+    def test_mitsubishi_scattered_tags_use_random_read(self):
+        """Test scattered points across devices share one random read."""
+        import struct
+        from plcforge.drivers.mitsubishi import MitsubishiMCDriver
+
+        driver = MitsubishiMCDriver()
+        with patch.object(
+            driver, "_send_receive", return_value=struct.pack('<3H', 7, 9, 0b1)
+        ) as send:
+            tags = driver.read_tags(["D0", "X2", "D500"])
+
+        send.assert_called_once()
+        command, _, data = send.call_args.args
+        assert command == driver.CMD_RANDOM_READ
+        assert data[:2] == b'\x03\x00' and len(data) == 2 + 3 * 4
+        assert [t.value for t in tags] == [7, 1, 9]
+
+    def test_mitsubishi_write_tags_random_write(self):
+        """Test word and bit tags are written with one random write each."""
+        from plcforge.drivers.mitsubishi import MitsubishiMCDriver
+
+        driver = MitsubishiMCDriver()
+        with patch.object(driver, "_send_receive", return_value=b'') as send:
+            assert driver.write_tags({"D1": 5, "D9": 6, "M3": True})
+
+        calls = [c.args for c in send.call_args_list]
+        assert [(cmd, sub) for cmd, sub, _ in calls] == [(0x1402, 0x0000), (0x1402, 0x0001)]
+        assert calls[0][2][:2] == b'\x02\x00'
+        assert calls[1][2] == b'\x01' + driver._device_spec(0x90, 3) + b'\x01'
+
+    def test_mitsubishi_resolve_tag_cached(self, driver):
+        """Test tags resolve to (device_code, address, is_bit) once."""
+        assert driver._resolve_tag("d100") == (0xA8, 100, False)
+        assert driver._resolve_tag("M7") == (0x90, 7, True)
+        assert driver._resolve_tag("TN3") == (0xC2, 3, False)
+        hits = driver._resolve_tag.cache_info().hits
+        driver._resolve_tag("M7")
+        assert driver._resolve_tag.cache_info().hits == hits + 1
+        with pytest.raises(ValueError):
+            driver._resolve_tag("Q5")
+        with pytest.raises(ValueError):
+            driver._resolve_tag("D")
+
+    def test_parse_response_returns_view(self, driver):
+        """Test response data is returned as a view into the frame."""
+        response = bytearray.fromhex('d000 00 ff ff03 00 0400 0000 3412'.replace(' ', ''))
+
+        _, data = driver._parse_response(response)
+        response[11] = 0x99
+
+        assert isinstance(data, memoryview)
+        assert data[0] == 0x99
+
+    def test_send_receive_single_recv_for_whole_frame(self, driver):
+        """Test a response that arrives at once costs one recv_into call."""
+        response = bytes.fromhex('d000 00 ff ff03 00 0400 0000 3412'.replace(' ', ''))
+
+        def recv_into(view):
+            view[:len(response)] = response
+            return len(response)
+
+        driver._socket = MagicMock(**{"recv_into.side_effect": recv_into})
+        driver._connected = True
+
+        assert driver._send_receive(0x0401, 0x0000, b'') == b'\x34\x12'
+        driver._socket.recv_into.assert_called_once()
+
+    def test_drivers_share_session_socket(self):
+        """Test drivers for one PLC share a socket until the last disconnects."""
+        from plcforge.drivers.mitsubishi import mc_protocol
+
+        with patch.object(mc_protocol.socket, "socket") as sock_cls, \
+                patch.object(mc_protocol, "_SESSION_POOL", {}), \
+                patch.object(mc_protocol.MitsubishiMCDriver, "_read_cpu_model"):
+            first = mc_protocol.MitsubishiMCDriver()
+            second = mc_protocol.MitsubishiMCDriver()
+            assert first.connect("10.0.0.9")
+            assert second.connect("10.0.0.9")
+
+            sock_cls.assert_called_once()
+            assert first._lock is second._lock
+
+            first.disconnect()
+            sock_cls.return_value.close.assert_not_called()
+            second.disconnect()
+            sock_cls.return_value.close.assert_called_once()
+
+    def test_failed_session_removed_from_pool(self):
+        """Test a socket error evicts the shared session for every driver."""
+        from plcforge.drivers.mitsubishi import mc_protocol
+
+        with patch.object(mc_protocol.socket, "socket") as sock_cls, \
+                patch.object(mc_protocol, "_SESSION_POOL", {}) as pool, \
+                patch.object(mc_protocol.MitsubishiMCDriver, "_read_cpu_model"):
+            first = mc_protocol.MitsubishiMCDriver()
+            second = mc_protocol.MitsubishiMCDriver()
+            assert first.connect("10.0.0.9")
+            assert second.connect("10.0.0.9")
+
+            sock_cls.return_value.recv_into.side_effect = TimeoutError()
+            with pytest.raises(OSError):
+                first._send_receive(0x0401, 0x0000, b'')
+
+            assert pool == {}
+            assert not first.is_connected()
+            sock_cls.return_value.close.assert_called()
+
+            # The next connect opens a fresh socket instead of the dead one
+            third = mc_protocol.MitsubishiMCDriver()
+            assert third.connect("10.0.0.9")
+            assert sock_cls.call_count == 2
+
+    def test_write_requests_packed_in_one_call(self, driver):
+        """Test write requests keep the code + 3-byte address + points layout."""
+        with patch.object(driver, "_send_receive", return_value=b'') as send:
+            assert driver.write_tag("D70000", 0x1234)
+            assert driver.write_tag("M5", True)
+            assert driver.write_memory(MemoryArea.DATA, 0x010203, b'\x01\x00\x02\x00')
+
+        payloads = [c.args[2] for c in send.call_args_list]
+        assert payloads[0] == bytes([0xA8, 0x70, 0x11, 0x01, 0x01, 0x00, 0x34, 0x12])
+        assert payloads[1] == bytes([0x90, 0x05, 0x00, 0x00, 0x01, 0x00, 0x01])
+        assert payloads[2] == bytes([0xA8, 0x03, 0x02, 0x01, 0x02, 0x00, 1, 0, 2, 0])
+
+    def test_get_mode_reads_cpu_status(self, driver):
+        """Test get_mode reads SD203 and maps the status nibble."""
+        with patch.object(driver, "_send_receive", return_value=b'\x02\x00') as send:
+            assert driver.get_mode() == PLCMode.STOP
+
+        command, _, data = send.call_args.args
+        assert command == driver.CMD_BATCH_READ
+        assert data == bytes([0xA9, 203, 0, 0, 1, 0])
+
+        for status, mode in ((0, PLCMode.RUN), (1, PLCMode.RUN), (3, PLCMode.STOP)):
+            with patch.object(driver, "_send_receive", return_value=bytes([status, 0xF0])):
+                assert driver.get_mode() == mode
+
+        with patch.object(driver, "_send_receive", side_effect=ConnectionError("down")):
+            assert driver.get_mode() == PLCMode.UNKNOWN
+
+    def test_start_stop_use_remote_commands(self, driver):
+        """Test start/stop issue remote RUN/STOP."""
+        with patch.object(driver, "_send_receive", return_value=b'') as send:
+            assert driver.set_mode(PLCMode.RUN)
+            assert driver.stop()
+
+        assert [c.args[0] for c in send.call_args_list] == [0x1001, 0x1002]
+
+
+class TestOmronFINS:
+    """Tests for the Omron FINS driver and client."""
+
+    @pytest.fixture
+    def driver(self):
+        from plcforge.drivers.omron.fins_driver import OmronFINSDriver
+
+        driver = OmronFINSDriver()
+        driver._client = MagicMock()
+        driver._connected = True
+        return driver
+
+    def test_read_tags_coalesces_runs(self, driver):
+        """Test neighbouring words and bits share one memory area read."""
+        import struct
+
+        driver._client.memory_area_read.return_value = struct.pack('>4H', 1, 2, 0b100, 4)
+
+        tags = driver.read_tags(["D3", "D0", "D2.02", "D1"])
+
+        driver._client.memory_area_read.assert_called_once_with(0x82, 0, 4)
+        assert [t.value for t in tags] == [4, 1, True, 2]
+        assert tags[2].data_type == 'BOOL'
+
+    def test_read_tags_splits_areas_and_distant_words(self, driver):
+        """Test long runs get area reads and scattered words share a multiple read."""
+        import struct
+
+        driver._client.send_batch.return_value = [
+            (0, struct.pack('>4H', 10, 11, 12, 13)),
+            (0, b'\x82\x00\x07\x82\x00\x08\xb1\x00\x0a'),
+        ]
+
+        tags = driver.read_tags(["D0", "D500", "W0.03", "Q1", "D103", "D100"])
+
+        commands = driver._client.send_batch.call_args.args[0]
+        assert commands == [
+            (0x0101, b'\x82\x00\x64\x00\x00\x04'),
+            (0x0104, b'\x82\x00\x00\x00\x82\x01\xf4\x00\xb1\x00\x00\x00'),
+        ]
+        driver._client.memory_area_read.assert_not_called()
+        assert [t.value for t in tags] == [7, 8, True, None, 13, 10]
+        assert [t.quality for t in tags] == ["good", "good", "good", "bad", "good", "good"]
+
+    def test_client_multiple_read(self):
+        """Test Multiple Memory Area Read request and response layout."""
+        from plcforge.drivers.omron.fins_driver import FINSClient, FINSError
+
+        client = FINSClient("10.0.0.2")
+        client._send_command = MagicMock(return_value=(0, memoryview(b'\x82\x12\x34\xb0\x00\x01')))
+
+        assert client.memory_area_read_multiple([(0x82, 5), (0xB0, 0x102)]) == [0x1234, 1]
+        client._send_command.assert_called_once_with(
+            0x0104, b'\x82\x00\x05\x00\xb0\x01\x02\x00'
+        )
+
+        with pytest.raises(FINSError):
+            client.memory_area_read_multiple([(0x82, 5), (0xB0, 0x102), (0x82, 6)])
+
+    def test_read_words_decodes_block(self, driver):
+        """Test a word block is decoded into a uint16 array."""
+        import struct
+
+        from plcforge.drivers.base import MemoryArea
+
+        driver._client.memory_area_read.return_value = memoryview(
+            struct.pack('>3H', 1, 0x1234, 0xFFFF)
+        )
+
+        words = driver.read_words(MemoryArea.DATA, 100, 3)
+
+        driver._client.memory_area_read.assert_called_once_with(0x82, 100, 3)
+        assert words.typecode == 'H'
+        assert list(words) == [1, 0x1234, 0xFFFF]
+
+    def test_memory_area_table(self, driver):
+        """Test memory areas index the FINS area table directly."""
+        from plcforge.drivers.base import MemoryArea
+
+        driver._client.memory_area_write.return_value = True
+
+        assert driver.write_memory(MemoryArea.MEMORY, 5, b'\x00\x01')
+        driver._client.memory_area_write.assert_called_once_with(0xB1, 5, b'\x00\x01')
+
+        assert not driver.write_memory(MemoryArea.SPECIAL, 0, b'\x00\x01')
+        with pytest.raises(ValueError):
+            driver.read_memory(MemoryArea.SPECIAL, 0, 1)
+
+    def test_batch_shares_timestamp(self, driver):
+        """Test reads inside batch() share one timestamp."""
+        driver._client.memory_area_read.return_value = b'\x00\x01'
+
+        with driver.batch():
+            first = driver.read_tag("D0")
+            time.sleep(0.001)
+            second, = driver.read_tags(["D1"])
+        third = driver.read_tag("D2")
+
+        assert first.timestamp_ns == second.timestamp_ns
+        assert third.timestamp_ns > first.timestamp_ns
+        assert driver._batch_ts_ns is None
+
+    def test_parse_address_regex(self, driver):
+        """Test address parsing by area prefix, cached and read-only."""
+        info = driver._parse_address("cio10.05")
+        assert (info['area'], info['fins_area'], info['address']) == ('CIO', 0xB0, 10)
+        assert (info['bit'], info['type']) == (5, 'BOOL')
+        assert driver._parse_address("cio10.05") is info
+        assert driver._parse_address("C12")['area'] == 'C'
+        with pytest.raises(TypeError):
+            info['bit'] = 1
+        with pytest.raises(ValueError):
+            driver._parse_address("DX1")
+
+    def test_write_bits_one_rmw_per_word(self, driver):
+        """Test bits of the same word share one read and one write."""
+        driver._client.memory_area_read.return_value = b'\x00\x0f'
+        driver._client.memory_area_write.return_value = True
+
+        assert driver.write_bits({"D10.00": False, "D10.08": True, "D10.01": False, "W2.03": True})
+
+        assert driver._client.memory_area_read.call_count == 2
+        driver._client.memory_area_write.assert_any_call(0x82, 10, b'\x01\x0c')
+        driver._client.memory_area_write.assert_any_call(0xB1, 2, b'\x00\x0f')
+
+        assert not driver.write_bits({"D10": True})
+        assert "Not a bit address" in driver.last_error
+
+        assert not driver.write_bits({"D0.16": True})
+        assert "out of range" in driver.last_error
+        assert not driver.write_tag("D0.16", True)
+        with pytest.raises(ValueError, match="out of range"):
+            driver.read_tag("D0.16")
+        tags = driver.read_tags(["D0.16"])
+        assert tags[0].quality == "bad"
+
+    def test_client_frames(self):
+        """Test header and memory area read request layout."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._set_nodes(1, 1)
+        response = bytes(9) + b'\x01' + bytes(2) + b'\x00\x00' + b'\x12\x34'
+
+        def recv_into(buffer):
+            buffer[:len(response)] = response
+            return len(response)
+
+        client.sock = MagicMock(**{"recv_into.side_effect": recv_into})
+
+        data = client.memory_area_read(0x82, 0x0102, 3)
+
+        assert data == b'\x12\x34'
+        assert data.obj is client._rx_buf
+
+        packet = client.sock.send.call_args.args[0]
+        assert packet.obj is client._tx_buf
+        assert packet == bytes([
+            0x80, 0, 2, 0, 1, 0, 0, 1, 0, 1, 0x01, 0x01,
+            0x82, 0x01, 0x02, 0x00, 0x00, 0x03,
+        ])
+
+    def test_client_send_batch_matches_sid(self):
+        """Test batched responses are matched back to commands by SID."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        responses = [
+            bytes(9) + b'\x02' + bytes(2) + b'\x00\x00\xbb\xbb',
+            bytes(9) + b'\x07' + bytes(2) + b'\x00\x00',  # stale SID
+            bytes(9) + b'\x01' + bytes(2) + b'\x00\x00\xaa\xaa',
+        ]
+
+        def recv_into(buffer):
+            response = responses.pop(0)
+            buffer[:len(response)] = response
+            return len(response)
+
+        client.sock = MagicMock(**{"recv_into.side_effect": recv_into})
+
+        results = client.send_batch([(0x0101, b'\x01'), (0x0101, b'\x02')])
+
+        assert client.sock.send.call_count == 2
+        assert results == [(0, b'\xaa\xaa'), (0, b'\xbb\xbb')]
+
+    def test_client_transact_skips_stale_sid(self):
+        """Test a late response to an earlier command is not taken as the reply."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client.sid = 4
+        responses = [
+            bytes(9) + b'\x03' + bytes(2) + b'\x00\x00\xde\xad',  # stale SID
+            bytes(9) + b'\x05' + bytes(2) + b'\x00\x00\x12\x34',
+        ]
+
+        def recv_into(buffer):
+            response = responses.pop(0)
+            buffer[:len(response)] = response
+            return len(response)
+
+        client.sock = MagicMock(**{"recv_into.side_effect": recv_into})
+
+        assert client.memory_area_read(0x82, 0, 1) == b'\x12\x34'
+        assert not responses
+
+    def test_client_read_into_buffer(self):
+        """Test a memory area read is copied into the caller's buffer."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._transact = MagicMock(return_value=(0, memoryview(b'\x12\x34\x56\x78')))
+        out = bytearray(8)
+
+        assert client.memory_area_read_into(0x82, 0, 2, memoryview(out)[2:]) == 4
+        assert out == b'\x00\x00\x12\x34\x56\x78\x00\x00'
+
+        with pytest.raises(ValueError):
+            client.memory_area_read_into(0x82, 0, 2, bytearray(2))
+
+    def test_client_write_frame(self):
+        """Test memory area write packs header, request and data in place."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._set_nodes(1, 1)
+        response = bytes(9) + b'\x01' + bytes(2) + b'\x00\x00'
+
+        def recv_into(buffer):
+            buffer[:len(response)] = response
+            return len(response)
+
+        client.sock = MagicMock(**{"recv_into.side_effect": recv_into})
+
+        assert client.memory_area_write(0x82, 10, b'\x12\x34\x56\x78')
+
+        packet = client.sock.send.call_args.args[0]
+        assert packet == bytes([
+            0x80, 0, 2, 0, 1, 0, 0, 1, 0, 1, 0x01, 0x02,
+            0x82, 0x00, 0x0A, 0x00, 0x00, 0x02, 0x12, 0x34, 0x56, 0x78,
+        ])
+
+    def test_client_connects_udp_socket(self):
+        """Test connect() opens a non-blocking socket bound to the PLC address."""
+        import selectors
+        import socket
+        from unittest.mock import call
+
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2", 9601)
+        with patch("socket.socket") as socket_cls, patch("selectors.DefaultSelector") as selector_cls:
+            assert client.connect()
+
+        sock = socket_cls.return_value
+        sock.setblocking.assert_called_once_with(False)
+        sock.settimeout.assert_not_called()
+        sock.connect.assert_called_once_with(("10.0.0.2", 9601))
+        selector_cls.return_value.register.assert_called_once_with(sock, selectors.EVENT_READ)
+        assert sock.setsockopt.call_args_list == [
+            call(socket.SOL_SOCKET, socket.SO_RCVBUF, FINSClient.RCVBUF_SIZE),
+            call(socket.SOL_SOCKET, socket.SO_SNDBUF, FINSClient.SNDBUF_SIZE),
+        ]
+
+    def test_fins_errors_are_narrow(self, driver):
+        """Test FINS end codes raise FINSError and only FINS failures are absorbed."""
+        from plcforge.drivers.base import PLCMode
+        from plcforge.drivers.omron import FINSError
+        from plcforge.drivers.omron.fins_driver import FINSClient, OmronFINSDriver
+
+        client = FINSClient("10.0.0.2")
+        client._transact = MagicMock(return_value=(0x1103, memoryview(b'')))
+        with pytest.raises(FINSError) as excinfo:
+            client.memory_area_read(0x82, 0, 1)
+        assert excinfo.value.end_code == 0x1103
+
+        driver._client.run.side_effect = TimeoutError("timed out")
+        assert not driver.start()
+        assert driver.last_error == "timed out"
+
+        driver._client.stop.side_effect = RuntimeError("bug")
+        with pytest.raises(RuntimeError):
+            driver.stop()
+
+        assert OmronFINSDriver().get_mode() is PLCMode.UNKNOWN
+
+    def test_client_fixed_command_frames(self):
+        """Test fixed commands reuse the header and only change the SID."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._set_nodes(1, 1)
+        client._transact = MagicMock(return_value=(0, memoryview(b'')))
+
+        assert client.run()
+        assert client._tx_buf[:14] == bytes([0x80, 0, 2, 0, 1, 0, 0, 1, 0, 1, 0x04, 0x01, 0x04, 0x01])
+        client._transact.assert_called_with(14)
+
+        assert client.stop()
+        assert client._tx_buf[9:12] == bytes([2, 0x04, 0x02])
+        client._transact.assert_called_with(12)
+
+    def test_client_waits_for_response_with_selector(self):
+        """Test a non-blocking receive waits on the selector and times out."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2", timeout=0.25)
+        client.sock = MagicMock(**{"recv_into.side_effect": [BlockingIOError, 16, BlockingIOError]})
+        client._selector = MagicMock(**{"select.side_effect": [[object()], []]})
+
+        assert client._recv() == 16
+        client._selector.select.assert_called_with(0.25)
+        with pytest.raises(TimeoutError):
+            client._recv()
+
+    def test_client_status_mode_table(self):
+        """Test the status byte maps straight to a PLC mode."""
+        from plcforge.drivers.base import PLCMode
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._transact = MagicMock(return_value=(0, b'\x03\x00'))
+        assert client.controller_mode() is PLCMode.RUN
+        assert client.controller_status_read()['mode'] == 'run'
+
+        client._transact.return_value = (0, b'\x42\x00')
+        assert client.controller_mode() is PLCMode.PROGRAM
+        assert client.controller_status_read()['fatal_error']
+
+        client._transact.return_value = (0, b'\x80\x00')
+        assert client.controller_mode() is PLCMode.STOP
+
+        client._transact.return_value = (0x0401, b'')
+        assert client.controller_mode() is PLCMode.UNKNOWN
+
+    def test_client_grows_transmit_buffer(self):
+        """Test a frame larger than the buffer replaces it."""
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        client = FINSClient("10.0.0.2")
+        client._set_nodes(1, 2)
+        packet = client._build_header(0x0102, bytes(5000))
+
+        assert len(packet) == 12 + 5000
+        assert len(client._tx_buf) == 12 + 5000
+        assert packet[:12] == bytes([0x80, 0, 2, 0, 2, 0, 0, 1, 0, 1, 0x01, 0x02])
+
+    def test_async_client_matches_responses_by_sid(self):
+        """Test concurrent commands resolve from out-of-order responses."""
+        import asyncio
+        from plcforge.drivers.omron.fins_driver import AsyncFINSClient
+
+        async def scenario():
+            client = AsyncFINSClient("10.0.0.2")
+            client.loop = asyncio.get_running_loop()
+            client._transport = MagicMock()
+
+            first = asyncio.ensure_future(client.memory_area_read(0x82, 0, 1))
+            second = asyncio.ensure_future(client.memory_area_read(0x82, 100, 1))
+            await asyncio.sleep(0)
+
+            sids = [call.args[0][9] for call in client._transport.sendto.call_args_list]
+            client._on_response(bytes(9) + bytes([sids[1]]) + bytes(4) + b'\x00\x02')
+            client._on_response(bytes(9) + bytes([sids[0]]) + bytes(4) + b'\x00\x01')
+            return await asyncio.gather(first, second), client._pending
+
+        (first, second), pending = asyncio.run(scenario())
+
+        assert (first, second) == (b'\x00\x01', b'\x00\x02')
+        assert pending == {}
+
+    def test_read_tags_async_sends_runs_concurrently(self, driver):
+        """Test each planned run becomes one concurrent async read."""
+        import asyncio
+
+        async def scenario():
+            client = MagicMock(loop=asyncio.get_running_loop())
+
+            async def read(area, start, count):
+                return bytes(range(count * 2))
+
+            client.memory_area_read.side_effect = read
+            driver._async_client = client
+            return await driver.read_tags_async(["D0", "D1", "W10"]), client
+
+        tags, client = asyncio.run(scenario())
+
+        assert client.memory_area_read.call_count == 2
+        assert [t.value for t in tags] == [0x0001, 0x0203, 0x0001]
+
+    def test_connection_pool_reuses_released_clients(self):
+        """Test a reconnect takes the released client instead of a new socket."""
+        from plcforge.drivers.omron import FINSConnectionPool, OmronFINSDriver
+        from plcforge.drivers.omron.fins_driver import FINSClient
+
+        pool = FINSConnectionPool(max_size=1)
+        driver = OmronFINSDriver()
+
+        with patch.object(FINSClient, "connect", return_value=True) as connect, \
+                patch.object(FINSClient, "controller_data_read", return_value={}):
+            assert driver.connect("10.0.0.2", pool=pool)
+            first = driver._client
+            driver.disconnect()
+            assert driver.connect("10.0.0.2", pool=pool)
+
+        assert driver._client is first
+        connect.assert_called_once()
+        assert len(pool) == 0
+
+    def test_connection_pool_close_idle(self):
+        """Test idle clients past the TTL are closed and dropped."""
+        from plcforge.drivers.omron import FINSConnectionPool
+
+        pool = FINSConnectionPool()
+        client = MagicMock(host="10.0.0.2", port=9600)
+        pool.release(client)
+
+        assert pool.close_idle(ttl=3600) == 0
+        assert pool.close_idle(ttl=-1) == 1
+        client.close.assert_called_once()
+        assert len(pool) == 0
+
+
+class TestSchneiderModbus:
+    """Tests for the Schneider Modbus driver."""
+
+    @pytest.fixture
+    def driver(self):
+        from plcforge.drivers.schneider import modbus_driver
+
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True):
+            driver = modbus_driver.SchneiderModbusDriver()
+        driver._client = MagicMock()
+        driver._connected = True
+        return driver
+
+    def test_read_tags_coalesces_registers(self, driver):
+        """Test words, double words and floats share one holding register read."""
+        import struct
+
+        registers = [0] * 8
+        registers[0] = 7                                            # %MW0
+        registers[2:4] = struct.unpack('>HH', struct.pack('>i', -5))  # %MD1
+        registers[6:8] = struct.unpack('>HH', struct.pack('>f', 1.5))  # %MF3
+        driver._client.read_holding_registers.return_value = MagicMock(
+            registers=registers, **{"isError.return_value": False}
+        )
+
+        tags = driver.read_tags(["%MF3", "%MW0", "%MD1", "%XY1"])
+
+        driver._client.read_holding_registers.assert_called_once_with(
+            address=0, count=8, slave=1
+        )
+        assert [t.value for t in tags] == [1.5, 7, -5, None]
+        assert [t.data_type for t in tags] == ["REAL", "WORD", "DINT", "Unknown"]
+        assert tags[3].quality == "bad"
+
+    def test_read_tags_splits_memory_types(self, driver):
+        """Test coils and input registers are read with their own requests."""
+        driver._client.read_coils.return_value = MagicMock(
+            bits=[True, False, True], **{"isError.return_value": False}
+        )
+        driver._client.read_input_registers.return_value = MagicMock(
+            **{"isError.return_value": True}
+        )
+
+        tags = driver.read_tags(["%M1.2", "%M12", "%IW4"])
+
+        driver._client.read_coils.assert_called_once_with(address=10, count=3, slave=1)
+        assert [t.value for t in tags] == [True, True, None]
+        assert tags[2].quality == "bad"
+
+    def test_read_memory_registers(self, driver):
+        """Test holding registers are serialized big-endian and trimmed to length."""
+        from plcforge.drivers.base import MemoryArea
+
+        driver._client.read_holding_registers.return_value = MagicMock(
+            registers=[0x1234, 0xABCD], **{"isError.return_value": False}
+        )
+
+        assert driver.read_memory(MemoryArea.MEMORY, 10, 3) == b'\x12\x34\xab'
+        driver._client.read_holding_registers.assert_called_once_with(
+            address=10, count=2, slave=1
+        )
+
+    def test_read_memory_packs_bits(self, driver):
+        """Test coils are packed LSB first, 8 per byte."""
+        from plcforge.drivers.base import MemoryArea
+
+        bits = [True, False, False, False, False, False, False, True, False, True]
+        driver._client.read_coils.return_value = MagicMock(
+            bits=bits + [False] * 6, **{"isError.return_value": False}
+        )
+
+        assert driver.read_memory(MemoryArea.OUTPUT, 0, 2) == b'\x81\x02'
+
+    def test_parse_address(self, driver):
+        """Test longest prefix wins and malformed addresses are rejected."""
+        assert driver._parse_address("%mw100") == ("%MW", 100, None)
+        assert driver._parse_address(" %M10.5 ") == ("%M", 10, 5)
+        assert driver._parse_address("%I0.3") == ("%I", 0, 3)
+        for bad in ("%MW", "%X1", "%MW1x"):
+            with pytest.raises(ValueError):
+                driver._parse_address(bad)
+
+    def test_double_word_and_float_round_trip(self, driver):
+        """Test %MD/%MF tags are encoded and decoded as big-endian register pairs."""
+        ok = MagicMock(**{"isError.return_value": False})
+        driver._client.write_registers.return_value = ok
+
+        assert driver.write_tag("%MD3", -2)
+        driver._client.write_registers.assert_called_with(
+            address=6, values=[0xFFFF, 0xFFFE], slave=1
+        )
+        assert driver.write_tag("%MF0", 1.5)
+        driver._client.write_registers.assert_called_with(
+            address=0, values=[0x3FC0, 0x0000], slave=1
+        )
+
+        ok.registers = [0x3FC0, 0x0000]
+        driver._client.read_holding_registers.return_value = ok
+        assert driver.read_tag("%MF0").value == 1.5
+        ok.registers = [0xFFFF, 0xFFFE]
+        tag = driver.read_tag("%MD3")
+        assert (tag.value, tag.data_type) == (-2, "DINT")
+
+    def test_read_tags_async(self, driver):
+        """Test async reads plan runs like read_tags and reuse one async client."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from plcforge.drivers.schneider import modbus_driver
+
+        client = MagicMock()
+        client.connect = AsyncMock(return_value=True)
+        client.read_holding_registers = AsyncMock(return_value=MagicMock(
+            registers=[5, 0, 6], **{"isError.return_value": False}
+        ))
+
+        async def scan():
+            first = await driver.read_tags_async(["%MW0", "%MW2"])
+            second = await driver.read_tag_async("%MW2")
+            return first, second
+
+        with patch.object(
+            modbus_driver, "AsyncModbusTcpClient", return_value=client, create=True
+        ) as factory:
+            first, second = asyncio.run(scan())
+
+        factory.assert_called_once()
+        assert client.read_holding_registers.await_args_list[0].kwargs == {
+            "address": 0, "count": 3, "slave": 1
+        }
+        assert [t.value for t in first] == [5, 6]
+        assert second.value == 5
+
+    def test_connect_disables_nagle(self):
+        """Test the TCP socket is tuned for small request/response PDUs."""
+        import socket
+
+        from plcforge.drivers.schneider import modbus_driver
+
+        client = MagicMock()
+        client.connect.return_value = True
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True), \
+                patch.object(modbus_driver, "ModbusTcpClient", return_value=client, create=True):
+            driver = modbus_driver.SchneiderModbusDriver()
+            assert driver.connect("192.168.1.10")
+
+        client.socket.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client.socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def test_device_info_cached_and_fc43_probe_skipped(self, driver):
+        """Test identification is read once and not retried on unsupported servers."""
+        driver._client.read_device_information.return_value = MagicMock(
+            **{"isError.return_value": True}
+        )
+
+        info = driver.get_device_info()
+        assert driver.get_device_info() is info
+        assert (info.vendor, info.model) == ("Schneider Electric", "Modicon")
+
+        driver._device_info = None
+        driver.get_device_info()
+        driver._client.read_device_information.assert_called_once()
+
+    def test_tag_dispatch_by_memory_type(self, driver):
+        """Test bit tags go to coils and read-only types are rejected on write."""
+        ok = MagicMock(bits=[True], **{"isError.return_value": False})
+        driver._client.read_coils.return_value = ok
+        driver._client.write_coil.return_value = ok
+
+        tag = driver.read_tag("%Q2.3")
+        driver._client.read_coils.assert_called_once_with(address=19, count=1, slave=1)
+        assert (tag.value, tag.data_type) == (True, "BOOL")
+
+        assert driver.write_tag("%M7", 1)
+        driver._client.write_coil.assert_called_once_with(address=7, value=True, slave=1)
+        assert not driver.write_tag("%IW0", 5)
+        assert "Cannot write" in driver.last_error
+
+    def test_failed_connect_leaves_driver_unusable(self):
+        """Test a refused connection publishes no client and reads raise."""
+        from plcforge.drivers.schneider import modbus_driver
+
+        client = MagicMock()
+        client.connect.return_value = False
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True), \
+                patch.object(modbus_driver, "ModbusTcpClient", return_value=client, create=True):
+            driver = modbus_driver.SchneiderModbusDriver()
+            assert not driver.connect("192.168.1.10")
+
+        assert not hasattr(driver, "__dict__")
+        with pytest.raises(ConnectionError):
+            driver.read_tag("%MW0")
+
+    def test_read_tag_cache_ttl(self, driver):
+        """Test repeated reads within the TTL are served without a request."""
+        driver._cache_ttl = 60.0
+        driver._client.read_holding_registers.return_value = MagicMock(
+            registers=[42], **{"isError.return_value": False}
+        )
+        driver._client.write_register.return_value = MagicMock(
+            **{"isError.return_value": False}
+        )
+
+        first = driver.read_tag("%MW5")
+        assert driver.read_tag("%MW5") is first
+        assert driver._client.read_holding_registers.call_count == 1
+
+        driver.write_tag("%MW5", 43)
+        driver.read_tag("%MW5")
+        assert driver._client.read_holding_registers.call_count == 2
+
+    def test_exception_response_raises(self, driver):
+        """Test Modbus exception responses surface as ValueError with one message format."""
+        error = MagicMock(**{"isError.return_value": True, "__str__.return_value": "Exception 2"})
+        driver._client.read_input_registers.return_value = error
+
+        with pytest.raises(ValueError, match="Read error: Exception 2"):
+            driver.read_multiple_registers(0, 4, register_type="input")
+        with pytest.raises(ValueError, match="Read error: Exception 2"):
+            driver.read_tag("%IW3")
+
+    def test_write_memory_registers(self, driver):
+        """Test bytes become big-endian registers with an odd tail in the high byte."""
+        from plcforge.drivers.base import MemoryArea
+
+        driver._client.write_registers.return_value = MagicMock(
+            **{"isError.return_value": False}
+        )
+
+        assert driver.write_memory(MemoryArea.DATA, 4, b'\x12\x34\xab')
+        driver._client.write_registers.assert_called_once_with(
+            address=4, values=[0x1234, 0xAB00], slave=1
+        )
+
+    def test_reconnect_keeps_device_info(self):
+        """Test reconnect reopens the socket without another identification request."""
+        from plcforge.drivers.schneider import modbus_driver
+
+        client = MagicMock()
+        client.connect.return_value = True
+        with patch.object(modbus_driver, "PYMODBUS_AVAILABLE", True), \
+                patch.object(
+                    modbus_driver, "ModbusTcpClient", return_value=client, create=True
+                ) as factory:
+            driver = modbus_driver.SchneiderModbusDriver()
+            assert driver.connect("192.168.1.10", port=5020)
+            info = driver.get_device_info()
+            assert driver.reconnect()
+
+        assert factory.call_count == 2
+        factory.assert_called_with(host="192.168.1.10", port=5020, timeout=5.0)
+        client.read_device_information.assert_called_once()
+        assert driver.get_device_info() is info
+        assert driver.is_connected()
+
+    def test_read_multiple_registers_into(self, driver):
+        """Test registers are copied into a preallocated word buffer."""
+        from array import array
+
+        driver._client.read_input_registers.return_value = MagicMock(
+            registers=[1, 0xFFFF, 300], **{"isError.return_value": False}
+        )
+        out = array('H', [0] * 5)
+
+        assert driver.read_multiple_registers_into(10, 3, out, register_type="input") == 3
+        assert out.tolist() == [1, 0xFFFF, 300, 0, 0]
+
+        bytes_out = bytearray(6)
+        assert driver.read_multiple_registers_into(10, 3, bytes_out, register_type="input") == 3
+        assert array('H', bytes_out).tolist() == [1, 0xFFFF, 300]
+
+        with pytest.raises(ValueError, match="holds 2 registers"):
+            driver.read_multiple_registers_into(10, 3, array('H', [0, 0]), register_type="input")
+
+    def test_write_memory_unpacks_bits(self, driver):
+        """Test output bytes become coil states, LSB first."""
+        from plcforge.drivers.base import MemoryArea
+
+        driver._client.write_coils.return_value = MagicMock(
+            **{"isError.return_value": False}
+        )
+
+        assert driver.write_memory(MemoryArea.OUTPUT, 8, b'\x81\x02')
+        driver._client.write_coils.assert_called_once_with(
+            address=8,
+            values=[True] + [False] * 6 + [True, False, True] + [False] * 6,
+            slave=1,
+        )
+
+    def test_tag_location_resolution(self, driver):
+        """Test tag names map to Modbus addresses and repeat lookups hit the cache."""
+        from plcforge.drivers.schneider.modbus_driver import SchneiderMemoryType
+
+        assert driver._tag_location("%MW100") == (
+            SchneiderMemoryType.HOLDING_REGISTER, 100, "WORD"
+        )
+        assert driver._tag_location("%MD100") == (
+            SchneiderMemoryType.HOLDING_REGISTER, 200, "DINT"
+        )
+        assert driver._tag_location("%I2.3") == (SchneiderMemoryType.DISCRETE_INPUT, 19, "BOOL")
+        assert driver._tag_location("%M5") == (SchneiderMemoryType.COIL, 5, "BOOL")
+
+        hits = driver._tag_location.cache_info().hits
+        driver._tag_location("%MW100")
+        assert driver._tag_location.cache_info().hits == hits + 1